@@ -19,19 +19,30 @@ Notes
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+import os
 from pathlib import Path, PurePath
+import tempfile
 from typing import TYPE_CHECKING, TypeAlias
 import warnings
+import weakref
 
 import lazy_loader as lazy
 
 from .common import (
+    GV_FIELD_BOUNDS,
     GV_FIELD_NAME,
     GV_FIELD_RADIUS,
     GV_FIELD_ZSCALE,
+    POINTS_DTYPE,
     RADIUS,
     ZLEVEL_SCALE,
+    LRUCache,
+    as_cell_array,
     cast_UnstructuredGrid_to_PolyData,
+    fingerprint,
     nan_mask,
     to_cartesian,
     wrap,
@@ -40,23 +51,36 @@ from .crs import WGS84, CRSLike, to_wkt
 from .transform import transform_points
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from typing import Any
+
+    from affine import Affine
     import numpy as np
-    from numpy.typing import ArrayLike
+    from numpy.typing import ArrayLike, DTypeLike
     import pyvista as pv
+    from rasterio.io import DatasetReader
+    from rasterio.windows import Window
 
 # lazy import third-party dependencies
+dask = lazy.load("dask")
 np = lazy.load("numpy")
 pv = lazy.load("pyvista")
 pyproj = lazy.load("pyproj")
 rio = lazy.load("rasterio")
 
 __all__ = [
+    "BRIDGE_CACHE",
+    "BRIDGE_CACHE_NBYTES",
+    "BRIDGE_CACHE_SIZE",
     "BRIDGE_CLEAN",
+    "BRIDGE_WORKERS",
+    "CONNECTIVITY_CACHE",
     "NAME_CELLS",
     "NAME_POINTS",
     "PathLike",
     "RIO_SIEVE_SIZE",
     "Shape",
+    "TOPOLOGY_CACHE",
     "Transform",
 ]
 
@@ -68,9 +92,24 @@ Shape: TypeAlias = tuple[int]
 """Type alias for a tuple of integers."""
 
 # constants
+BRIDGE_CACHE: bool = False
+"""Whether the bridge caches the mesh topology for reuse."""
+
+BRIDGE_CACHE_NBYTES: int = 2**30
+"""The maximum total size, in bytes, of the cached bridge mesh topologies."""
+
+BRIDGE_CACHE_SIZE: int = 16
+"""The maximum number of cached bridge mesh topologies."""
+
 BRIDGE_CLEAN: bool = False
 """Whether mesh cleaning performed by the bridge."""
 
+BRIDGE_WORKERS: int | None = None
+"""The number of workers concurrently building a batch of meshes."""
+
+CONNECTIVITY_CACHE: LRUCache = LRUCache(BRIDGE_CACHE_SIZE, maxbytes=BRIDGE_CACHE_NBYTES)
+"""The least-recently-used cache of read-only face offsets and quad connectivity."""
+
 NAME_CELLS: str = "cell_data"
 """Default array name for data on the mesh cells."""
 
@@ -80,6 +119,192 @@ NAME_POINTS: str = "point_data"
 RIO_SIEVE_SIZE: int = 800
 """The default size of the :func:`rasterio.features.sieve` filter."""
 
+TOPOLOGY_CACHE: LRUCache = LRUCache(BRIDGE_CACHE_SIZE, maxbytes=BRIDGE_CACHE_NBYTES)
+"""The least-recently-used cache of bridge mesh topologies."""
+
+
+def _asanyarray(values: ArrayLike) -> ArrayLike:
+    """Convert the `values` to an array, unless they are a lazy dask collection.
+
+    Parameters
+    ----------
+    values : ArrayLike
+        The values to be converted.
+
+    Returns
+    -------
+    ArrayLike
+        The `values` as an array, or the original lazy dask collection.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    return values if _is_lazy(values) else np.asanyarray(values)
+
+
+def _is_lazy(values: ArrayLike) -> bool:
+    """Determine whether the `values` are a lazy dask collection.
+
+    Note that, dask is not imported, as a dask collection is identified
+    by the ``__dask_graph__`` protocol.
+
+    Parameters
+    ----------
+    values : ArrayLike
+        The values to be inspected.
+
+    Returns
+    -------
+    bool
+        Whether the `values` are lazy.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    graph = getattr(values, "__dask_graph__", None)
+    return callable(graph) and graph() is not None
+
+
+class _MemmapBuffer:  # numpydoc ignore=PR01
+    """Growable memory-mapped array, which is appended along its first axis.
+
+    The array is backed by a temporary file. Once finalized, the file is
+    unlinked immediately on POSIX platforms, as the mapping remains valid.
+    Otherwise, the file is removed once the finalized array is garbage
+    collected, or at interpreter exit.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    def __init__(
+        self,
+        dtype: DTypeLike,
+        capacity: int,
+        shape: Shape | None = None,
+        dirname: PathLike | None = None,
+    ) -> None:
+        """Create an empty memory-mapped buffer.
+
+        Parameters
+        ----------
+        dtype : DTypeLike
+            The dtype of the buffer values.
+        capacity : int
+            The initial number of values along the first axis of the buffer.
+        shape : Shape, optional
+            The shape of each value along the first axis of the buffer.
+            Defaults to scalar values.
+        dirname : PathLike, optional
+            The directory of the temporary file backing the buffer. Defaults
+            to the system temporary directory.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        fd, self.fname = tempfile.mkstemp(
+            prefix="geovista-", suffix=".dat", dir=dirname
+        )
+        os.close(fd)
+        self.dtype = np.dtype(dtype)
+        self.shape = () if shape is None else tuple(shape)
+        self.size = 0
+        self._memmap = None
+        self._resize(capacity)
+
+    def _resize(self, capacity: int) -> None:
+        """Resize the backing file and remap the buffer.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of values along the first axis of the buffer.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        capacity = max(1, capacity)
+
+        if self._memmap is not None:
+            self._memmap.flush()
+            # unmap the file before resizing it
+            self._memmap = None
+
+        nbytes = capacity * self.dtype.itemsize * int(np.prod(self.shape, dtype=int))
+
+        with Path(self.fname).open("r+b") as fh:
+            fh.truncate(nbytes)
+
+        self._memmap = np.memmap(
+            self.fname, dtype=self.dtype, mode="r+", shape=(capacity, *self.shape)
+        )
+
+    def append(self, values: np.ndarray) -> None:
+        """Append the values to the buffer, growing the buffer as necessary.
+
+        Parameters
+        ----------
+        values : ndarray
+            The values to append along the first axis of the buffer.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        start, stop = self.size, self.size + values.shape[0]
+
+        if stop > (capacity := self._memmap.shape[0]):
+            # amortise the cost of growing the buffer
+            self._resize(max(stop, 2 * capacity))
+
+        np.copyto(self._memmap[start:stop], values, casting="same_kind")
+        self.size = stop
+
+    def discard(self) -> None:
+        """Unmap the buffer and remove its backing file.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        self._memmap = None
+        Path(self.fname).unlink(missing_ok=True)
+
+    def finalize(self) -> np.memmap:
+        """Trim the buffer to its appended values.
+
+        Returns
+        -------
+        memmap
+            The memory-mapped values.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        self._resize(self.size)
+        result, self._memmap = self._memmap, None
+
+        if os.name == "posix":
+            Path(self.fname).unlink()
+        else:
+            weakref.finalize(result, Path(self.fname).unlink, missing_ok=True)
+
+        return result
+
 
 class Transform:  # numpydoc ignore=PR01
     """Build a mesh from spatial points, connectivity, data and CRS metadata.
@@ -99,7 +324,9 @@ class Transform:  # numpydoc ignore=PR01
     ) -> np.ndarray:
         """Ensure data is compatible with the number of mesh points or cells.
 
-        Note that, masked values will be filled with NaNs.
+        Note that, masked values will be filled with NaNs. Otherwise, contiguous
+        data with a native byte order is not copied, allowing the resultant mesh
+        to share the memory of the provided `data`.
 
         Parameters
         ----------
@@ -138,8 +365,16 @@ class Transform:  # numpydoc ignore=PR01
                 )
                 raise ValueError(emsg)
 
+            if np.ma.isMaskedArray(data) and not np.ma.is_masked(data):
+                # no values are masked, so avoid filling a copy with NaNs
+                data = np.ma.getdata(data)
+
             data = nan_mask(np.ravel(data))
 
+            if not data.dtype.isnative:
+                # vtk requires native byte order
+                data = data.astype(data.dtype.newbyteorder("="))
+
             if rgb:
                 # reshape to be (N, 3) or (N, 4) for RGB or RGBA image data
                 data = data.reshape(size, -1)
@@ -218,112 +453,960 @@ class Transform:  # numpydoc ignore=PR01
             ndarray
                 The contiguous bounds array.
 
-            """
-            left, right = bnds[:-1, 1], bnds[1:, 0]
+            """
+            left, right = bnds[:-1, 1], bnds[1:, 0]
+
+            if not np.allclose(left, right):
+                emsg = (
+                    f"The {kind} bounds array, shape '{bnds.shape}', is not "
+                    "contiguous."
+                )
+                raise ValueError(emsg)
+
+            parts = ([bnds[0, 0]], left, [bnds[-1, -1]])
+
+            return np.concatenate(parts)
+
+        if xs.ndim == 2:
+            xs = _contiguous(xs, "x-axis") if xs.size > 2 else xs[0]
+
+        if ys.ndim == 2:
+            ys = _contiguous(ys, "y-axis") if ys.size > 2 else ys[0]
+
+        return xs, ys
+
+    @staticmethod
+    def _as_vtk_ids(indices: ArrayLike) -> np.ndarray:
+        """Copy the `indices` to the VTK id type, to be owned by one mesh.
+
+        Parameters
+        ----------
+        indices : ArrayLike
+            The face offsets or connectivity.
+
+        Returns
+        -------
+        ndarray
+            The copied indices, which are safe to share with VTK.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        # require to copy the indices, otherwise results in a memory
+        # corruption within vtk, which mutates cell arrays in-place regardless
+        # of the read-only indices shared by other meshes or the caller
+        return np.array(indices, dtype=pv.ID_TYPE)
+
+    @staticmethod
+    def _cloud_points(
+        xs: ArrayLike,
+        ys: ArrayLike,
+        crs: pyproj.CRS | None = None,
+        radius: float | None = None,
+        zlevel: int | ArrayLike | None = None,
+        zscale: float | None = None,
+        dtype: DTypeLike | None = None,
+    ) -> np.ndarray:
+        """Convert the point-cloud x-values and y-values to cartesian ``xyz``.
+
+        Parameters
+        ----------
+        xs : ArrayLike
+            The point-cloud x-values, in canonical `crs` units.
+        ys : ArrayLike
+            The point-cloud y-values, in canonical `crs` units.
+        crs : CRS, optional
+            The Coordinate Reference System of the provided `xs` and `ys`.
+        radius : float, optional
+            The radius of the mesh point-cloud.
+        zlevel : int or ArrayLike, optional
+            The z-axis level.
+        zscale : float, optional
+            The proportional multiplier for z-axis `zlevel`.
+        dtype : DTypeLike, optional
+            The floating point dtype of the points.
+
+        Returns
+        -------
+        ndarray
+            The ``(N, 3)`` cartesian points.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if crs is not None and crs != WGS84:
+            transformed = transform_points(src_crs=crs, tgt_crs=WGS84, xs=xs, ys=ys)
+            xs, ys = transformed[:, 0], transformed[:, 1]
+
+        # ensure longitudes (degrees) are in half-closed interval [-180, 180)
+        xs = wrap(xs)
+
+        # reduce any singularity points at the poles to a common longitude
+        poles = np.isclose(np.abs(ys), 90)
+        if np.any(poles):
+            xs[poles] = 0
+
+        # convert lat/lon to cartesian xyz
+        return to_cartesian(
+            xs, ys, radius=radius, zlevel=zlevel, zscale=zscale, dtype=dtype
+        )
+
+    @classmethod
+    def _cloud_points_lazy(
+        cls,
+        xs: ArrayLike,
+        ys: ArrayLike,
+        crs: pyproj.CRS | None = None,
+        radius: float | None = None,
+        zlevel: int | None = None,
+        zscale: float | None = None,
+        dtype: DTypeLike | None = None,
+    ) -> np.ndarray:
+        """Convert lazy dask x-values and y-values to cartesian ``xyz``.
+
+        Each chunk of the x-values and y-values is transformed, wrapped and
+        converted to cartesian ``xyz`` independently, and in parallel, by the
+        dask scheduler. Only the resultant ``(N, 3)`` points are materialised.
+
+        Parameters
+        ----------
+        xs : ArrayLike
+            The x-values, in canonical `crs` units. At least one of the `xs`
+            or `ys` is a dask array.
+        ys : ArrayLike
+            The y-values, in canonical `crs` units.
+        crs : CRS, optional
+            The Coordinate Reference System of the provided `xs` and `ys`.
+        radius : float, optional
+            The radius of the mesh.
+        zlevel : int, optional
+            The scalar z-axis level.
+        zscale : float, optional
+            The proportional multiplier for z-axis `zlevel`.
+        dtype : DTypeLike, optional
+            The floating point dtype of the points.
+
+        Returns
+        -------
+        ndarray
+            The ``(N, 3)`` cartesian points.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if np.shape(xs) != np.shape(ys):
+            emsg = (
+                "Require x-values and y-values with the same shape, got "
+                f"'{np.shape(xs)}' and '{np.shape(ys)}' respectively."
+            )
+            raise ValueError(emsg)
+
+        import dask.array as da
+
+        # align the chunks of the flattened x-values and y-values
+        xs = da.asarray(xs).ravel()
+        ys = da.asarray(ys).ravel().rechunk(xs.chunks)
+        dtype = np.dtype(POINTS_DTYPE if dtype is None else dtype)
+
+        func = partial(
+            cls._cloud_points,
+            crs=crs,
+            radius=radius,
+            zlevel=zlevel,
+            zscale=zscale,
+            dtype=dtype,
+        )
+        xyz = da.map_blocks(
+            func,
+            xs,
+            ys,
+            new_axis=1,
+            chunks=(xs.chunks[0], (3,)),
+            meta=np.empty((0, 3), dtype=dtype),
+        )
+
+        return xyz.compute()
+
+    @staticmethod
+    def _create_connectivity_m1n1(shape: Shape) -> np.ndarray:
+        """Create 2-D quad-mesh connectivity from node `shape`.
+
+        The connectivity ordering of the quad-mesh face nodes (points) is
+        anti-clockwise, as follows:
+
+            3---2
+            |   |
+            0---1
+
+        Assumes that the associated face node spatial coordinates are
+        appropriately ordered.
+
+        Parameters
+        ----------
+        shape : Shape
+            The shape of the 2-D mesh nodes.
+
+        Returns
+        -------
+        ndarray
+            The connectivity array of the face-to-node offsets (zero based).
+
+        Notes
+        -----
+        ..versionadded:: 0.1.0
+
+        For VTK Quadrilateral cell type node ordering see
+        https://kitware.github.io/vtk-examples/site/VTKBook/05Chapter5/#54-cell-types
+
+        """
+        # sanity check - internally this should always be the case
+        assert len(shape) == 2
+
+        key = ("m1n1", *map(int, shape))
+
+        if (connectivity := CONNECTIVITY_CACHE.get(key)) is None:
+            rows, cols = key[1:]
+            idxs = np.arange(rows * cols, dtype=pv.ID_TYPE).reshape(rows, cols)
+            connectivity = np.empty((rows - 1) * (cols - 1) * 4, dtype=pv.ID_TYPE)
+            nodes = connectivity.reshape(rows - 1, cols - 1, 4)
+            nodes[..., 0] = idxs[1:, :-1]
+            nodes[..., 1] = idxs[1:, 1:]
+            nodes[..., 2] = idxs[:-1, 1:]
+            nodes[..., 3] = idxs[:-1, :-1]
+            connectivity = connectivity.reshape(-1, 4)
+            connectivity.flags.writeable = False
+            CONNECTIVITY_CACHE.put(key, connectivity, nbytes=connectivity.nbytes)
+
+        return connectivity
+
+    @staticmethod
+    def _create_connectivity_mn4(shape: Shape) -> np.ndarray:
+        """Create 2-D quad-mesh connectivity from face `shape`.
+
+        The connectivity ordering of the quad-mesh face nodes (points) is
+        anti-clockwise, as follows:
+
+            3---2
+            |   |
+            0---1
+
+        Assumes that the associated face node spatial coordinates are
+        appropriately ordered.
+
+        Parameters
+        ----------
+        shape : Shape
+            The shape of the 2-D mesh faces.
+
+        Returns
+        -------
+        ndarray
+            The connectivity array of face-to-node offsets (zero-based).
+
+        Notes
+        -----
+        ..versionadded:: 0.1.0
+
+        For VTK Quadrilateral cell type node ordering see
+        https://kitware.github.io/vtk-examples/site/VTKBook/05Chapter5/#54-cell-types
+
+        """
+        # sanity check - internally this should always be the case
+        assert len(shape) == 2
+
+        key = ("mn4", *map(int, shape))
+
+        if (connectivity := CONNECTIVITY_CACHE.get(key)) is None:
+            # we know that we can only be dealing with a quad mesh
+            npts = np.prod(shape) * 4
+            connectivity = np.arange(npts, dtype=pv.ID_TYPE).reshape(-1, 4)
+            connectivity.flags.writeable = False
+            CONNECTIVITY_CACHE.put(key, connectivity, nbytes=connectivity.nbytes)
+
+        return connectivity
+
+    @staticmethod
+    def _create_offsets(n_faces: int, n_vertices: int) -> np.ndarray:
+        """Create the face offsets of a mesh with a fixed number of face vertices.
+
+        The offsets, along with the flattened face connectivity, define the
+        mesh faces using the :class:`pyvista.CellArray` layout.
+
+        Parameters
+        ----------
+        n_faces : int
+            The number of mesh faces.
+        n_vertices : int
+            The number of vertices of each mesh face.
+
+        Returns
+        -------
+        ndarray
+            The read-only ``(n_faces + 1,)`` face offsets into the flattened
+            face connectivity.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        key = ("offsets", int(n_faces), int(n_vertices))
+
+        if (offsets := CONNECTIVITY_CACHE.get(key)) is None:
+            stop = n_faces * n_vertices + 1
+            offsets = np.arange(0, stop, n_vertices, dtype=pv.ID_TYPE)
+            offsets.flags.writeable = False
+            CONNECTIVITY_CACHE.put(key, offsets, nbytes=offsets.nbytes)
+
+        return offsets
+
+    @staticmethod
+    def _create_ragged_faces(
+        connectivity: np.ma.MaskedArray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Create the face offsets and flattened connectivity of a ragged mesh.
+
+        Each face is defined by the unmasked vertex indices of its row in the
+        masked `connectivity`, thus supporting varied mesh face geometry e.g.,
+        triangular, quad, pentagon (et al) faces within a single mesh. Faces
+        with less than three vertices are discarded.
+
+        Parameters
+        ----------
+        connectivity : MaskedArray
+            The masked 2-D ``(M, N)`` connectivity, where ``N`` is the maximum
+            number of vertices of a face.
+
+        Returns
+        -------
+        tuple of ndarray
+            The ``(M+1,)`` face offsets and the flattened face connectivity.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        connectivity = np.atleast_2d(connectivity)
+
+        if (ndim := connectivity.ndim) > 2:
+            emsg = f"Masked connectivity must be at most 2-D, got {ndim}-D."
+            raise ValueError(emsg)
+
+        # avoid slow masked array operations
+        valid = ~np.ma.getmaskarray(connectivity)
+        n_vertices = np.count_nonzero(valid, axis=1)
+
+        # ensure at least three vertices per face
+        if (n_invalid := np.count_nonzero(n_vertices < 3)) > 0:
+            plural = "s" if n_invalid > 1 else ""
+            wmsg = (
+                f"geovista masked connectivity defines {n_invalid:,} face{plural} "
+                "with no vertices."
+            )
+            warnings.warn(wmsg, stacklevel=4)
+            invalid = n_vertices < 3
+            valid[invalid] = False
+            n_vertices = n_vertices[~invalid]
+
+        offsets = np.zeros(n_vertices.size + 1, dtype=pv.ID_TYPE)
+        np.cumsum(n_vertices, out=offsets[1:])
+        # compact the unmasked vertex indices in row-major order
+        faces = np.ma.getdata(connectivity)[valid]
+
+        return offsets, faces
+
+    @classmethod
+    def _create_topology(
+        cls,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        connectivity: np.ndarray | Shape | None = None,
+        start_index: int | None = None,
+        crs: CRSLike | None = None,
+        radius: float | None = None,
+        zlevel: int | None = None,
+        zscale: float | None = None,
+        dtype: DTypeLike | None = None,
+        offsets: ArrayLike | None = None,
+    ) -> pv.PolyData:
+        """Build the spherical mesh geometry and topology, without data.
+
+        Parameters
+        ----------
+        xs : ndarray
+            The x-values, in canonical `crs` units, of the mesh vertices.
+        ys : ndarray
+            The y-values, in canonical `crs` units, of the mesh vertices.
+        connectivity : ndarray or Shape, optional
+            The topology of each face in terms of indices into the `xs` and `ys`.
+        start_index : int, optional
+            The base index of the provided `connectivity`.
+        crs : CRSLike, optional
+            The Coordinate Reference System of the provided `xs` and `ys`.
+        radius : float, optional
+            The radius of the mesh sphere.
+        zlevel : int, optional
+            The z-axis level.
+        zscale : float, optional
+            The proportional multiplier for z-axis `zlevel`.
+        dtype : DTypeLike, optional
+            The floating point dtype of the mesh points.
+        offsets : ArrayLike, optional
+            The offsets of each face into the flattened 1-D `connectivity`.
+
+        Returns
+        -------
+        PolyData
+            The spherical mesh with CRS and radius field data attached.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        shape = xs.shape
+
+        if ys.shape != shape:
+            emsg = (
+                "Require x-values and y-values with the same shape, got "
+                f"'{shape}' and '{ys.shape}' respectively."
+            )
+            raise ValueError(emsg)
+
+        if xs.size < 3:
+            emsg = (
+                "Require a mesh to have at least one face with three "
+                "points/vertices i.e., minimal shape '(3,)', got "
+                f"x-values/y-values with shape '{shape}'."
+            )
+            raise ValueError(emsg)
+
+        if crs is not None:
+            crs = pyproj.CRS.from_user_input(crs)
+
+        radius = RADIUS if radius is None else abs(float(radius))
+        zscale = ZLEVEL_SCALE if zscale is None else float(zscale)
+        zlevel = 0 if zlevel is None else int(zlevel)
+        radius += radius * zlevel * zscale
+        geometry = None
+
+        if _is_lazy(xs) or _is_lazy(ys):
+            # compute the geometry in parallel chunks
+            geometry = cls._cloud_points_lazy(
+                xs, ys, crs=crs, radius=radius, dtype=dtype
+            )
+        else:
+            xs, ys = xs.ravel(), ys.ravel()
+
+            if crs is not None and crs != WGS84:
+                transformed = transform_points(src_crs=crs, tgt_crs=WGS84, xs=xs, ys=ys)
+                xs, ys = transformed[:, 0], transformed[:, 1]
+
+            # ensure longitudes (degrees) are in half-closed interval [-180, 180)
+            xs = wrap(xs)
+
+        if connectivity is None and offsets is None:
+            # default to the shape of the points
+            connectivity = shape
+
+            # generate connectivity from masked points
+            if (
+                np.ma.is_masked(xs)
+                and np.ma.is_masked(ys)
+                and np.array_equal(xs.mask, ys.mask)
+            ):
+                connectivity = np.ma.arange(np.ma.prod(shape), dtype=np.uint32).reshape(
+                    shape
+                )
+                connectivity.mask = xs.mask
+
+        if offsets is not None:
+            offsets = np.asanyarray(offsets)
+            connectivity = np.asanyarray(connectivity)
+            cls._verify_offsets(offsets, connectivity)
+            ignore_start_index = False
+        elif isinstance(connectivity, tuple):
+            cls._verify_connectivity(connectivity)
+            npts = np.prod(connectivity)
+
+            if npts != xs.size:
+                emsg = (
+                    f"Connectivity with shape '{connectivity}' requires "
+                    f"'{npts:,d}' x-values/y-values, but only "
+                    f"'{xs.size:,d}' have been provided."
+                )
+                raise ValueError(emsg)
+
+            connectivity = np.arange(npts, dtype=pv.ID_TYPE).reshape(connectivity)
+            ignore_start_index = True
+        else:
+            connectivity = np.asanyarray(connectivity)
+            cls._verify_connectivity(connectivity.shape)
+            ignore_start_index = False
+
+        if not ignore_start_index:
+            if start_index is None:
+                start_index = connectivity.min()
+
+            if start_index not in [0, 1]:
+                emsg = (
+                    "Require a 'start_index' in the closed interval [0, 1], got "
+                    f"'{start_index}'."
+                )
+                raise ValueError(emsg)
+
+            if start_index:
+                connectivity = connectivity - start_index
+
+        if geometry is None:
+            # reduce any singularity points at the poles to a common longitude
+            poles = np.isclose(np.abs(ys), 90)
+            if np.any(poles):
+                xs[poles] = 0
+
+            # convert lat/lon to cartesian xyz
+            geometry = to_cartesian(xs, ys, radius=radius, dtype=dtype)
+
+        if offsets is not None:
+            faces = as_cell_array(
+                cls._as_vtk_ids(offsets), cls._as_vtk_ids(connectivity)
+            )
+        elif np.ma.is_masked(connectivity):
+            faces = as_cell_array(*cls._create_ragged_faces(connectivity))
+        else:
+            # create face offsets and flattened connectivity e.g., for a
+            # quad-mesh, each face has four indices (Vn) specifying each of
+            # the face vertices in an anti-clockwise order into the mesh
+            # geometry, and the offset of each face is a multiple of four.
+            n_faces, n_vertices = connectivity.shape
+            offsets = cls._create_offsets(n_faces, n_vertices)
+            faces = as_cell_array(
+                cls._as_vtk_ids(offsets), cls._as_vtk_ids(connectivity)
+            )
+
+        # create the mesh
+        mesh = pv.PolyData(geometry, faces=faces)
+
+        # attach the pyproj crs serialized as ogc wkt
+        to_wkt(mesh, WGS84)
+
+        # attach the radius
+        mesh.field_data[GV_FIELD_RADIUS] = np.array([radius])
+
+        return mesh
+
+    @classmethod
+    def _stream_points(
+        cls,
+        chunks: Iterable[Sequence[ArrayLike | None]],
+        buffers: list[_MemmapBuffer],
+        crs: pyproj.CRS | None = None,
+        radius: float | None = None,
+        zlevel: int | ArrayLike | None = None,
+        zscale: float | None = None,
+        dirname: PathLike | None = None,
+        dtype: DTypeLike | None = None,
+    ) -> tuple[_MemmapBuffer, _MemmapBuffer | None]:
+        """Convert and append the point-cloud chunks to memory-mapped buffers.
+
+        Parameters
+        ----------
+        chunks : iterable of sequence
+            The ``(xs, ys)``, ``(xs, ys, data)`` or ``(xs, ys, data, zlevel)``
+            chunks of the point-cloud.
+        buffers : list of _MemmapBuffer
+            The created buffers are registered here, allowing the caller to
+            discard them should streaming fail.
+        crs : CRS, optional
+            The Coordinate Reference System of the chunk `xs` and `ys`.
+        radius : float, optional
+            The radius of the mesh point-cloud.
+        zlevel : int or ArrayLike, optional
+            The z-axis level of any chunk that does not provide its own `zlevel`.
+        zscale : float, optional
+            The proportional multiplier for z-axis `zlevel`.
+        dirname : PathLike, optional
+            The directory of the temporary files backing the buffers.
+        dtype : DTypeLike, optional
+            The floating point dtype of the points.
+
+        Returns
+        -------
+        tuple of _MemmapBuffer
+            The points buffer and the optional data buffer.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        points = values = None
+
+        for chunk in chunks:
+            if (n_items := len(chunk)) not in (2, 3, 4):
+                emsg = (
+                    "Require a chunk of (xs, ys), (xs, ys, data) or "
+                    f"(xs, ys, data, zlevel), got {n_items} items."
+                )
+                raise ValueError(emsg)
+
+            xs, ys, data, chunk_zlevel = (*chunk, None, None)[:4]
+            xyz = cls._cloud_points(
+                xs,
+                ys,
+                crs=crs,
+                radius=radius,
+                zlevel=zlevel if chunk_zlevel is None else chunk_zlevel,
+                zscale=zscale,
+                dtype=dtype,
+            )
+            n_points = xyz.shape[0]
+
+            if points is None:
+                points = _MemmapBuffer(xyz.dtype, n_points, shape=(3,), dirname=dirname)
+                buffers.append(points)
+            elif (data is None) != (values is None):
+                emsg = "Require either all or none of the chunks to provide data."
+                raise ValueError(emsg)
+
+            points.append(xyz)
+
+            if data is not None:
+                data = cls._as_compatible_data(data, n_points, n_points)
+
+                if values is None:
+                    values = _MemmapBuffer(data.dtype, n_points, dirname=dirname)
+                    buffers.append(values)
+
+                values.append(data)
+
+        if points is None or points.size == 0:
+            emsg = "Require at least one chunk of points."
+            raise ValueError(emsg)
+
+        return points, values
+
+    @classmethod
+    def _from_batch(
+        cls,
+        method: str,
+        batch: Iterable[Mapping[str, Any] | Sequence[Any]],
+        workers: int | None = None,
+        processes: bool | None = False,
+        strict: bool | None = True,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[pv.PolyData | Exception]:
+        """Build a batch of independent meshes concurrently.
+
+        Threads share the CRS transformer and connectivity caches, and release
+        the GIL during the heavy numerical and PROJ operations. Processes avoid
+        the GIL entirely, at the cost of pickling each mesh.
+
+        Parameters
+        ----------
+        method : str
+            The name of the :class:`Transform` method that builds each mesh.
+        batch : iterable of mapping or sequence
+            The keyword arguments, or positional arguments, of the `method`
+            for each mesh.
+        workers : int, optional
+            The maximum number of workers concurrently building meshes.
+        processes : bool, default=False
+            Whether to build the meshes in a pool of processes, rather than
+            a pool of threads.
+        strict : bool, default=True
+            Whether to raise an :class:`ExceptionGroup` of all the errors
+            encountered. Otherwise, each error is returned in place of its mesh.
+        **kwargs : dict, optional
+            The keyword arguments of the `method` common to each mesh, which
+            are overridden by any keyword arguments of a `batch` item.
+
+        Returns
+        -------
+        list of PolyData or Exception
+            The meshes, or errors, in the same order as the `batch`.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if workers is None:
+            workers = BRIDGE_WORKERS
 
-            if not np.allclose(left, right):
-                emsg = (
-                    f"The {kind} bounds array, shape '{bnds.shape}', is not "
-                    "contiguous."
-                )
-                raise ValueError(emsg)
+        if workers is not None and workers < 1:
+            emsg = f"Cannot build batch, 'workers' must be positive, got {workers}."
+            raise ValueError(emsg)
 
-            parts = ([bnds[0, 0]], left, [bnds[-1, -1]])
+        builder = getattr(cls, method)
+        executor = ProcessPoolExecutor if processes else ThreadPoolExecutor
 
-            return np.concatenate(parts)
+        with executor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(builder, **(kwargs | dict(item)))
+                if isinstance(item, Mapping)
+                else pool.submit(builder, *item, **kwargs)
+                for item in batch
+            ]
 
-        if xs.ndim == 2:
-            xs = _contiguous(xs, "x-axis") if xs.size > 2 else xs[0]
+        results = []
 
-        if ys.ndim == 2:
-            ys = _contiguous(ys, "y-axis") if ys.size > 2 else ys[0]
+        for index, future in enumerate(futures):
+            try:
+                result = future.result()
+            except Exception as error:  # noqa: BLE001
+                error.add_note(f"geovista failed to build batch item #{index}.")
+                result = error
+            results.append(result)
 
-        return xs, ys
+        if strict and (errors := [r for r in results if isinstance(r, Exception)]):
+            emsg = f"Failed to build {len(errors):,d} of {len(results):,d} meshes."
+            raise ExceptionGroup(emsg, errors)
+
+        return results
 
     @staticmethod
-    def _create_connectivity_m1n1(shape: Shape) -> np.ndarray:
-        """Create 2-D quad-mesh connectivity from node `shape`.
+    def _is_ragged(connectivity: ArrayLike | Shape | None) -> bool:
+        """Determine whether the `connectivity` is an ``(offsets, connectivity)`` tuple.
 
-        The connectivity ordering of the quad-mesh face nodes (points) is
-        anti-clockwise, as follows:
+        Parameters
+        ----------
+        connectivity : ArrayLike or Shape, optional
+            The mesh face connectivity.
 
-            3---2
-            |   |
-            0---1
+        Returns
+        -------
+        bool
+            Whether the `connectivity` is a tuple of face offsets and flattened
+            face connectivity arrays, rather than a connectivity shape.
 
-        Assumes that the associated face node spatial coordinates are
-        appropriately ordered.
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return (
+            isinstance(connectivity, tuple)
+            and len(connectivity) == 2
+            and any(np.ndim(item) for item in connectivity)
+        )
+
+    @staticmethod
+    def _tiff_window(
+        src: DatasetReader,
+        window: Sequence[float] | Window | None = None,
+        window_crs: CRSLike | None = None,
+        max_cells: int | None = None,
+    ) -> tuple[dict[str, Any], Affine, Shape]:
+        """Determine the GeoTIFF pixels to read for a windowed or decimated mesh.
 
         Parameters
         ----------
-        shape : Shape
-            The shape of the 2-D mesh nodes.
+        src : DatasetReader
+            The open :mod:`rasterio` GeoTIFF dataset.
+        window : sequence of float or Window, optional
+            The ``(xmin, ymin, xmax, ymax)`` bounding-box, or the
+            :class:`rasterio.windows.Window`, of the pixels to read.
+        window_crs : CRSLike, optional
+            The CRS of the `window` bounding-box. Defaults to the GeoTIFF CRS.
+        max_cells : int, optional
+            The maximum number of mesh cells, which decimates the pixels read.
 
         Returns
         -------
-        ndarray
-            The connectivity array of the face-to-node offsets (zero based).
+        tuple
+            The keyword arguments for :meth:`rasterio.io.DatasetReader.read`,
+            and the affine transform and ``(height, width)`` of the pixels read.
 
         Notes
         -----
-        ..versionadded:: 0.1.0
-
-        For VTK Quadrilateral cell type node ordering see
-        https://kitware.github.io/vtk-examples/site/VTKBook/05Chapter5/#54-cell-types
+        .. versionadded:: 0.6.0
 
         """
-        # sanity check - internally this should always be the case
-        assert len(shape) == 2
+        from rasterio import Affine
+        from rasterio.warp import transform_bounds
+        from rasterio.windows import Window, from_bounds
+
+        kwargs: dict[str, Any] = {}
+        transform, shape = src.transform, src.shape
+
+        if isinstance(window, Window):
+            # clip the pixel window to the dataset
+            col_start = max(int(window.col_off), 0)
+            row_start = max(int(window.row_off), 0)
+            col_stop = min(int(window.col_off + window.width), src.width)
+            row_stop = min(int(window.row_off + window.height), src.height)
+        elif window is not None:
+            if len(window) != 4:
+                emsg = (
+                    "Require a 'window' bounding-box of (xmin, ymin, xmax, ymax), "
+                    f"got {len(window)} values."
+                )
+                raise ValueError(emsg)
 
-        npts = np.prod(shape)
-        idxs = np.arange(npts, dtype=np.uint32).reshape(shape)
+            bounds = tuple(window)
+            if window_crs is not None:
+                crs = pyproj.CRS.from_user_input(window_crs)
+                bounds = transform_bounds(crs.to_wkt(), src.crs, *bounds)
 
-        nodes_c0 = np.ravel(idxs[1:, :-1]).reshape(-1, 1)
-        nodes_c1 = np.ravel(idxs[1:, 1:]).reshape(-1, 1)
-        nodes_c2 = np.ravel(idxs[:-1, 1:]).reshape(-1, 1)
-        nodes_c3 = np.ravel(idxs[:-1, :-1]).reshape(-1, 1)
+            # the window of all pixels intersecting the bounding-box
+            pixels = from_bounds(*bounds, transform=src.transform)
+            col_start = max(int(np.floor(pixels.col_off)), 0)
+            row_start = max(int(np.floor(pixels.row_off)), 0)
+            col_stop = min(int(np.ceil(pixels.col_off + pixels.width)), src.width)
+            row_stop = min(int(np.ceil(pixels.row_off + pixels.height)), src.height)
 
-        return np.hstack([nodes_c0, nodes_c1, nodes_c2, nodes_c3])
+        if window is not None:
+            if col_stop <= col_start or row_stop <= row_start:
+                emsg = (
+                    f"Require a 'window' that intersects the GeoTIFF bounds, "
+                    f"got {window}."
+                )
+                raise ValueError(emsg)
 
-    @staticmethod
-    def _create_connectivity_mn4(shape: Shape) -> np.ndarray:
-        """Create 2-D quad-mesh connectivity from face `shape`.
+            pixels = Window(
+                col_start, row_start, col_stop - col_start, row_stop - row_start
+            )
+            kwargs["window"] = pixels
+            # translate the transform origin to the window origin
+            transform = Affine(
+                transform.a,
+                transform.b,
+                transform.c + transform.a * col_start + transform.b * row_start,
+                transform.d,
+                transform.e,
+                transform.f + transform.d * col_start + transform.e * row_start,
+            )
+            shape = (row_stop - row_start, col_stop - col_start)
 
-        The connectivity ordering of the quad-mesh face nodes (points) is
-        anti-clockwise, as follows:
+        if max_cells is not None:
+            if max_cells < 1:
+                emsg = f"Require 'max_cells' to be a positive integer, got {max_cells}."
+                raise ValueError(emsg)
 
-            3---2
-            |   |
-            0---1
+            def decimate(factor: int) -> Shape:
+                """Determine the shape of the window decimated by the `factor`.
 
-        Assumes that the associated face node spatial coordinates are
-        appropriately ordered.
+                Parameters
+                ----------
+                factor : int
+                    The decimation factor of the window rows and columns.
+
+                Returns
+                -------
+                Shape
+                    The decimated ``(height, width)`` of at least one pixel.
+
+                Notes
+                -----
+                .. versionadded:: 0.6.0
+
+                """
+                height, width = shape
+                return (
+                    max(int(np.ceil(height / factor)), 1),
+                    max(int(np.ceil(width / factor)), 1),
+                )
+
+            def n_cells(factor: int) -> int:
+                """Determine the number of mesh cells decimated by the `factor`.
+
+                Parameters
+                ----------
+                factor : int
+                    The decimation factor of the window rows and columns.
+
+                Returns
+                -------
+                int
+                    The number of cells of the decimated mesh.
+
+                Notes
+                -----
+                .. versionadded:: 0.6.0
+
+                """
+                height, width = decimate(factor)
+                return max(height - 1, 1) * max(width - 1, 1)
+
+            # the cell count falls with the square of the decimation factor
+            factor = max(int(np.sqrt(n_cells(1) / max_cells)), 1)
+            while n_cells(factor) > max_cells:
+                factor += 1
+
+            if factor > 1:
+                # rasterio reads from the most suitable overview level, if any
+                out_shape = decimate(factor)
+                sx, sy = shape[1] / out_shape[1], shape[0] / out_shape[0]
+                transform = Affine(
+                    transform.a * sx,
+                    transform.b * sy,
+                    transform.c,
+                    transform.d * sx,
+                    transform.e * sy,
+                    transform.f,
+                )
+                kwargs["out_shape"] = shape = out_shape
+
+        return kwargs, transform, shape
+
+    @staticmethod
+    def _tiff_xy(transform: Affine, shape: Shape) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the GeoTIFF pixel centres in crs coordinates.
 
         Parameters
         ----------
+        transform : Affine
+            The GeoTIFF affine transform from pixel offsets to crs coordinates.
         shape : Shape
-            The shape of the 2-D mesh faces.
+            The ``(height, width)`` of the GeoTIFF in pixels.
 
         Returns
         -------
-        ndarray
-            The connectivity array of face-to-node offsets (zero-based).
+        tuple of ndarray
+            The 2-D x-values and y-values of the pixel centres.
 
         Notes
         -----
-        ..versionadded:: 0.1.0
-
-        For VTK Quadrilateral cell type node ordering see
-        https://kitware.github.io/vtk-examples/site/VTKBook/05Chapter5/#54-cell-types
+        .. versionadded:: 0.6.0
 
         """
-        # sanity check - internally this should always be the case
-        assert len(shape) == 2
+        height, width = shape
 
-        # we know that we can only be dealing with a quad mesh
-        npts = np.prod(shape) * 4
+        if transform.b == transform.d == 0:
+            # separable affine, so the pixel centres are simply the outer
+            # product of the 1-D column and row crs coordinates
+            xs = transform.c + transform.a * (np.arange(width) + 0.5)
+            ys = transform.f + transform.e * (np.arange(height) + 0.5)
+            xs, ys = np.meshgrid(xs, ys, indexing="xy")
+            return xs, ys
 
-        return np.arange(npts, dtype=np.uint32).reshape(-1, 4)
+        import rasterio as rio
+
+        # transform from pixel offsets to crs coordinates
+        cols, rows = np.meshgrid(np.arange(width), np.arange(height), indexing="xy")
+        # rasterio 1.4.0 (regression) expects 1-D arrays, fixed in 1.4.1
+        # see https://github.com/rasterio/rasterio/issues/3191
+        xs, ys = rio.transform.xy(transform, rows.flatten(), cols.flatten())
+
+        # ensure we have arrays, rather than a list of arrays
+        xs, ys = np.asanyarray(xs), np.asanyarray(ys)
+
+        # ensure shape is maintained (rasterio 1.4.1 regression)
+        if xs.shape != shape:
+            xs = xs.reshape(shape)
+
+        if ys.shape != shape:
+            ys = ys.reshape(shape)
+
+        return xs, ys
 
     @staticmethod
     def _verify_2d(xs: ArrayLike, ys: ArrayLike) -> None:
@@ -402,6 +1485,53 @@ class Transform:  # numpydoc ignore=PR01
             )
             raise ValueError(emsg)
 
+    @staticmethod
+    def _verify_offsets(offsets: np.ndarray, connectivity: np.ndarray) -> None:
+        """Ensure compatible face offsets and flattened 1-D connectivity.
+
+        Parameters
+        ----------
+        offsets : ndarray
+            The ``(M+1,)`` offsets of each of the ``M`` faces into the
+            `connectivity`.
+        connectivity : ndarray
+            The flattened 1-D vertex indices of all the faces.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        if connectivity.ndim != 1 or not np.issubdtype(connectivity.dtype, np.integer):
+            emsg = (
+                "Require a flattened 1-D integer connectivity array with 'offsets', "
+                f"got {connectivity.ndim}-D connectivity with dtype "
+                f"'{connectivity.dtype}'."
+            )
+            raise ValueError(emsg)
+
+        if offsets.ndim != 1 or offsets.size < 2:
+            emsg = (
+                "Require 1-D 'offsets' defining at least one face, got "
+                f"'offsets' with shape '{offsets.shape}'."
+            )
+            raise ValueError(emsg)
+
+        if offsets[0] != 0 or offsets[-1] != connectivity.size:
+            emsg = (
+                "Require 'offsets' in the closed interval "
+                f"[0, {connectivity.size:,d}] (size of the connectivity), got "
+                f"[{offsets[0]:,d}, {offsets[-1]:,d}]."
+            )
+            raise ValueError(emsg)
+
+        if np.any(np.diff(offsets) < 3):
+            emsg = (
+                "Require 'offsets' defining at least 3 vertices per mesh face "
+                "(triangles)."
+            )
+            raise ValueError(emsg)
+
     @classmethod
     def from_1d(
         cls,
@@ -415,6 +1545,8 @@ class Transform:  # numpydoc ignore=PR01
         zlevel: int | None = None,
         zscale: float | None = None,
         clean: bool | None = None,
+        cache: bool | None = None,
+        dtype: DTypeLike | None = None,
     ) -> pv.PolyData:
         """Build a quad-faced mesh from contiguous 1-D x-values and y-values.
 
@@ -467,6 +1599,18 @@ class Transform:  # numpydoc ignore=PR01
             and/or remove degenerate cells in the resultant mesh. See
             :meth:`pyvista.PolyDataFilters.clean`. Defaults to
             :data:`BRIDGE_CLEAN`.
+        cache : bool, optional
+            Specify whether to reuse the mesh topology from the
+            :data:`TOPOLOGY_CACHE`, given identical geometry, connectivity, `crs`,
+            `radius`, `zlevel`, `zscale` and `dtype`. Only the `data` is then
+            attached to the resultant mesh, which references the cached points
+            and faces. Defaults to :data:`BRIDGE_CACHE`.
+        dtype : DTypeLike, optional
+            The floating point dtype of the mesh points. For example, ``float32``
+            halves the memory footprint of the mesh geometry. Defaults to
+            :data:`~geovista.common.POINTS_DTYPE`.
+
+            .. versionadded:: 0.6.0
 
         Returns
         -------
@@ -491,6 +1635,8 @@ class Transform:  # numpydoc ignore=PR01
             zscale=zscale,
             clean=clean,
             rgb=rgb,
+            cache=cache,
+            dtype=dtype,
         )
 
     @classmethod
@@ -506,6 +1652,8 @@ class Transform:  # numpydoc ignore=PR01
         zlevel: int | None = None,
         zscale: float | None = None,
         clean: bool | None = None,
+        cache: bool | None = None,
+        dtype: DTypeLike | None = None,
     ) -> pv.PolyData:
         """Build a quad-faced mesh from 2-D x-values and y-values.
 
@@ -517,6 +1665,9 @@ class Transform:  # numpydoc ignore=PR01
         in the mesh for the native `crs`, which will then be projected to
         geographic longitude and latitude values.
 
+        The `xs` and `ys` may be lazy dask arrays, in which case each chunk is
+        transformed to cartesian points in parallel by the dask scheduler.
+
         Parameters
         ----------
         xs : ArrayLike
@@ -559,6 +1710,18 @@ class Transform:  # numpydoc ignore=PR01
             and/or remove degenerate cells in the resultant mesh. See
             :meth:`pyvista.PolyDataFilters.clean`. Defaults to
             :data:`BRIDGE_CLEAN`.
+        cache : bool, optional
+            Specify whether to reuse the mesh topology from the
+            :data:`TOPOLOGY_CACHE`, given identical geometry, connectivity, `crs`,
+            `radius`, `zlevel`, `zscale` and `dtype`. Only the `data` is then
+            attached to the resultant mesh, which references the cached points
+            and faces. Defaults to :data:`BRIDGE_CACHE`.
+        dtype : DTypeLike, optional
+            The floating point dtype of the mesh points. For example, ``float32``
+            halves the memory footprint of the mesh geometry. Defaults to
+            :data:`~geovista.common.POINTS_DTYPE`.
+
+            .. versionadded:: 0.6.0
 
         Returns
         -------
@@ -570,7 +1733,7 @@ class Transform:  # numpydoc ignore=PR01
         .. versionadded:: 0.1.0
 
         """
-        xs, ys = np.asanyarray(xs), np.asanyarray(ys)
+        xs, ys = _asanyarray(xs), _asanyarray(ys)
         cls._verify_2d(xs, ys)
         shape, ndim = xs.shape, xs.ndim
 
@@ -602,59 +1765,284 @@ class Transform:  # numpydoc ignore=PR01
             zscale=zscale,
             clean=clean,
             rgb=rgb,
+            cache=cache,
+            dtype=dtype,
+        )
+
+    @classmethod
+    def from_2d_batch(
+        cls,
+        batch: Iterable[Mapping[str, Any] | Sequence[Any]],
+        workers: int | None = None,
+        processes: bool | None = False,
+        strict: bool | None = True,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[pv.PolyData | Exception]:
+        """Build a batch of quad-faced meshes from 2-D x-values and y-values.
+
+        Each mesh is built by :meth:`from_2d` in a pool of threads, or
+        processes.
+
+        Parameters
+        ----------
+        batch : iterable of mapping or sequence
+            The keyword arguments, or positional arguments, of
+            :meth:`from_2d` for each mesh.
+        workers : int, optional
+            The maximum number of workers concurrently building meshes.
+            Defaults to :data:`BRIDGE_WORKERS`, otherwise the executor default.
+        processes : bool, default=False
+            Whether to build the meshes in a pool of processes, rather than
+            a pool of threads.
+        strict : bool, default=True
+            Whether to raise an :class:`ExceptionGroup` of all the errors
+            encountered, each annotated with the index of its `batch` item.
+            Otherwise, each error is returned in place of its mesh.
+        **kwargs : dict, optional
+            The keyword arguments of :meth:`from_2d` common to each mesh,
+            which are overridden by any keyword arguments of a `batch` item.
+
+        Returns
+        -------
+        list of PolyData or Exception
+            The meshes, or errors, in the same order as the `batch`.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return cls._from_batch(
+            "from_2d",
+            batch,
+            workers=workers,
+            processes=processes,
+            strict=strict,
+            **kwargs,
         )
 
     @classmethod
     def from_points(
         cls,
-        xs: ArrayLike,
-        ys: ArrayLike,
-        data: ArrayLike | None = None,
+        xs: ArrayLike,
+        ys: ArrayLike,
+        data: ArrayLike | None = None,
+        name: str | None = None,
+        crs: CRSLike | None = None,
+        radius: float | None = None,
+        zlevel: int | ArrayLike | None = None,
+        zscale: float | None = None,
+        clean: bool | None = None,
+        dtype: DTypeLike | None = None,
+    ) -> pv.PolyData:
+        """Build a point-cloud mesh from x-values, y-values and z-levels.
+
+        Note that, any optional mesh `data` provided must be in the same order as the
+        spatial points.
+
+        The `xs` and `ys` may be lazy dask arrays, in which case each chunk is
+        transformed to cartesian points in parallel by the dask scheduler.
+
+        Parameters
+        ----------
+        xs : ArrayLike
+            A 1-D, 2-D or 3-D array of point-cloud x-values, in canonical `crs` units.
+            Must have the same shape as the `ys`.
+        ys : ArrayLike
+            A 1-D, 2-D or 3-D array of point-cloud y-values, in canonical `crs` units.
+            Must have the same shape as the `xs`.
+        data : ArrayLike, optional
+            Data to be optionally attached to the mesh points defined by
+            `xs` and `ys`.
+        name : str, optional
+            The name of the optional data array to be attached to the mesh. If `data`
+            is provided but with no `name`, defaults to :data:`NAME_POINTS`.
+        crs : CRSLike, optional
+            The Coordinate Reference System of the provided `xs` and `ys`. May
+            be anything accepted by :meth:`pyproj.crs.CRS.from_user_input`. Defaults
+            to ``EPSG:4326`` i.e., ``WGS 84``.
+        radius : float, optional
+            The radius of the mesh point-cloud. Defaults to
+            :data:`~geovista.common.RADIUS`.
+        zlevel : int or ArrayLike, default=0
+            The z-axis level. Used in combination with the `zscale` to offset the
+            `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
+            If `zlevel` is not a scalar, then its shape must match or broadcast
+            with the shape of the `xs` and `ys`.
+        zscale : float, optional
+            The proportional multiplier for z-axis `zlevel`. Defaults to
+            :data:`~geovista.common.ZLEVEL_SCALE`.
+        clean : bool, optional
+            Specify whether to merge duplicate points. See
+            :meth:`pyvista.PolyDataFilters.clean`. Defaults to
+            :data:`BRIDGE_CLEAN`.
+        dtype : DTypeLike, optional
+            The floating point dtype of the mesh points. For example, ``float32``
+            halves the memory footprint of the mesh geometry. Defaults to
+            :data:`~geovista.common.POINTS_DTYPE`.
+
+            .. versionadded:: 0.6.0
+
+        Returns
+        -------
+        PolyData
+            The point-cloud spherical mesh.
+
+        Notes
+        -----
+        .. versionadded:: 0.2.0
+
+        """
+        radius = RADIUS if radius is None else abs(float(radius))
+        zscale = ZLEVEL_SCALE if zscale is None else float(zscale)
+
+        if crs is not None:
+            crs = pyproj.CRS.from_user_input(crs)
+
+        lazy = _is_lazy(xs) or _is_lazy(ys)
+
+        if lazy and np.ndim(zlevel):
+            # broadcast z-levels require materialised points
+            xs, ys = dask.compute(xs, ys)
+            lazy = False
+
+        # compute any lazy point-cloud in parallel chunks
+        cloud_points = cls._cloud_points_lazy if lazy else cls._cloud_points
+        xyz = cloud_points(
+            xs, ys, crs=crs, radius=radius, zlevel=zlevel, zscale=zscale, dtype=dtype
+        )
+
+        # create the point-cloud mesh
+        mesh = pv.PolyData(xyz)
+
+        # attach the pyproj crs serialized as ogc wkt
+        to_wkt(mesh, WGS84)
+
+        # attach the original base radius and zscale
+        mesh.field_data[GV_FIELD_RADIUS] = np.array([radius])
+        mesh.field_data[GV_FIELD_ZSCALE] = np.array([zscale])
+
+        # attach any optional data to the mesh
+        if data is not None:
+            data = cls._as_compatible_data(data, mesh.n_points, mesh.n_cells)
+
+            if not name:
+                name = NAME_POINTS
+            if not isinstance(name, str):
+                name = str(name)
+
+            mesh.field_data[GV_FIELD_NAME] = np.array([name])
+            mesh[name] = data
+
+        # clean the mesh
+        if clean:
+            mesh.clean(inplace=True)
+
+        return mesh
+
+    @classmethod
+    def from_points_batch(
+        cls,
+        batch: Iterable[Mapping[str, Any] | Sequence[Any]],
+        workers: int | None = None,
+        processes: bool | None = False,
+        strict: bool | None = True,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[pv.PolyData | Exception]:
+        """Build a batch of point-cloud meshes from x-values and y-values.
+
+        Each mesh is built by :meth:`from_points` in a pool of threads, or
+        processes.
+
+        Parameters
+        ----------
+        batch : iterable of mapping or sequence
+            The keyword arguments, or positional arguments, of
+            :meth:`from_points` for each mesh.
+        workers : int, optional
+            The maximum number of workers concurrently building meshes.
+            Defaults to :data:`BRIDGE_WORKERS`, otherwise the executor default.
+        processes : bool, default=False
+            Whether to build the meshes in a pool of processes, rather than
+            a pool of threads.
+        strict : bool, default=True
+            Whether to raise an :class:`ExceptionGroup` of all the errors
+            encountered, each annotated with the index of its `batch` item.
+            Otherwise, each error is returned in place of its mesh.
+        **kwargs : dict, optional
+            The keyword arguments of :meth:`from_points` common to each mesh,
+            which are overridden by any keyword arguments of a `batch` item.
+
+        Returns
+        -------
+        list of PolyData or Exception
+            The meshes, or errors, in the same order as the `batch`.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return cls._from_batch(
+            "from_points",
+            batch,
+            workers=workers,
+            processes=processes,
+            strict=strict,
+            **kwargs,
+        )
+
+    @classmethod
+    def from_points_stream(
+        cls,
+        chunks: Iterable[Sequence[ArrayLike | None]],
         name: str | None = None,
         crs: CRSLike | None = None,
         radius: float | None = None,
         zlevel: int | ArrayLike | None = None,
         zscale: float | None = None,
-        clean: bool | None = None,
+        dirname: PathLike | None = None,
+        dtype: DTypeLike | None = None,
     ) -> pv.PolyData:
-        """Build a point-cloud mesh from x-values, y-values and z-levels.
+        """Build an out-of-core point-cloud mesh from chunks of spatial points.
 
-        Note that, any optional mesh `data` provided must be in the same order as the
-        spatial points.
+        Each chunk of points is converted to cartesian ``xyz`` and appended to a
+        growable memory-mapped buffer, as is any optional chunk data. Only one
+        chunk is required in memory at a time, and the resultant mesh points
+        and data are backed by the memory-mapped buffers.
 
         Parameters
         ----------
-        xs : ArrayLike
-            A 1-D, 2-D or 3-D array of point-cloud x-values, in canonical `crs` units.
-            Must have the same shape as the `ys`.
-        ys : ArrayLike
-            A 1-D, 2-D or 3-D array of point-cloud y-values, in canonical `crs` units.
-            Must have the same shape as the `xs`.
-        data : ArrayLike, optional
-            Data to be optionally attached to the mesh points defined by
-            `xs` and `ys`.
+        chunks : iterable of sequence
+            The chunks of the point-cloud e.g., from a generator or from slices
+            of memory-mapped arrays. Each chunk is either ``(xs, ys)``,
+            ``(xs, ys, data)`` or ``(xs, ys, data, zlevel)``, see
+            :meth:`from_points`. Either all or none of the chunks must provide
+            `data`.
         name : str, optional
-            The name of the optional data array to be attached to the mesh. If `data`
-            is provided but with no `name`, defaults to :data:`NAME_POINTS`.
+            The name of the optional data array to be attached to the mesh. If
+            chunk `data` is provided but with no `name`, defaults to
+            :data:`NAME_POINTS`.
         crs : CRSLike, optional
-            The Coordinate Reference System of the provided `xs` and `ys`. May
+            The Coordinate Reference System of the chunk `xs` and `ys`. May
             be anything accepted by :meth:`pyproj.crs.CRS.from_user_input`. Defaults
             to ``EPSG:4326`` i.e., ``WGS 84``.
         radius : float, optional
             The radius of the mesh point-cloud. Defaults to
             :data:`~geovista.common.RADIUS`.
         zlevel : int or ArrayLike, default=0
-            The z-axis level. Used in combination with the `zscale` to offset the
-            `radius` by a proportional amount i.e., ``radius * zlevel * zscale``.
-            If `zlevel` is not a scalar, then its shape must match or broadcast
-            with the shape of the `xs` and `ys`.
+            The z-axis level of any chunk that does not provide its own
+            `zlevel`.
         zscale : float, optional
             The proportional multiplier for z-axis `zlevel`. Defaults to
             :data:`~geovista.common.ZLEVEL_SCALE`.
-        clean : bool, optional
-            Specify whether to merge duplicate points. See
-            :meth:`pyvista.PolyDataFilters.clean`. Defaults to
-            :data:`BRIDGE_CLEAN`.
+        dirname : PathLike, optional
+            The directory of the temporary files backing the memory-mapped
+            mesh points and data, which are removed once no longer referenced.
+            Defaults to the system temporary directory.
+        dtype : DTypeLike, optional
+            The floating point dtype of the mesh points. Defaults to
+            :data:`~geovista.common.POINTS_DTYPE`.
 
         Returns
         -------
@@ -663,7 +2051,24 @@ class Transform:  # numpydoc ignore=PR01
 
         Notes
         -----
-        .. versionadded:: 0.2.0
+        .. versionadded:: 0.6.0
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from geovista import Transform
+
+        Stream a point-cloud from memory-mapped longitudes and latitudes
+        in chunks of ``size`` points.
+
+        >>> lons = np.memmap("lons.dat", dtype=np.float32, mode="r")  # doctest: +SKIP
+        >>> lats = np.memmap("lats.dat", dtype=np.float32, mode="r")  # doctest: +SKIP
+        >>> size = 2**20
+        >>> chunks = (
+        ...     (lons[i : i + size], lats[i : i + size])
+        ...     for i in range(0, lons.size, size)
+        ... )  # doctest: +SKIP
+        >>> mesh = Transform.from_points_stream(chunks)  # doctest: +SKIP
 
         """
         radius = RADIUS if radius is None else abs(float(radius))
@@ -672,23 +2077,27 @@ class Transform:  # numpydoc ignore=PR01
         if crs is not None:
             crs = pyproj.CRS.from_user_input(crs)
 
-            if crs != WGS84:
-                transformed = transform_points(src_crs=crs, tgt_crs=WGS84, xs=xs, ys=ys)
-                xs, ys = transformed[:, 0], transformed[:, 1]
-
-        # ensure longitudes (degrees) are in half-closed interval [-180, 180)
-        xs = wrap(xs)
-
-        # reduce any singularity points at the poles to a common longitude
-        poles = np.isclose(np.abs(ys), 90)
-        if np.any(poles):
-            xs[poles] = 0
+        buffers = []
 
-        # convert lat/lon to cartesian xyz
-        xyz = to_cartesian(xs, ys, radius=radius, zlevel=zlevel, zscale=zscale)
+        try:
+            points, values = cls._stream_points(
+                chunks,
+                buffers,
+                crs=crs,
+                radius=radius,
+                zlevel=zlevel,
+                zscale=zscale,
+                dirname=dirname,
+                dtype=dtype,
+            )
 
-        # create the point-cloud mesh
-        mesh = pv.PolyData(xyz)
+            # create the point-cloud mesh, sharing the memory-mapped points
+            mesh = pv.PolyData(points.finalize())
+            values = None if values is None else values.finalize()
+        except Exception:
+            for buffer in buffers:
+                buffer.discard()
+            raise
 
         # attach the pyproj crs serialized as ogc wkt
         to_wkt(mesh, WGS84)
@@ -697,30 +2106,24 @@ class Transform:  # numpydoc ignore=PR01
         mesh.field_data[GV_FIELD_RADIUS] = np.array([radius])
         mesh.field_data[GV_FIELD_ZSCALE] = np.array([zscale])
 
-        # attach any optional data to the mesh
-        if data is not None:
-            data = cls._as_compatible_data(data, mesh.n_points, mesh.n_cells)
-
+        # attach any optional data to the mesh, sharing the memory-mapped data
+        if values is not None:
             if not name:
                 name = NAME_POINTS
             if not isinstance(name, str):
                 name = str(name)
 
             mesh.field_data[GV_FIELD_NAME] = np.array([name])
-            mesh[name] = data
-
-        # clean the mesh
-        if clean:
-            mesh.clean(inplace=True)
+            mesh[name] = values
 
         return mesh
 
     @classmethod
-    def from_tiff(
+    def from_tiff(  # noqa: PLR0913
         cls,
         fname: PathLike,
         name: str | None = None,
-        band: int | None = 1,
+        band: int | Sequence[int] | None = 1,
         rgb: bool | None = False,
         sieve: bool | None = False,
         size: int | None = None,
@@ -729,6 +2132,10 @@ class Transform:  # numpydoc ignore=PR01
         zlevel: int | None = None,
         zscale: float | None = None,
         clean: bool | None = None,
+        dtype: DTypeLike | None = None,
+        window: Sequence[float] | Window | None = None,
+        window_crs: CRSLike | None = None,
+        max_cells: int | None = None,
     ) -> pv.PolyData:
         """Build a quad-faced mesh from the GeoTIFF.
 
@@ -743,10 +2150,15 @@ class Transform:  # numpydoc ignore=PR01
             The name of the GeoTIFF data array to be attached to the mesh.
             Defaults to :data:`NAME_POINTS`. Note that, ``{units}`` may be
             used as a placeholder for the units of the data array e.g.,
-            ``"Elevation / {units}"``.
-        band : int, optional
+            ``"Elevation / {units}"``. When reading multiple bands, ``{band}``
+            may be used as a placeholder for each band index, otherwise the
+            band index is appended as a ``_{band}`` suffix.
+        band : int or sequence of int, optional
             The band index to read from the GeoTIFF. Note that, the `band`
             index is one-based. Defaults to the first band i.e., ``band=1``.
+            A sequence of band indices reads each band as a separate point
+            data array on the same mesh geometry, with the first band as the
+            active scalars.
         rgb : bool, default=False
             Specify whether to read the GeoTIFF as an ``RGB`` or ``RGBA`` image.
             When ``rgb=True``, the `band` index is ignored.
@@ -770,6 +2182,32 @@ class Transform:  # numpydoc ignore=PR01
             and/or remove degenerate cells in the resultant mesh. See
             :meth:`pyvista.PolyDataFilters.clean`. Defaults to
             :data:`BRIDGE_CLEAN`.
+        dtype : DTypeLike, optional
+            The floating point dtype of the mesh points. For example, ``float32``
+            halves the memory footprint of the mesh geometry. Defaults to
+            :data:`~geovista.common.POINTS_DTYPE`.
+
+            .. versionadded:: 0.6.0
+        window : sequence of float or Window, optional
+            The ``(xmin, ymin, xmax, ymax)`` bounding-box of the region to read
+            from the GeoTIFF. Only the pixels intersecting the bounding-box are
+            read. Alternatively, the :class:`rasterio.windows.Window` of pixels
+            to read. Defaults to reading all pixels.
+
+            .. versionadded:: 0.6.0
+        window_crs : CRSLike, optional
+            The CRS of the `window` bounding-box e.g., use
+            :data:`~geovista.crs.WGS84` for a ``lon/lat`` bounding-box. Defaults
+            to the CRS of the GeoTIFF.
+
+            .. versionadded:: 0.6.0
+        max_cells : int, optional
+            The maximum number of cells in the resultant mesh. When necessary,
+            the GeoTIFF is read at a coarser resolution, using the most suitable
+            overview level, if available. Defaults to reading at the native
+            resolution.
+
+            .. versionadded:: 0.6.0
 
         Returns
         -------
@@ -780,6 +2218,10 @@ class Transform:  # numpydoc ignore=PR01
         -----
         .. versionadded:: 0.5.0
 
+        The pixel centres of a GeoTIFF with a north-up affine transform i.e.,
+        no rotation or shear, are computed from 1-D column and row coordinates,
+        avoiding a per-pixel affine transform.
+
         .. attention:: Optional package dependency :mod:`rasterio` is required.
 
         Examples
@@ -821,7 +2263,8 @@ class Transform:  # numpydoc ignore=PR01
             fname = Path(fname)
 
         fname = fname.resolve(strict=True)
-        band = None if rgb else band
+        bands = [] if rgb else np.atleast_1d(band).tolist()
+        multiband = not rgb and np.ndim(band) > 0
 
         if size is None:
             size = RIO_SIEVE_SIZE
@@ -838,27 +2281,55 @@ class Transform:  # numpydoc ignore=PR01
                         "available."
                     )
                     raise ValueError(emsg)
-            elif band < 1 or band > count:
-                if count == 1:
-                    emsg = f"Require a band index of 1, got '{band}'."
-                else:
-                    emsg = (
-                        f"Require a band index in the closed interval [1, {count}], "
-                        f"got '{band}'."
-                    )
+            elif not bands:
+                emsg = "Require at least one band index to read, got none."
                 raise ValueError(emsg)
 
-            if name is not None:
+            for index in bands:
+                if index < 1 or index > count:
+                    if count == 1:
+                        emsg = f"Require a band index of 1, got '{index}'."
+                    else:
+                        emsg = (
+                            "Require a band index in the closed interval "
+                            f"[1, {count}], got '{index}'."
+                        )
+                    raise ValueError(emsg)
+
+            if multiband:
+                template = NAME_POINTS if name is None else str(name)
+                if "{band}" not in template:
+                    template = f"{template}_{{band}}"
+                names = [
+                    template.format(units=str(src.units[index - 1]), band=index)
+                    for index in bands
+                ]
+                name = names[0]
+            elif name is not None:
                 name = str(name)
                 if "{units}" in name:
                     units = str(src.units[0] if rgb else src.units[band - 1])
                     name = name.format(units=units)
 
-            data = src.read(masked=extract) if rgb else src.read(band, masked=extract)
+            kwargs, transform, shape = cls._tiff_window(
+                src, window=window, window_crs=window_crs, max_cells=max_cells
+            )
+
+            if rgb:
+                data = src.read(masked=extract, **kwargs)
+            else:
+                indexes = bands if multiband else band
+                data = src.read(indexes, masked=extract, **kwargs)
 
             if extract:
-                # ignore the mask on the alpha channel, if present
-                mask = data[0].mask & data[1].mask & data[2].mask if rgb else data.mask
+                if rgb:
+                    # ignore the mask on the alpha channel, if present
+                    mask = data[0].mask & data[1].mask & data[2].mask
+                elif multiband:
+                    # only pixels masked in every band are discarded
+                    mask = np.logical_and.reduce(np.ma.getmaskarray(data))
+                else:
+                    mask = data.mask
                 # ensure there is masked data prior to extracting unmasked points
                 extract = np.sum(mask) > 0
                 data = data.data
@@ -866,47 +2337,43 @@ class Transform:  # numpydoc ignore=PR01
             if rgb:
                 data = np.dstack(data).reshape(-1, count)
 
-            # transform from pixel offsets to crs coordinates
-            cols, rows = np.meshgrid(
-                np.arange(src.width), np.arange(src.height), indexing="xy"
-            )
-            # rasterio 1.4.0 (regression) expects 1-D arrays, fixed in 1.4.1
-            # see https://github.com/rasterio/rasterio/issues/3191
-            xs, ys = rio.transform.xy(src.transform, rows.flatten(), cols.flatten())
-
-            # ensure we have arrays, rather than a list of arrays
-            xs, ys = np.asanyarray(xs), np.asanyarray(ys)
-
-            # ensure shape is maintained (rasterio 1.4.1 regression)
-            if xs.shape != src.shape:
-                xs = xs.reshape(src.shape)
-
-            if ys.shape != src.shape:
-                ys = ys.reshape(src.shape)
+            xs, ys = cls._tiff_xy(transform, shape)
 
             # create the geotiff mesh
             mesh = cls.from_2d(
                 xs,
                 ys,
-                data=data,
+                data=data[0] if multiband else data,
                 name=name,
                 crs=src.crs,
                 rgb=rgb,
                 radius=radius,
                 zlevel=zlevel,
                 zscale=zscale,
-                clean=clean,
+                clean=False if multiband else clean,
+                dtype=dtype,
             )
 
+            if multiband:
+                # attach the remaining bands to the shared geometry
+                for band_name, values in zip(names[1:], data[1:], strict=True):
+                    mesh.point_data[band_name] = cls._as_compatible_data(
+                        values, mesh.n_points, mesh.n_cells
+                    )
+
+                # clean the mesh once all bands are attached
+                if clean:
+                    mesh.clean(inplace=True)
+
             if extract:
                 if sieve:
                     from rasterio.features import sieve as riosieve
 
                     # convert boolean mask to conform to GDAL RFC 15 for sieve
                     # see https://trac.osgeo.org/gdal/wiki/rfc15_nodatabitmask
-                    dtype = np.dtype(src.dtypes[0])
-                    muint = 2 ** (dtype.itemsize * 8) - 1
-                    mask = (~mask * muint).astype(dtype)
+                    mask_dtype = np.dtype(src.dtypes[0])
+                    muint = 2 ** (mask_dtype.itemsize * 8) - 1
+                    mask = (~mask * muint).astype(mask_dtype)
                     mask = riosieve(mask, size=size)
                     # convert back to boolean mask
                     mask = ~mask.astype(bool)
@@ -917,12 +2384,147 @@ class Transform:  # numpydoc ignore=PR01
 
             return mesh
 
+    @classmethod
+    def from_tiff_tiles(
+        cls,
+        fname: PathLike,
+        tile_shape: Shape | None = None,
+        workers: int | None = None,
+        processes: bool | None = False,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> pv.MultiBlock:
+        """Build a tiled collection of quad-faced meshes from the GeoTIFF.
+
+        The GeoTIFF is partitioned into tiles, each of which is independently
+        read and built by :meth:`from_tiff`, in a pool of threads or processes.
+        Adjacent tiles overlap by one pixel, so that the tile meshes seamlessly
+        cover the GeoTIFF.
+
+        Each tile mesh has a :data:`~geovista.common.GV_FIELD_BOUNDS` field
+        array of its ``(xmin, ymin, xmax, ymax)`` bounds in the CRS of the
+        GeoTIFF, which may be used to cull tiles or load them on demand.
+
+        Parameters
+        ----------
+        fname : PathLike
+            The file path to the GeoTIFF.
+        tile_shape : Shape, optional
+            The ``(height, width)`` of each tile in pixels. Defaults to the
+            internal block shape of the GeoTIFF.
+        workers : int, optional
+            The maximum number of workers concurrently building tiles.
+            Defaults to :data:`BRIDGE_WORKERS`, otherwise the executor default.
+        processes : bool, default=False
+            Whether to build the tiles in a pool of processes, rather than
+            a pool of threads.
+        **kwargs : dict, optional
+            The keyword arguments of :meth:`from_tiff` common to each tile.
+
+        Returns
+        -------
+        MultiBlock
+            The GeoTIFF spherical tile meshes, with each block named by the
+            ``row,col`` index of its tile.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        .. attention:: Optional package dependency :mod:`rasterio` is required.
+
+        """
+        try:
+            import rasterio as rio
+            from rasterio.windows import Window
+        except ImportError:
+            emsg = (
+                "Optional dependency 'rasterio' is required to read GeoTIFF files. "
+                "Use pip or conda to install."
+            )
+            raise ImportError(emsg) from None
+
+        if isinstance(fname, str):
+            fname = Path(fname)
+
+        fname = fname.resolve(strict=True)
+
+        with rio.open(fname, mode="r") as src:
+            height, width = src.shape
+            transform = src.transform
+            if tile_shape is None:
+                tile_shape = src.block_shapes[0]
+
+        if len(tile_shape) != 2 or min(tile_shape) < 1:
+            emsg = (
+                "Require a 'tile_shape' of (height, width) with at least 1 pixel, "
+                f"got {tuple(tile_shape)}."
+            )
+            raise ValueError(emsg)
+
+        tile_height, tile_width = tile_shape
+        # each tile overlaps its neighbour by one pixel to avoid gaps between
+        # tile meshes, so the last pixel row and column never start a tile
+        rows = range(0, max(height - 1, 1), tile_height)
+        cols = range(0, max(width - 1, 1), tile_width)
+        tiles, batch = [], []
+
+        for row, row_off in enumerate(rows):
+            for col, col_off in enumerate(cols):
+                window = Window(
+                    col_off,
+                    row_off,
+                    min(tile_width + 1, width - col_off),
+                    min(tile_height + 1, height - row_off),
+                )
+                # the crs coordinates of the window corners
+                corners = np.array(
+                    [
+                        (window.col_off, window.row_off),
+                        (window.col_off + window.width, window.row_off),
+                        (window.col_off, window.row_off + window.height),
+                        (
+                            window.col_off + window.width,
+                            window.row_off + window.height,
+                        ),
+                    ],
+                    dtype=float,
+                )
+                xs = transform.a * corners[:, 0] + transform.b * corners[:, 1]
+                ys = transform.d * corners[:, 0] + transform.e * corners[:, 1]
+                bounds = np.array(
+                    [
+                        xs.min() + transform.c,
+                        ys.min() + transform.f,
+                        xs.max() + transform.c,
+                        ys.max() + transform.f,
+                    ]
+                )
+                tiles.append((f"{row},{col}", bounds))
+                batch.append({"window": window})
+
+        meshes = cls._from_batch(
+            "from_tiff",
+            batch,
+            workers=workers,
+            processes=processes,
+            fname=fname,
+            **kwargs,
+        )
+
+        blocks = pv.MultiBlock()
+
+        for (key, bounds), mesh in zip(tiles, meshes, strict=True):
+            mesh.field_data[GV_FIELD_BOUNDS] = bounds
+            blocks[key] = mesh
+
+        return blocks
+
     @classmethod
     def from_unstructured(
         cls,
         xs: ArrayLike,
         ys: ArrayLike,
-        connectivity: ArrayLike | Shape | None = None,
+        connectivity: ArrayLike | Shape | tuple[ArrayLike, ArrayLike] | None = None,
         data: ArrayLike | None = None,
         start_index: int | None = None,
         name: str | None = None,
@@ -932,6 +2534,8 @@ class Transform:  # numpydoc ignore=PR01
         zlevel: int | None = None,
         zscale: float | None = None,
         clean: bool | None = None,
+        cache: bool | None = None,
+        dtype: DTypeLike | None = None,
     ) -> pv.PolyData:
         """Build a mesh from unstructured 1-D x-values and y-values.
 
@@ -943,6 +2547,10 @@ class Transform:  # numpydoc ignore=PR01
         as the mesh face `connectivity`, or in the same order as the points
         described by `xs` & `ys` (data can be on points or on cells).
 
+        The `xs` and `ys` may be lazy dask arrays, in which case each chunk is
+        transformed to cartesian points in parallel by the dask scheduler. Any
+        lazy `data` is materialised when attached to the mesh.
+
         Parameters
         ----------
         xs : ArrayLike
@@ -951,7 +2559,7 @@ class Transform:  # numpydoc ignore=PR01
         ys : ArrayLike
             A 1-D array of y-values, in canonical `crs` units, defining the
             vertices of each face in the mesh.
-        connectivity : ArrayLike or Shape, optional
+        connectivity : ArrayLike, Shape or tuple of ArrayLike, optional
             Defines the topology of each face in the unstructured mesh in terms
             of indices into the provided `xs` and `ys` mesh geometry
             arrays. The `connectivity` is a 2-D ``(M, N)`` array, where ``M`` is
@@ -962,6 +2570,10 @@ class Transform:  # numpydoc ignore=PR01
             provided, and the `xs` and `ys` are 2-D, then their shape is used
             to determine the connectivity. Also, note that masked connectivity
             may be used to define a mesh consisting of different shaped faces.
+            Alternatively, an ``(offsets, connectivity)`` tuple of 1-D arrays
+            may be provided, where the vertex indices of face ``i`` are
+            ``connectivity[offsets[i]:offsets[i+1]]``, which defines a mesh
+            consisting of different shaped faces without masking.
         data : ArrayLike, optional
             Data to be optionally attached to the mesh face or nodes.
         start_index : int, default=0
@@ -996,6 +2608,18 @@ class Transform:  # numpydoc ignore=PR01
             and/or remove degenerate cells in the resultant mesh. See
             :meth:`pyvista.PolyDataFilters.clean`. Defaults to
             :data:`BRIDGE_CLEAN`.
+        cache : bool, optional
+            Specify whether to reuse the mesh topology from the
+            :data:`TOPOLOGY_CACHE`, given identical geometry, connectivity,
+            `start_index`, `crs`, `radius`, `zlevel`, `zscale` and `dtype`. Only
+            the `data` is then attached to the resultant mesh, which references
+            the cached points and faces. Defaults to :data:`BRIDGE_CACHE`.
+        dtype : DTypeLike, optional
+            The floating point dtype of the mesh points. For example, ``float32``
+            halves the memory footprint of the mesh geometry. Defaults to
+            :data:`~geovista.common.POINTS_DTYPE`.
+
+            .. versionadded:: 0.6.0
 
         Returns
         -------
@@ -1007,147 +2631,58 @@ class Transform:  # numpydoc ignore=PR01
         .. versionadded:: 0.1.0
 
         """
-        xs, ys = np.asanyarray(xs), np.asanyarray(ys)
-        shape = xs.shape
-
-        if ys.shape != shape:
-            emsg = (
-                "Require x-values and y-values with the same shape, got "
-                f"'{shape}' and '{ys.shape}' respectively."
-            )
-            raise ValueError(emsg)
-
-        if xs.size < 3:
-            emsg = (
-                "Require a mesh to have at least one face with three "
-                "points/vertices i.e., minimal shape '(3,)', got "
-                f"x-values/y-values with shape '{shape}'."
-            )
-            raise ValueError(emsg)
-
-        xs, ys = xs.ravel(), ys.ravel()
-
-        if crs is not None:
-            crs = pyproj.CRS.from_user_input(crs)
-
-            if crs != WGS84:
-                transformed = transform_points(src_crs=crs, tgt_crs=WGS84, xs=xs, ys=ys)
-                xs, ys = transformed[:, 0], transformed[:, 1]
-
-        # ensure longitudes (degrees) are in half-closed interval [-180, 180)
-        xs = wrap(xs)
-
-        if connectivity is None:
-            # default to the shape of the points
-            connectivity = shape
-
-            # generate connectivity from masked points
-            if (
-                np.ma.is_masked(xs)
-                and np.ma.is_masked(ys)
-                and np.array_equal(xs.mask, ys.mask)
-            ):
-                connectivity = np.ma.arange(np.ma.prod(shape), dtype=np.uint32).reshape(
-                    shape
-                )
-                connectivity.mask = xs.mask
-
-        if isinstance(connectivity, tuple):
-            cls._verify_connectivity(connectivity)
-            npts = np.prod(connectivity)
-
-            if npts != xs.size:
-                emsg = (
-                    f"Connectivity with shape '{connectivity}' requires "
-                    f"'{npts:,d}' x-values/y-values, but only "
-                    f"'{xs.size:,d}' have been provided."
-                )
-                raise ValueError(emsg)
-
-            connectivity = np.arange(npts, dtype=np.uint32).reshape(connectivity)
-            ignore_start_index = True
-        else:
-            # require to copy connectivity, otherwise results in a memory
-            # corruption within vtk
-            connectivity = np.asanyarray(connectivity).copy()
-            cls._verify_connectivity(connectivity.shape)
-            ignore_start_index = False
-
-        if not ignore_start_index:
-            if start_index is None:
-                start_index = connectivity.min()
+        xs, ys = _asanyarray(xs), _asanyarray(ys)
 
-            if start_index not in [0, 1]:
-                emsg = (
-                    "Require a 'start_index' in the closed interval [0, 1], got "
-                    f"'{start_index}'."
-                )
-                raise ValueError(emsg)
+        if cache is None:
+            cache = BRIDGE_CACHE
 
-            if start_index:
-                connectivity -= start_index
+        offsets = None
 
-        # reduce any singularity points at the poles to a common longitude
-        poles = np.isclose(np.abs(ys), 90)
-        if np.any(poles):
-            xs[poles] = 0
+        if cls._is_ragged(connectivity):
+            offsets, connectivity = (np.asanyarray(item) for item in connectivity)
+        elif connectivity is not None and not isinstance(connectivity, tuple):
+            connectivity = np.asanyarray(connectivity)
 
-        radius = RADIUS if radius is None else abs(float(radius))
-        zscale = ZLEVEL_SCALE if zscale is None else float(zscale)
-        zlevel = 0 if zlevel is None else int(zlevel)
-        radius += radius * zlevel * zscale
+        key = topology = None
 
-        # convert lat/lon to cartesian xyz
-        geometry = to_cartesian(xs, ys, radius=radius)
-
-        if np.ma.is_masked(connectivity):
-            # create face connectivity from masked vertex indices, thus
-            # supporting varied mesh face geometry e.g., triangular, quad,
-            # pentagon (et al) cells within a single mesh.
-            connectivity = np.atleast_2d(connectivity)
-            if (ndim := connectivity.ndim) > 2:
-                emsg = f"Masked connectivity must be at most 2-D, got {ndim}-D."
-                raise ValueError(emsg)
-            n_faces = connectivity.shape[0]
-            n_vertices = np.ma.sum(~connectivity.mask, axis=1)
-            # ensure at least three vertices per face
-            valid_faces_mask = n_vertices > 2
-            if not np.all(valid_faces_mask):
-                n_invalid = n_faces - np.sum(valid_faces_mask)
-                plural = "s" if n_invalid > 1 else ""
-                wmsg = (
-                    f"geovista masked connectivity defines {n_invalid:,} face{plural} "
-                    "with no vertices."
-                )
-                warnings.warn(wmsg, stacklevel=2)
-                n_vertices = n_vertices[valid_faces_mask]
-                connectivity = connectivity[valid_faces_mask]
-            faces = np.ma.hstack([n_vertices.reshape(-1, 1), connectivity]).ravel()
-            faces = faces[~faces.mask].data
-        else:
-            # create face connectivity serialization e.g., for a quad-mesh,
-            # each face we have (4, V0, V1, V2, V3), where "4" is the number
-            # of vertices defining the face, followed by the four indices (Vn)
-            # specifying each of the face vertices in an anti-clockwise order
-            # into the mesh geometry.
-            n_faces, n_vertices = connectivity.shape
-            faces = np.hstack(
-                [
-                    np.broadcast_to(
-                        np.array([n_vertices], dtype=np.int8), (n_faces, 1)
-                    ),
-                    connectivity,
-                ]
+        if cache:
+            key = fingerprint(
+                xs,
+                ys,
+                connectivity,
+                start_index,
+                None if crs is None else pyproj.CRS.from_user_input(crs).to_wkt(),
+                radius,
+                zlevel,
+                zscale,
+                np.dtype(POINTS_DTYPE if dtype is None else dtype).str,
+                offsets,
             )
+            topology = TOPOLOGY_CACHE.get(key)
 
-        # create the mesh
-        mesh = pv.PolyData(geometry, faces=faces)
-
-        # attach the pyproj crs serialized as ogc wkt
-        to_wkt(mesh, WGS84)
+        if topology is None:
+            mesh = cls._create_topology(
+                xs,
+                ys,
+                connectivity=connectivity,
+                start_index=start_index,
+                crs=crs,
+                radius=radius,
+                zlevel=zlevel,
+                zscale=zscale,
+                dtype=dtype,
+                offsets=offsets,
+            )
+            if key is not None:
+                TOPOLOGY_CACHE.put(key, mesh, nbytes=mesh.actual_memory_size * 1024)
+                topology = mesh
 
-        # attach the radius
-        mesh.field_data[GV_FIELD_RADIUS] = np.array([radius])
+        if topology is not None:
+            # share the cached geometry, but not the point, cell or field data
+            mesh = pv.PolyData()
+            mesh.copy_structure(topology)
+            for field in topology.field_data:
+                mesh.field_data[field] = topology.field_data[field]
 
         # attach any optional data to the mesh
         if data is not None:
@@ -1167,17 +2702,70 @@ class Transform:  # numpydoc ignore=PR01
 
         return mesh
 
+    @classmethod
+    def from_unstructured_batch(
+        cls,
+        batch: Iterable[Mapping[str, Any] | Sequence[Any]],
+        workers: int | None = None,
+        processes: bool | None = False,
+        strict: bool | None = True,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> list[pv.PolyData | Exception]:
+        """Build a batch of meshes from unstructured 1-D x-values and y-values.
+
+        Each mesh is built by :meth:`from_unstructured` in a pool of threads, or
+        processes.
+
+        Parameters
+        ----------
+        batch : iterable of mapping or sequence
+            The keyword arguments, or positional arguments, of
+            :meth:`from_unstructured` for each mesh.
+        workers : int, optional
+            The maximum number of workers concurrently building meshes.
+            Defaults to :data:`BRIDGE_WORKERS`, otherwise the executor default.
+        processes : bool, default=False
+            Whether to build the meshes in a pool of processes, rather than
+            a pool of threads.
+        strict : bool, default=True
+            Whether to raise an :class:`ExceptionGroup` of all the errors
+            encountered, each annotated with the index of its `batch` item.
+            Otherwise, each error is returned in place of its mesh.
+        **kwargs : dict, optional
+            The keyword arguments of :meth:`from_unstructured` common to each mesh,
+            which are overridden by any keyword arguments of a `batch` item.
+
+        Returns
+        -------
+        list of PolyData or Exception
+            The meshes, or errors, in the same order as the `batch`.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return cls._from_batch(
+            "from_unstructured",
+            batch,
+            workers=workers,
+            processes=processes,
+            strict=strict,
+            **kwargs,
+        )
+
     def __init__(
         self,
         xs: ArrayLike,
         ys: ArrayLike,
-        connectivity: ArrayLike | Shape | None = None,
+        connectivity: ArrayLike | Shape | tuple[ArrayLike, ArrayLike] | None = None,
         start_index: int | None = None,
         crs: CRSLike | None = None,
         radius: float | None = None,
         zlevel: int | None = None,
         zscale: float | None = None,
         clean: bool | None = None,
+        dtype: DTypeLike | None = None,
     ) -> None:
         """Build a mesh from spatial points, connectivity, data and CRS metadata.
 
@@ -1192,7 +2780,7 @@ class Transform:  # numpydoc ignore=PR01
         ys : ArrayLike
             A 1-D array of y-values, in canonical `crs` units, defining the
             vertices of each face in the mesh.
-        connectivity : ArrayLike or Shape, optional
+        connectivity : ArrayLike, Shape or tuple of ArrayLike, optional
             Defines the topology of each face in the unstructured mesh in terms
             of indices into the provided `xs` and `ys` mesh geometry
             arrays. The `connectivity` is a 2-D ``(M, N)`` array, where ``M`` is
@@ -1203,6 +2791,10 @@ class Transform:  # numpydoc ignore=PR01
             provided, and the `xs` and `ys` are 2-D, then their shape is used
             to determine the connectivity.  Also, note that masked connectivity
             may be used to define a mesh consisting of different shaped faces.
+            Alternatively, an ``(offsets, connectivity)`` tuple of 1-D arrays
+            may be provided, where the vertex indices of face ``i`` are
+            ``connectivity[offsets[i]:offsets[i+1]]``, which defines a mesh
+            consisting of different shaped faces without masking.
         start_index : int, default=0
             Specify the base index of the provided `connectivity` in the
             closed interval [0, 1]. For example, if `start_index=1`, then
@@ -1227,13 +2819,19 @@ class Transform:  # numpydoc ignore=PR01
             and/or remove degenerate cells in the resultant mesh. See
             :meth:`pyvista.PolyDataFilters.clean`. Defaults to
             :data:`BRIDGE_CLEAN`.
+        dtype : DTypeLike, optional
+            The floating point dtype of the mesh points. For example, ``float32``
+            halves the memory footprint of the mesh geometry. Defaults to
+            :data:`~geovista.common.POINTS_DTYPE`.
+
+            .. versionadded:: 0.6.0
 
         Notes
         -----
         .. versionadded:: 0.1.0
 
         """
-        xs, ys = np.asanyarray(xs), np.asanyarray(ys)
+        xs, ys = _asanyarray(xs), _asanyarray(ys)
 
         if connectivity is None:
             if xs.ndim <= 1 or ys.ndim <= 1:
@@ -1245,6 +2843,7 @@ class Transform:  # numpydoc ignore=PR01
                     zlevel=zlevel,
                     zscale=zscale,
                     clean=clean,
+                    dtype=dtype,
                 )
             else:
                 mesh = self.from_2d(
@@ -1255,6 +2854,7 @@ class Transform:  # numpydoc ignore=PR01
                     zlevel=zlevel,
                     zscale=zscale,
                     clean=clean,
+                    dtype=dtype,
                 )
         else:
             mesh = self.from_unstructured(
@@ -1267,6 +2867,7 @@ class Transform:  # numpydoc ignore=PR01
                 clean=clean,
                 zlevel=zlevel,
                 zscale=zscale,
+                dtype=dtype,
             )
 
         self._mesh = mesh
@@ -1274,10 +2875,17 @@ class Transform:  # numpydoc ignore=PR01
         self._n_cells = mesh.n_cells
 
     def __call__(
-        self, data: ArrayLike | None = None, name: str | None = None
+        self,
+        data: ArrayLike | None = None,
+        name: str | None = None,
+        share_geometry: bool | None = True,
     ) -> pv.PolyData:
         """Build the mesh and attach the provided `data` to faces or nodes.
 
+        Note that, contiguous `data` with a native byte order and no masked
+        values is attached to the mesh without being copied i.e., the mesh
+        data array shares memory with the provided `data`.
+
         Parameters
         ----------
         data : ArrayLike, optional
@@ -1286,6 +2894,10 @@ class Transform:  # numpydoc ignore=PR01
             The name of the optional data array to be attached to the mesh. If
             `data` is provided but with no `name`, defaults to either
             :data:`NAME_POINTS` or :data:`NAME_CELLS`.
+        share_geometry : bool, default=True
+            Specify whether all meshes built by this factory reference the same
+            points and faces arrays. Otherwise, the mesh has its own deep copy
+            of the points and faces, which may then be safely modified.
 
         Returns
         -------
@@ -1301,7 +2913,13 @@ class Transform:  # numpydoc ignore=PR01
             data = self._as_compatible_data(data, self._n_points, self._n_cells)
 
         mesh = pv.PolyData()
-        mesh.copy_structure(self._mesh)
+
+        if share_geometry:
+            mesh.copy_structure(self._mesh)
+            for field in self._mesh.field_data:
+                mesh.field_data[field] = self._mesh.field_data[field]
+        else:
+            mesh.deep_copy(self._mesh)
 
         if data is not None:
             if not name:
@@ -13,18 +13,22 @@ Notes
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
 from enum import StrEnum
+import hashlib
 import importlib
 import pkgutil
 import sys
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any, NamedTuple
+import warnings
 
 import lazy_loader as lazy
 
 if TYPE_CHECKING:
     import numpy as np
-    from numpy.typing import ArrayLike
+    from numpy.typing import ArrayLike, DTypeLike
     import pyvista as pv
 
 # lazy import third-party dependencies
@@ -35,9 +39,15 @@ vtk = lazy.load("vtk")
 __all__ = [
     "BASE",
     "CENTRAL_MERIDIAN",
+    "CacheInfo",
     "COASTLINES_RESOLUTION",
+    "DISTANCE_METHOD",
+    "DISTANCE_SAMPLE_SIZE",
+    "DistanceMethod",
     "GV_CELL_IDS",
+    "GV_FIELD_BOUNDS",
     "GV_FIELD_CRS",
+    "GV_FIELD_MERGE",
     "GV_FIELD_NAME",
     "GV_FIELD_RADIUS",
     "GV_FIELD_RESOLUTION",
@@ -45,9 +55,11 @@ __all__ = [
     "GV_POINT_IDS",
     "GV_REMESH_POINT_IDS",
     "JUPYTER_BACKEND",
+    "LRUCache",
     "LRU_CACHE_SIZE",
     "MixinStrEnum",
     "PERIOD",
+    "POINTS_DTYPE",
     "Preference",
     "RADIUS",
     "REMESH_JOIN",
@@ -59,8 +71,11 @@ __all__ = [
     "ZLEVEL_SCALE",
     "ZTRANSFORM_FACTOR",
     "active_kernel",
+    "as_cell_array",
     "cast_UnstructuredGrid_to_PolyData",
+    "cell_lon_span",
     "distance",
+    "fingerprint",
     "from_cartesian",
     "get_modules",
     "nan_mask",
@@ -87,12 +102,24 @@ CENTRAL_MERIDIAN: float = 0.0
 COASTLINES_RESOLUTION: str = "10m"
 """Default Natural Earth coastline resolution."""
 
+DISTANCE_METHOD: str = "field"
+"""The default method used to determine the mean distance of a mesh."""
+
+DISTANCE_SAMPLE_SIZE: int = 1024
+"""The maximum number of mesh points sampled to estimate the mean distance."""
+
 GV_CELL_IDS: str = "gvOriginalCellIds"
 """Name of the geovista cell indices array."""
 
+GV_FIELD_BOUNDS: str = "gvBounds"
+"""The field array name of the mesh bounds in its native CRS e.g., GeoTIFF tiles."""
+
 GV_FIELD_CRS: str = "gvCRS"
 """The field array name of the CF serialized pyproj CRS."""
 
+GV_FIELD_MERGE: str = "gvMerge"
+"""The field array name of the mesh point merging statistics."""
+
 GV_FIELD_NAME: str = "gvName"
 """The field array name of the mesh containing field, point and/or cell data."""
 
@@ -120,6 +147,9 @@ LRU_CACHE_SIZE: int = 0 if "pytest" in sys.modules else 128
 PERIOD: float = 360.0
 """Default period for wrapped longitude half-open interval, in degrees."""
 
+POINTS_DTYPE: str = "float64"
+"""Default floating point dtype of converted points and coordinates."""
+
 RADIUS: float = 1.0
 """Default radius of a spherical mesh."""
 
@@ -147,6 +177,212 @@ ZLEVEL_SCALE: float = 1.0e-4
 ZTRANSFORM_FACTOR: int = 3
 """The zlevel scaling to be applied when transforming to a projection."""
 
+_KERNEL_SIZE: int = 2**14
+"""The number of points converted per block by the fused conversion kernels."""
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :class:`LRUCache`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    hits: int
+    """The number of cache lookups that found an entry."""
+
+    misses: int
+    """The number of cache lookups that failed to find an entry."""
+
+    maxsize: int
+    """The maximum number of cache entries."""
+
+    currsize: int
+    """The current number of cache entries."""
+
+    maxbytes: int | None
+    """The maximum total size of the cache entries, in bytes."""
+
+    currbytes: int
+    """The current total size of the cache entries, in bytes."""
+
+
+class LRUCache:  # numpydoc ignore=PR01
+    """Thread-safe least-recently-used cache bounded by entries and bytes.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    def __init__(self, maxsize: int, maxbytes: int | None = None) -> None:
+        """Create a least-recently-used cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            The maximum number of entries in the cache. A `maxsize` of zero
+            disables the cache.
+        maxbytes : int, optional
+            The maximum total size of the cache entries, in bytes. Entries are
+            evicted in least-recently-used order until the cache fits. An entry
+            larger than `maxbytes` is never cached. Defaults to no limit.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        self.maxsize = max(0, int(maxsize))
+        self.maxbytes = None if maxbytes is None else max(0, int(maxbytes))
+        self._cache: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = self._misses = self._nbytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Determine whether the `key` has a cache entry.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache entry key.
+
+        Returns
+        -------
+        bool
+            Whether the cache entry exists. The cache statistics are not updated.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            return key in self._cache
+
+    def __len__(self) -> int:
+        """Return the number of cache entries.
+
+        Returns
+        -------
+        int
+            The number of cache entries.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            return len(self._cache)
+
+    def cache_clear(self) -> None:
+        """Purge all cache entries and reset the cache statistics.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = self._nbytes = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Report the cache statistics.
+
+        Returns
+        -------
+        CacheInfo
+            The cache hits, misses and current size.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._cache),
+                maxbytes=self.maxbytes,
+                currbytes=self._nbytes,
+            )
+
+    def get(self, key: Hashable, default: Any | None = None) -> Any:  # noqa: ANN401
+        """Get the cache entry for the `key`, and mark it as most recently used.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache entry key.
+        default : Any, optional
+            The value returned when there is no cache entry for the `key`.
+
+        Returns
+        -------
+        Any
+            The cached value, otherwise the `default`.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                value, _ = self._cache[key]
+            else:
+                self._misses += 1
+                value = default
+
+        return value
+
+    def put(self, key: Hashable, value: Any, nbytes: int | None = None) -> None:  # noqa: ANN401
+        """Add or replace the cache entry for the `key`.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache entry key.
+        value : Any
+            The value to cache.
+        nbytes : int, optional
+            The size of the `value`, in bytes, which counts towards the
+            cache `maxbytes` limit. Defaults to zero.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        nbytes = 0 if nbytes is None else int(nbytes)
+
+        if not self.maxsize or (self.maxbytes is not None and nbytes > self.maxbytes):
+            return
+
+        with self._lock:
+            if key in self._cache:
+                _, old = self._cache.pop(key)
+                self._nbytes -= old
+
+            self._cache[key] = (value, nbytes)
+            self._nbytes += nbytes
+
+            # evict the least recently used entries
+            while len(self._cache) > self.maxsize or (
+                self.maxbytes is not None and self._nbytes > self.maxbytes
+            ):
+                _, (_, old) = self._cache.popitem(last=False)
+                self._nbytes -= old
+
 
 class MixinStrEnum:
     """Convenience behaviour mixin for a string enumeration.
@@ -234,6 +470,256 @@ class Preference(MixinStrEnum, StrEnum):
     POINT = "point"
 
 
+class DistanceMethod(MixinStrEnum, StrEnum):
+    """Enumeration of mean mesh distance methods.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    EXACT = "exact"
+    """Calculate the mean distance to all the mesh points."""
+
+    FIELD = "field"
+    """Trust the :data:`GV_FIELD_RADIUS` of a spherical mesh, if available."""
+
+    SAMPLE = "sample"
+    """Estimate the mean distance from a strided sample of the mesh points."""
+
+    VERIFY = "verify"
+    """Calculate the mean distance and verify the :data:`GV_FIELD_RADIUS`."""
+
+
+def _points_dtype(dtype: DTypeLike | None = None) -> np.dtype:
+    """Determine the floating point dtype of converted points and coordinates.
+
+    Parameters
+    ----------
+    dtype : DTypeLike, optional
+        The candidate floating point dtype. Defaults to :data:`POINTS_DTYPE`.
+
+    Returns
+    -------
+    dtype
+        The floating point dtype.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    result = np.dtype(POINTS_DTYPE if dtype is None else dtype)
+
+    if not np.issubdtype(result, np.floating):
+        emsg = f"Require a floating point dtype, got '{result}'."
+        raise ValueError(emsg)
+
+    return result
+
+
+def _to_cartesian_kernel(
+    lons: np.ndarray,
+    lats: np.ndarray,
+    radius: float | np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+) -> None:
+    """Convert longitudes and latitudes to cartesian ``xyz`` in place.
+
+    The points are converted in cache friendly blocks of :data:`_KERNEL_SIZE`,
+    in double precision, reusing the same three work buffers for each block.
+    The sine and cosine of each angle are evaluated only once.
+
+    Parameters
+    ----------
+    lons : ndarray
+        The 1-D longitude values (degrees) to be converted.
+    lats : ndarray
+        The 1-D latitude values (degrees) to be converted.
+    radius : float or ndarray
+        The radius of the sphere, or the 1-D radii of each point.
+    x : ndarray
+        The 1-D output array of the x-values.
+    y : ndarray
+        The 1-D output array of the y-values.
+    z : ndarray
+        The 1-D output array of the z-values.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    size = lons.size
+    work = np.empty((3, max(1, min(size, _KERNEL_SIZE))))
+
+    for start in range(0, size, work.shape[1]):
+        block = slice(start, min(start + work.shape[1], size))
+        lam, phi, rxy = work[:, : block.stop - start]
+        rad = radius if np.isscalar(radius) else radius[block]
+
+        # convert the longitude and the colatitude to radians
+        lam[:] = lons[block]
+        np.radians(lam, out=lam)
+        phi[:] = lats[block]
+        np.subtract(90.0, phi, out=phi)
+        np.radians(phi, out=phi)
+
+        np.sin(phi, out=rxy)
+        np.multiply(rad, rxy, out=rxy)
+        np.cos(phi, out=phi)
+        np.multiply(rad, phi, out=phi)
+        z[block] = phi
+
+        np.cos(lam, out=phi)
+        np.multiply(rxy, phi, out=phi)
+        x[block] = phi
+        np.sin(lam, out=lam)
+        np.multiply(rxy, lam, out=lam)
+        y[block] = lam
+
+
+def _to_lonlats_kernel(
+    points: np.ndarray,
+    radius: np.ndarray,
+    lons: np.ndarray,
+    lats: np.ndarray,
+    radians: bool | None = False,
+    rtol: float | None = None,
+    atol: float | None = None,
+) -> None:
+    """Convert cartesian ``xyz`` points to longitudes and latitudes in place.
+
+    The points are converted in cache friendly blocks of :data:`_KERNEL_SIZE`,
+    in double precision, reusing the same two work buffers for each block.
+
+    Parameters
+    ----------
+    points : ndarray
+        The ``(N, 3)`` cartesian points to be converted.
+    radius : ndarray
+        The radius of the sphere with shape ``(1,)``, or the radii of each
+        point with shape ``(N,)``.
+    lons : ndarray
+        The 1-D output array of the longitude values.
+    lats : ndarray
+        The 1-D output array of the latitude values.
+    radians : bool, default=False
+        Whether the longitudes and latitudes are in radians, otherwise degrees.
+    rtol : float, optional
+        The relative tolerance for longitudes close to the 'wrap meridian'.
+    atol : float, optional
+        The absolute tolerance for longitudes close to the 'wrap meridian'.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    base, period = (np.radians(BASE), np.radians(PERIOD)) if radians else (BASE, PERIOD)
+    size = points.shape[0]
+    work = np.empty((2, max(1, min(size, _KERNEL_SIZE))))
+
+    for start in range(0, size, work.shape[1]):
+        block = slice(start, min(start + work.shape[1], size))
+        lam, phi = work[:, : block.stop - start]
+        rad = radius if radius.size == 1 else radius[block]
+
+        lam[:] = points[block, 1]
+        phi[:] = points[block, 0]
+        np.arctan2(lam, phi, out=lam)
+        if not radians:
+            np.degrees(lam, out=lam)
+        lons[block] = wrap(lam, base=base, period=period, rtol=rtol, atol=atol)
+
+        phi[:] = points[block, 2]
+        np.divide(phi, rad, out=phi)
+        # NOTE: defensive clobber of values outside arcsin domain [-1, 1]
+        #       which is the result of floating point inaccuracies at the extremes
+        np.clip(phi, -1.0, 1.0, out=phi)
+        np.arcsin(phi, out=phi)
+        if not radians:
+            np.degrees(phi, out=phi)
+        lats[block] = phi
+
+
+def _unfold_polar_cells(
+    mesh: pv.DataSet, lons: np.ndarray, pole_mask: np.ndarray
+) -> None:
+    """Unfold the polar point longitudes of quad-cells, in-place.
+
+    A polar quad-cell with exactly two distinct polar points has the
+    longitudes of those points replaced with the longitudes of the opposing
+    non-polar points of the cell edge, so that the cell is no longer folded
+    onto the common polar longitude.
+
+    Parameters
+    ----------
+    mesh : :class:`~pyvista.DataSet`
+        The mesh containing the polar quad-cells.
+    lons : :class:`~numpy.ndarray`
+        The longitudes of the `mesh` points, which are updated in-place.
+    pole_mask : :class:`~numpy.ndarray`
+        The boolean mask of the `mesh` points located at a pole.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(mesh, pv.PolyData) and mesh.n_cells == mesh.n_faces_strict:
+        offsets = mesh._offset_array  # noqa: SLF001
+        connectivity = mesh._connectivity_array  # noqa: SLF001
+    else:
+        # any cell with four points is unfolded, not only polygons
+        if not isinstance(mesh, pv.UnstructuredGrid):
+            mesh = mesh.cast_to_unstructured_grid()
+        offsets, connectivity = mesh.offset, mesh.cell_connectivity
+
+    # gather the point-indices of the quad-cells
+    quads = np.where(np.diff(offsets) == 4)[0]
+    if quads.size == 0:
+        return
+    cell_pids = connectivity[offsets[quads].reshape(-1, 1) + np.arange(4)]
+
+    # mask the first occurrence of each distinct polar point within each cell
+    distinct = np.ones(cell_pids.shape, dtype=bool)
+    for i in range(1, 4):
+        distinct[:, i] = np.all(cell_pids[:, [i]] != cell_pids[:, :i], axis=1)
+    cell_pole_mask = pole_mask[cell_pids] & distinct
+
+    # criterion of exactly two points from the quad-cell at the pole
+    # to unfold the polar points longitudes
+    two = np.sum(cell_pole_mask, axis=1) == 2
+    if not np.any(two):
+        return
+    cell_pids = cell_pids[two]
+
+    # encode the relative offset of the polar points within the polar
+    # cell connectivity i.e., [0, 1] -> 3, [1, 2] -> 6, [2, 3] -> 12 and
+    # [0, 3] -> 9
+    code = cell_pole_mask[two] @ np.array([1, 2, 4, 8])
+    lhs_offset = np.full((16, 2), -1)
+    rhs_offset = np.full((16, 2), -1)
+    lhs_offset[[3, 6, 12, 9]] = [[0, 1], [1, 2], [2, 3], [0, 3]]
+    rhs_offset[[3, 6, 12, 9]] = [[3, 2], [0, 3], [1, 0], [1, 2]]
+
+    if np.any(lhs_offset[code, 0] < 0):
+        emsg = (
+            "Failed to unfold a mesh polar quad-cell. Invalid "
+            "polar points connectivity detected."
+        )
+        raise ValueError(emsg)
+
+    rows = np.arange(code.size).reshape(-1, 1)
+    lhs = cell_pids[rows, lhs_offset[code]]
+    rhs = cell_pids[rows, rhs_offset[code]]
+    lons[lhs] = lons[rhs]
+
+
 def active_kernel() -> bool:
     """Determine whether we are executing within an ``IPython`` kernel.
 
@@ -260,6 +746,56 @@ def active_kernel() -> bool:
     return result
 
 
+def as_cell_array(offsets: ArrayLike, connectivity: ArrayLike) -> pv.CellArray:
+    """Build cells from the cell offsets and flattened cell connectivity.
+
+    The cells use the VTK offsets and connectivity layout, rather than the
+    legacy ``(N, v1, v2, ..., vN)`` padded layout, which VTK must re-parse.
+    Contiguous ``int32`` arrays are shared with VTK using 32-bit storage, and
+    contiguous arrays of the VTK id type are shared using 64-bit storage.
+    Otherwise, the arrays are copied to the VTK id type.
+
+    Parameters
+    ----------
+    offsets : ArrayLike
+        The ``(N+1,)`` offsets of each of the ``N`` cells into the
+        `connectivity`, where the last offset is the size of the `connectivity`.
+    connectivity : ArrayLike
+        The flattened point indices of all the cells.
+
+    Returns
+    -------
+    CellArray
+        The cells, which share memory with the `offsets` and `connectivity`,
+        where possible.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    offsets, connectivity = np.ravel(offsets), np.ravel(connectivity)
+
+    if offsets.dtype == connectivity.dtype == np.int32:
+        arrays = [
+            pv._vtk.numpy_to_vtk(  # noqa: SLF001
+                np.ascontiguousarray(array), deep=False, array_type=vtk.VTK_TYPE_INT32
+            )
+            for array in (offsets, connectivity)
+        ]
+        cells = pv.CellArray()
+        cells.SetData(*arrays)
+        # vtk does not own the memory of the arrays, so keep a reference
+        cells.arrays = arrays
+    else:
+        cells = pv.CellArray.from_arrays(
+            np.ascontiguousarray(offsets, dtype=pv.ID_TYPE),
+            np.ascontiguousarray(connectivity, dtype=pv.ID_TYPE),
+        )
+
+    return cells
+
+
 def cast_UnstructuredGrid_to_PolyData(  # noqa: N802
     mesh: pv.UnstructuredGrid,
     clean: bool | None = False,
@@ -302,10 +838,47 @@ def cast_UnstructuredGrid_to_PolyData(  # noqa: N802
     return result
 
 
+def cell_lon_span(mesh: pv.PolyData, lons: ArrayLike | None = None) -> np.ndarray:
+    """Calculate the longitude span of each face of the `mesh`.
+
+    The span of a face is the difference between the maximum and minimum
+    longitude of its vertices.
+
+    Parameters
+    ----------
+    mesh : :class:`~pyvista.PolyData`
+        The mesh containing the faces.
+    lons : :data:`~numpy.typing.ArrayLike`, optional
+        The longitude (degrees) of each point of the `mesh`. Defaults to the
+        longitudes calculated by :func:`from_cartesian`.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        The longitude span (degrees) of each face of the `mesh`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    lons = from_cartesian(mesh)[:, 0] if lons is None else np.asanyarray(lons)
+    offsets = mesh._offset_array  # noqa: SLF001
+
+    if offsets.size < 2:
+        return np.array([], dtype=lons.dtype)
+
+    values = lons[mesh._connectivity_array]  # noqa: SLF001
+    starts = offsets[:-1]
+
+    return np.maximum.reduceat(values, starts) - np.minimum.reduceat(values, starts)
+
+
 def distance(
     mesh: pv.PolyData,
     origin: ArrayLike | None = None,
     mean: bool | None = True,
+    method: str | DistanceMethod | None = None,
 ) -> float | np.ndarray:
     """Calculate the mean distance from the `origin` to the points of the `mesh`.
 
@@ -321,6 +894,14 @@ def distance(
     mean : bool, default=True
         Calculate the mean distance to the points of the `mesh`. Otherwise, calculate
         the distance to each point from the `origin`.
+    method : str or DistanceMethod, optional
+        The method used to determine the mean distance. By default, the
+        :data:`GV_FIELD_RADIUS` of a mesh that is not a point-cloud is trusted
+        as its radius, avoiding a calculation over all the mesh points. See
+        :class:`DistanceMethod` for the available options. Defaults to
+        :data:`DISTANCE_METHOD`.
+
+        .. versionadded:: 0.6.0
 
     Returns
     -------
@@ -332,6 +913,16 @@ def distance(
     .. versionadded:: 0.1.0
 
     """
+    if method is None:
+        method = DISTANCE_METHOD
+
+    if not DistanceMethod.valid(method):
+        options = " or ".join(f"{item!r}" for item in DistanceMethod.values())
+        emsg = f"Expected a method of {options}, got '{method}'."
+        raise ValueError(emsg)
+
+    method = DistanceMethod(method)
+
     if origin is None:
         origin = np.array([0, 0, 0])
 
@@ -344,17 +935,48 @@ def distance(
         )
         raise ValueError(emsg)
 
-    pts = mesh.points - origin
+    given_radius = (
+        mesh.field_data[GV_FIELD_RADIUS][0]
+        if GV_FIELD_RADIUS in mesh.field_data
+        else None
+    )
+
+    if (
+        mean
+        and method == DistanceMethod.FIELD
+        and given_radius is not None
+        and not np.any(origin)
+        and not point_cloud(mesh)
+    ):
+        return given_radius
+
+    pts = mesh.points
+
+    if mean and method == DistanceMethod.SAMPLE:
+        # uniformly stride through the points, rather than all the points
+        stride = max(int(np.ceil(mesh.n_points / DISTANCE_SAMPLE_SIZE)), 1)
+        pts = pts[::stride]
+
+    pts = pts - origin
     result = np.sqrt(np.sum(pts * pts, axis=1))
 
     if mean:
         result = np.mean(result)
 
-        given_radius = (
-            mesh.field_data[GV_FIELD_RADIUS][0]
-            if GV_FIELD_RADIUS in mesh.field_data
-            else RADIUS
-        )
+        if (
+            method == DistanceMethod.VERIFY
+            and given_radius is not None
+            and not point_cloud(mesh)
+            and not np.isclose(result, given_radius)
+        ):
+            wmsg = (
+                f"geovista mesh {GV_FIELD_RADIUS!r} of {given_radius} is "
+                f"inconsistent with its mean distance of {result}."
+            )
+            warnings.warn(wmsg, stacklevel=2)
+
+        if given_radius is None:
+            given_radius = RADIUS
 
         if np.isclose(result, given_radius):
             result = given_radius
@@ -362,12 +984,54 @@ def distance(
     return result
 
 
+def fingerprint(*items: Any) -> str:  # noqa: ANN401
+    """Compute a content digest of the provided arrays and metadata.
+
+    Arrays contribute their ``dtype``, shape, values and any mask to the
+    digest, and lazy dask collections contribute their deterministic token,
+    without being computed. All other items contribute their ``repr``.
+
+    Parameters
+    ----------
+    *items : Any
+        The arrays and/or metadata to be digested. Note that, the order of the
+        `items` is significant.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    digest = hashlib.blake2b(digest_size=20)
+
+    for item in items:
+        if isinstance(item, np.ndarray):
+            digest.update(f"{item.dtype.str}{item.shape}".encode())
+            digest.update(np.ascontiguousarray(item).view(np.uint8).data)
+            if np.ma.is_masked(item):
+                digest.update(np.ascontiguousarray(item.mask).view(np.uint8).data)
+        elif callable(tokenize := getattr(item, "__dask_tokenize__", None)):
+            digest.update(f"dask{tokenize()!r}".encode())
+        else:
+            digest.update(repr(item).encode())
+        # delimit items
+        digest.update(b"|")
+
+    return digest.hexdigest()
+
+
 def from_cartesian(
     mesh: pv.PolyData,
     stacked: bool | None = True,
     closed_interval: bool | None = False,
     rtol: float | None = None,
     atol: float | None = None,
+    dtype: DTypeLike | None = None,
 ) -> np.ndarray:
     """Convert cartesian ``xyz`` spherical `mesh` to geographic longitude and latitude.
 
@@ -389,6 +1053,13 @@ def from_cartesian(
     atol : float, optional
         The absolute tolerance for longitudes close to the 'wrap meridian' -
         see :func:`geovista.common.wrap` for more.
+    dtype : DTypeLike, optional
+        The floating point dtype of the resultant coordinates, which are written
+        directly into a preallocated C-contiguous array. Note that, the
+        conversion is always performed in double precision. Defaults to
+        :data:`POINTS_DTYPE`.
+
+        .. versionadded:: 0.6.0
 
     Returns
     -------
@@ -403,8 +1074,9 @@ def from_cartesian(
     cloud = point_cloud(mesh)
     radius = distance(mesh, mean=not cloud)
 
+    dtype = _points_dtype(dtype)
     lons, lats = to_lonlats(
-        mesh.points, radius=radius, stacked=False, rtol=rtol, atol=atol
+        mesh.points, radius=radius, stacked=False, rtol=rtol, atol=atol, dtype=float
     )
 
     zlevel = np.zeros_like(lons)
@@ -419,66 +1091,25 @@ def from_cartesian(
         zscale = mesh[GV_FIELD_ZSCALE][0]
         zlevel = (radius - base) / (base * zscale)
 
-    data = [lons, lats, zlevel]
-
     # TODO @bjlittle: Manage pole longitudes. an alternative future scheme could be
     #                 more generic and inclusive, but this approach tackles the main
     #                 use case for now.
 
-    # TODO @bjlittle: Refactor this into a separate function.
-    pole_pids = np.where(np.isclose(np.abs(lats), 90))[0]
-    if pole_pids.size:
+    pole_mask = np.isclose(np.abs(lats), 90)
+    if np.any(pole_mask):
         # enforce a common longitude for pole singularities
         # TODO @bjlittle: Review this strategy.
-        lons[pole_pids] = 0
+        lons[pole_mask] = 0
 
         if (
             mesh.n_points
-            and {0, mesh.n_points - 1} == set(pole_pids)
+            and np.array_equal(np.where(pole_mask)[0], [0, mesh.n_points - 1])
             and np.unique(lons[1:-1]).size == 1
         ):
             # unfold polar end-points of a meridian i.e., a line of constant longitude
             lons[0] = lons[-1] = lons[1]
         else:
-            pole_submesh = mesh.extract_points(pole_pids)
-            pole_pids = set(pole_pids)
-            # get the cids (cell-indices) of mesh cells with polar vertices
-            pole_cids = np.unique(pole_submesh["vtkOriginalCellIds"])
-            for cid in pole_cids:
-                # get the pids (point-indices) of the polar cell points
-                # NOTE: pyvista 0.38.0: cell_point_ids(cid) -> get_cell(cid).point_ids
-                cell_pids = np.array(mesh.get_cell(cid).point_ids)
-                # unfold polar quad-cells
-                if len(cell_pids) == 4:
-                    # identify the pids of the cell on the pole
-                    cell_pole_pids = pole_pids.intersection(cell_pids)
-                    # criterion of exactly two points from the quad-cell
-                    # at the pole to unfold the polar points longitudes
-                    if len(cell_pole_pids) == 2:
-                        # compute the relative offset of the polar points
-                        # within the polar cell connectivity
-                        offset = sorted(
-                            [np.where(cell_pids == pid)[0][0] for pid in cell_pole_pids]
-                        )
-                        if offset == [0, 1]:
-                            lhs = cell_pids[offset]
-                            rhs = cell_pids[[3, 2]]
-                        elif offset == [1, 2]:
-                            lhs = cell_pids[offset]
-                            rhs = cell_pids[[0, 3]]
-                        elif offset == [2, 3]:
-                            lhs = cell_pids[offset]
-                            rhs = cell_pids[[1, 0]]
-                        elif offset == [0, 3]:
-                            lhs = cell_pids[offset]
-                            rhs = cell_pids[[1, 2]]
-                        else:
-                            emsg = (
-                                "Failed to unfold a mesh polar quad-cell. Invalid "
-                                "polar points connectivity detected."
-                            )
-                            raise ValueError(emsg)
-                        lons[lhs] = lons[rhs]
+            _unfold_polar_cells(mesh, lons, pole_mask)
 
     if closed_interval:
         if GV_REMESH_POINT_IDS in mesh.point_data:
@@ -507,7 +1138,11 @@ def from_cartesian(
 
                     lons[pids] = 180
 
-    return np.vstack(data).T if stacked else np.array(data)
+    result = np.empty((lons.size, 3) if stacked else (3, lons.size), dtype=dtype)
+    result_lons, result_lats, result_zlevel = result.T if stacked else result
+    result_lons[:], result_lats[:], result_zlevel[:] = lons, lats, zlevel
+
+    return result
 
 
 def get_modules(root: str, base: bool | None = True) -> list[str]:
@@ -670,6 +1305,7 @@ def to_cartesian(
     zlevel: float | ArrayLike | None = None,
     zscale: float | None = None,
     stacked: bool | None = True,
+    dtype: DTypeLike | None = None,
 ) -> np.ndarray:
     """Convert geographic longitudes and latitudes to cartesian ``xyz`` points.
 
@@ -692,6 +1328,13 @@ def to_cartesian(
     stacked : bool, default=True
         Specify whether the resultant xyz points have shape (N, 3).
         Otherwise, they will have shape (3, N).
+    dtype : DTypeLike, optional
+        The floating point dtype of the resultant xyz points, which are
+        written directly into a preallocated C-contiguous array. Note that,
+        the conversion is always performed in double precision. Defaults to
+        :data:`POINTS_DTYPE`.
+
+        .. versionadded:: 0.6.0
 
     Returns
     -------
@@ -705,6 +1348,7 @@ def to_cartesian(
     """
     lons = np.atleast_1d(lons)
     lats = np.atleast_1d(lats)
+    dtype = _points_dtype(dtype)
 
     if (shape := lons.shape) != lats.shape:
         emsg = (
@@ -724,7 +1368,7 @@ def to_cartesian(
     zlevel = np.array([0.0]) if zlevel is None else np.atleast_1d(zlevel).astype(float)
 
     try:
-        _ = np.broadcast_shapes(zshape := zlevel.shape, shape)
+        bshape = np.broadcast_shapes(zshape := zlevel.shape, shape)
     except ValueError as err:
         emsg = (
             f"Cannot broadcast zlevel with shape {zshape} to longitude/latitude"
@@ -733,15 +1377,22 @@ def to_cartesian(
         raise ValueError(emsg) from err
 
     radius += radius * zlevel * zscale
+    radius = radius.item() if radius.size == 1 else np.broadcast_to(radius, bshape)
+    lons, lats = np.broadcast_to(lons, bshape), np.broadcast_to(lats, bshape)
+
+    size = np.prod(bshape, dtype=int)
+    xyz = np.empty((size, 3) if stacked else (3, size), dtype=dtype)
+    x, y, z = xyz.T if stacked else xyz
+    _to_cartesian_kernel(
+        np.ravel(lons),
+        np.ravel(lats),
+        radius if np.isscalar(radius) else np.ravel(radius),
+        x,
+        y,
+        z,
+    )
 
-    x_rad = np.radians(lons)
-    y_rad = np.radians(90.0 - lats)
-    x = np.ravel(radius * np.sin(y_rad) * np.cos(x_rad))
-    y = np.ravel(radius * np.sin(y_rad) * np.sin(x_rad))
-    z = np.ravel(radius * np.cos(y_rad))
-    xyz = [x, y, z]
-
-    return np.vstack(xyz).T if stacked else np.array(xyz)
+    return xyz
 
 
 def to_lonlat(
@@ -801,6 +1452,7 @@ def to_lonlats(
     stacked: bool | None = True,
     rtol: float | None = None,
     atol: float | None = None,
+    dtype: DTypeLike | None = None,
 ) -> np.ndarray:
     """Convert cartesian `xyz` points on sphere to geographic longitudes and latitudes.
 
@@ -823,6 +1475,13 @@ def to_lonlats(
     atol : float, optional
         The absolute tolerance for longitudes close to the 'wrap meridian' -
         see :func:`geovista.common.wrap` for more.
+    dtype : DTypeLike, optional
+        The floating point dtype of the resultant longitude and latitude values,
+        which are written directly into a preallocated C-contiguous array. Note
+        that, the conversion is always performed in double precision. Defaults
+        to :data:`POINTS_DTYPE`.
+
+        .. versionadded:: 0.6.0
 
     Returns
     -------
@@ -857,27 +1516,16 @@ def to_lonlats(
         )
         raise ValueError(emsg)
 
-    base, period = (np.radians(BASE), np.radians(PERIOD)) if radians else (BASE, PERIOD)
+    dtype = _points_dtype(dtype)
+    size = points.shape[0]
 
-    lons = np.arctan2(points[:, 1], points[:, 0])
-    if not radians:
-        lons = np.degrees(lons)
-    lons = wrap(lons, base=base, period=period, rtol=rtol, atol=atol)
-
-    z_radius = points[:, 2] / radius
-    # NOTE: defensive clobber of values outside arcsin domain [-1, 1]
-    #       which is the result of floating point inaccuracies at the extremes
-    if indices := np.where(z_radius > 1):
-        z_radius[indices] = 1.0
-    if indices := np.where(z_radius < -1):
-        z_radius[indices] = -1.0
-    lats = np.arcsin(z_radius)
-    if not radians:
-        lats = np.degrees(lats)
-
-    data = [lons, lats]
-
-    return np.vstack(data).T if stacked else np.array(data)
+    result = np.empty((size, 2) if stacked else (2, size), dtype=dtype)
+    lons, lats = result.T if stacked else result
+    _to_lonlats_kernel(
+        points, radius, lons, lats, radians=radians, rtol=rtol, atol=atol
+    )
+
+    return result
 
 
 def triangulated(surface: pv.PolyData) -> bool:
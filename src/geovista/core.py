@@ -14,7 +14,8 @@ Notes
 from __future__ import annotations
 
 import copy
-from enum import Enum, auto, unique
+from enum import Enum, StrEnum, auto, unique
+import time
 from typing import TYPE_CHECKING
 import warnings
 
@@ -23,6 +24,7 @@ import lazy_loader as lazy
 from .common import (
     CENTRAL_MERIDIAN,
     GV_CELL_IDS,
+    GV_FIELD_MERGE,
     GV_FIELD_RADIUS,
     GV_FIELD_ZSCALE,
     GV_POINT_IDS,
@@ -31,7 +33,12 @@ from .common import (
     REMESH_JOIN,
     REMESH_SEAM,
     ZLEVEL_SCALE,
+    LRUCache,
+    MixinStrEnum,
+    as_cell_array,
+    cell_lon_span,
     distance,
+    fingerprint,
     from_cartesian,
     point_cloud,
     sanitize_data,
@@ -40,7 +47,7 @@ from .common import (
 )
 from .common import cast_UnstructuredGrid_to_PolyData as cast
 from .crs import projected
-from .filters import remesh
+from .filters import REMESH_SEAM_EAST, remesh
 from .search import find_cell_neighbours
 
 if TYPE_CHECKING:
@@ -55,9 +62,18 @@ pv = lazy.load("pyvista")
 
 __all__ = [
     "CUT_OFFSET",
+    "MERGE_TOLERANCE",
     "MeridianSlice",
+    "SLICE_CACHE",
+    "SLICE_CACHE_NBYTES",
+    "SLICE_CACHE_SIZE",
+    "SLICE_METHOD",
+    "SLICE_TOPOLOGY_CACHE",
     "SPLINE_N_POINTS",
     "SliceBias",
+    "SliceMethod",
+    "TEXTURE_CACHE",
+    "TEXTURE_COORDS_CACHE",
     "add_texture_coords",
     "combine",
     "resize",
@@ -69,9 +85,33 @@ __all__ = [
 CUT_OFFSET: float = 1e-5
 """Cartesian west/east bias offset of a slice."""
 
+MERGE_TOLERANCE: float = 1e-9
+"""Hash-grid cell size of combined mesh point merging, relative to the bounding-box."""
+
+SLICE_CACHE: bool = False
+"""Whether the topology of a sliced mesh is cached for reuse."""
+
+SLICE_CACHE_NBYTES: int = 2**30
+"""The maximum total size, in bytes, of the cached sliced mesh topologies."""
+
+SLICE_CACHE_SIZE: int = 16
+"""The maximum number of cached sliced mesh topologies."""
+
+SLICE_METHOD: str = "vtk"
+"""The default engine used to slice a cell-based mesh along a meridian."""
+
+SLICE_TOPOLOGY_CACHE: LRUCache = LRUCache(SLICE_CACHE_SIZE, maxbytes=SLICE_CACHE_NBYTES)
+"""The least-recently-used cache of sliced mesh topologies."""
+
 SPLINE_N_POINTS: int = 1
 """The default number of interpolation points along a spline."""
 
+TEXTURE_CACHE: bool = False
+"""Whether the texture coordinates of a mesh are cached for reuse."""
+
+TEXTURE_COORDS_CACHE: LRUCache = LRUCache(SLICE_CACHE_SIZE, maxbytes=SLICE_CACHE_NBYTES)
+"""The least-recently-used cache of read-only mesh texture coordinates."""
+
 
 @unique
 class SliceBias(Enum):
@@ -87,6 +127,19 @@ class SliceBias(Enum):
     """Preference for a slice to bias cells east of the chosen meridian."""
 
 
+class SliceMethod(MixinStrEnum, StrEnum):
+    """Enumeration of meridian slicing engines.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    ANALYTIC = "analytic"
+    VTK = "vtk"
+
+
 class MeridianSlice:  # numpydoc ignore=PR01
     """Remesh geolocated mesh along a meridian, from the north-pole to the south-pole.
 
@@ -265,6 +318,7 @@ def add_texture_coords(
     mesh: pv.PolyData,
     meridian: float | None = None,
     antimeridian: bool | None = False,
+    cache: bool | None = None,
 ) -> pv.PolyData:
     """Compute and attach texture coordinates, in UV space, to the mesh.
 
@@ -280,6 +334,13 @@ def add_texture_coords(
         :data:`geovista.common.CENTRAL_MERIDIAN`.
     antimeridian : bool, default=False
         Whether to flip the given `meridian` to use its anti-meridian instead.
+    cache : bool, optional
+        Whether to reuse the texture coordinates cached in
+        :data:`TEXTURE_COORDS_CACHE`, given identical geometry, connectivity
+        and `meridian`. The `mesh` is also sliced with the cached topology,
+        see :func:`slice_cells`. Defaults to :data:`TEXTURE_CACHE`.
+
+        .. versionadded:: 0.6.0
 
     Returns
     -------
@@ -303,32 +364,233 @@ def add_texture_coords(
 
     meridian = wrap(meridian)[0]
 
-    if GV_REMESH_POINT_IDS not in mesh.point_data:
-        mesh = slice_cells(mesh, meridian=meridian)
+    if cache is None:
+        cache = TEXTURE_CACHE
+
+    key = t_coord = None
+    sliced = GV_REMESH_POINT_IDS not in mesh.point_data
+
+    if cache:
+        key = fingerprint(mesh.points, mesh.faces, meridian, sliced, str(SLICE_METHOD))
+        t_coord = TEXTURE_COORDS_CACHE.get(key)
+
+    if sliced:
+        mesh = slice_cells(mesh, meridian=meridian, cache=cache)
     else:
         mesh = mesh.copy(deep=True)
 
-    # convert from cartesian xyz to spherical lat/lons
-    lonlat = from_cartesian(mesh, closed_interval=True)
-    lons, lats = lonlat[:, 0], lonlat[:, 1]
-    # convert to normalised UV space
-    u_coord = (lons + 180) / 360
-    v_coord = (lats + 90) / 180
-    t_coord = np.vstack([u_coord, v_coord]).T
+    if t_coord is None:
+        # convert from cartesian xyz to spherical lat/lons
+        lonlat = from_cartesian(mesh, closed_interval=True)
+        lons, lats = lonlat[:, 0], lonlat[:, 1]
+        # convert to normalised UV space
+        u_coord = (lons + 180) / 360
+        v_coord = (lats + 90) / 180
+        t_coord = np.column_stack([u_coord, v_coord])
+        if key is not None:
+            t_coord.flags.writeable = False
+            TEXTURE_COORDS_CACHE.put(key, t_coord, nbytes=t_coord.nbytes)
+
+    # share any cached texture coordinates, which must not be mutated
     mesh.active_texture_coordinates = t_coord
 
     return mesh
 
 
+def _combine_arrays(
+    arrays: list[np.ndarray],
+    size: int,
+    slices: list[list[tuple[int, int, int]]],
+) -> np.ndarray:
+    """Combine the arrays of each mesh into one preallocated array.
+
+    Parameters
+    ----------
+    arrays : list of ndarray
+        The array of each mesh, to be combined along the first axis.
+    size : int
+        The size of the first axis of the combined array.
+    slices : list of list of tuple
+        The ``(destination, source, size)`` slices to copy from each mesh array
+        into the combined array.
+
+    Returns
+    -------
+    ndarray
+        The combined array, with the common dtype of the arrays.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    dtype = np.result_type(*arrays)
+    result = np.empty((size, *arrays[0].shape[1:]), dtype=dtype)
+
+    for array, items in zip(arrays, slices, strict=True):
+        for destination, source, n in items:
+            result[destination : destination + n] = array[source : source + n]
+
+    return result
+
+
+def _combine_cells(
+    meshes: tuple[pv.PolyData, ...],
+    getter: str,
+    n_cells: int,
+    n_connectivity: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Combine one kind of cells of each mesh into preallocated cell arrays.
+
+    Parameters
+    ----------
+    meshes : tuple of PolyData
+        The meshes to be combined.
+    getter : str
+        The name of the :class:`vtk.vtkPolyData` method providing the cells
+        of the mesh e.g., ``GetPolys``.
+    n_cells : int
+        The total number of cells of the meshes.
+    n_connectivity : int
+        The total number of cell connectivity ids of the meshes.
+
+    Returns
+    -------
+    tuple of ndarray
+        The combined cell offsets and connectivity, along with the number
+        of cells of each mesh.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    offsets = np.zeros(n_cells + 1, dtype=pv.ID_TYPE)
+    connectivity = np.empty(n_connectivity, dtype=pv.ID_TYPE)
+    counts = np.empty(len(meshes), dtype=int)
+    n_points = cell_start = connectivity_start = 0
+
+    for i, mesh in enumerate(meshes):
+        cells = getattr(mesh, getter)()
+        n = counts[i] = cells.GetNumberOfCells()
+        # offset the cell offsets by the cumulative connectivity size, and
+        # the cell connectivity by the cumulative mesh points count
+        mesh_offsets = pv.convert_array(cells.GetOffsetsArray())
+        mesh_connectivity = pv.convert_array(cells.GetConnectivityArray())
+        np.add(
+            mesh_offsets[1:],
+            connectivity_start,
+            out=offsets[cell_start + 1 : cell_start + n + 1],
+        )
+        stop = connectivity_start + mesh_connectivity.size
+        np.add(
+            mesh_connectivity,
+            n_points,
+            out=connectivity[connectivity_start:stop],
+        )
+        # accumulate running totals of combined points, cells and connectivity
+        n_points += mesh.n_points
+        cell_start += n
+        connectivity_start = stop
+
+    return offsets, connectivity, counts
+
+
+def _combine_fields(
+    combined: pv.PolyData, meshes: tuple[pv.PolyData, ...], names: set[str]
+) -> None:
+    """Attach the common field data of the first mesh onto the combined mesh.
+
+    Parameters
+    ----------
+    combined : PolyData
+        The combined mesh.
+    meshes : tuple of PolyData
+        The meshes that were combined.
+    names : set of str
+        The names of the field data common to all the meshes.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    for name in names - {GV_FIELD_MERGE}:
+        if name == GV_FIELD_RADIUS:
+            # the radius is only authoritative when common to all the meshes
+            radii = [mesh.field_data[name][0] for mesh in meshes]
+            if not np.allclose(radii, radii[0]):
+                continue
+        combined.field_data[name] = meshes[0].field_data[name]
+
+
+def _merge_points(
+    points: np.ndarray, tolerance: float
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """Determine the unique points of a mesh on a spatial hash-grid.
+
+    The points are quantised onto a regular grid, and all points within the
+    same grid cell are merged to the first point in that cell. The merge is
+    cell-aligned rather than metric, so points closer than the grid cell size
+    but either side of a grid cell boundary are not merged. Probing the
+    neighbouring grid cells would merge such points, but at a multiple of the
+    cost.
+
+    Parameters
+    ----------
+    points : ndarray
+        The ``(N, 3)`` cartesian points.
+    tolerance : float
+        The grid cell size, relative to the diagonal of the points bounding-box.
+
+    Returns
+    -------
+    tuple of ndarray and float
+        The indices of the unique points, in order of their first occurrence,
+        and the inverse indices that map each point to its unique point,
+        along with the absolute grid cell size.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    lower = points.min(axis=0)
+    diagonal = np.linalg.norm(points.max(axis=0) - lower)
+    size = tolerance * diagonal if diagonal else 1.0
+    keys = np.floor((points - lower) / size).astype(np.int64)
+
+    # spatial hash of the integer grid cell keys, see Teschner et al. (2003)
+    hashes = (keys[:, 0] * 73856093) ^ (keys[:, 1] * 19349663)
+    hashes ^= keys[:, 2] * 83492791
+    _, index, inverse = np.unique(hashes, return_index=True, return_inverse=True)
+
+    if not np.array_equal(keys[index[inverse]], keys):
+        # resolve hash collisions of different grid cells
+        _, index, inverse = np.unique(
+            keys, axis=0, return_index=True, return_inverse=True
+        )
+        inverse = inverse.ravel()
+
+    # preserve the order of the first occurrence of each unique point
+    order = np.argsort(index)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+
+    return index[order], rank[inverse], size
+
+
 def combine(
     *meshes: Iterable[pv.PolyData],
     data: bool | None = True,
     clean: bool | None = False,
+    merge: bool | None = False,
+    tolerance: float | None = None,
 ) -> pv.PolyData:
     """Combine two or more meshes into one mesh.
 
-    Only meshes with cells will be combined. Support is not yet provided for combining
-    meshes that consist of only points or lines.
+    Meshes consisting of vertices, lines and/or faces will be combined. Support
+    is not yet provided for combining meshes that contain triangle strips.
 
     Note that, no check is performed to ensure that mesh cells do not overlap.
     However, meshes may share coincident points. Coincident point data from the
@@ -346,6 +608,22 @@ def combine(
         Specify whether to merge duplicate points, remove unused points,
         and/or remove degenerate cells in the resultant mesh. See
         :meth:`pyvista.PolyDataFilters.clean`.
+    merge : bool, default=False
+        Specify whether to merge coincident points of the meshes e.g., along
+        the shared boundaries of regional tiles. Points are quantised onto a
+        spatial hash-grid, and all points within the same grid cell are merged.
+        This is significantly cheaper than a full `clean`.
+
+        .. versionadded:: 0.6.0
+    tolerance : float, optional
+        The hash-grid cell size used to `merge` points, relative to the
+        diagonal of the combined mesh bounding-box. Note that, the tolerance is
+        cell-aligned rather than metric i.e., points within the tolerance of
+        each other but either side of a hash-grid cell boundary are not merged.
+        Use `clean` to merge points by distance. Defaults to
+        :data:`MERGE_TOLERANCE`.
+
+        .. versionadded:: 0.6.0
 
     Returns
     -------
@@ -356,6 +634,15 @@ def combine(
     -----
     .. versionadded:: 0.1.0
 
+    When merging, the ``(n_points, n_merged, size, seconds)`` statistics of
+    the number of points before and after merging, the absolute hash-grid
+    cell size, and the elapsed merge time are recorded on the resultant
+    mesh as the :data:`~geovista.common.GV_FIELD_MERGE` field array.
+
+    The combined mesh is built in two passes. The first pass determines the
+    size of the resultant points, cells and data arrays, which are then
+    preallocated and populated directly from each mesh in the second pass.
+
     """
     if not meshes:
         emsg = "Expected one or more meshes to combine."
@@ -364,9 +651,19 @@ def combine(
     if len(meshes) == 1:
         return meshes[0]
 
+    if tolerance is None:
+        tolerance = MERGE_TOLERANCE
+
+    if merge and tolerance <= 0:
+        emsg = f"Require a positive merge 'tolerance', got {tolerance}."
+        raise ValueError(emsg)
+
     first: pv.PolyData = meshes[0]
-    combined_points, combined_faces = [], []
+    # the vtk cell arrays of each kind, in the order of the vtk cell ids
+    getters = ("GetVerts", "GetLines", "GetPolys")
     n_points = 0
+    n_cells = dict.fromkeys(getters, 0)
+    n_connectivity = dict.fromkeys(getters, 0)
 
     if data:
         # determine the common point, cell and field array names
@@ -377,6 +674,7 @@ def combine(
         common_field_data = set(first.field_data.keys())
         active_scalars_info = {first.active_scalars_info._namedtuple}  # noqa: SLF001
 
+    # first pass, verify the meshes and size the combined mesh
     for i, mesh in enumerate(meshes):
         if not isinstance(mesh, pv.PolyData):
             emsg = (
@@ -385,39 +683,18 @@ def combine(
             )
             raise TypeError(emsg)
 
-        if mesh.n_lines:
+        if mesh.n_strips:
             emsg = (
-                f"Can only combine meshes with cells, input mesh #{i+1} "
-                "contains lines."
+                f"Can only combine meshes with vertices, lines or faces, input "
+                f"mesh #{i+1} contains triangle strips."
             )
             raise TypeError(emsg)
 
-        if mesh.n_cells == 0:
-            emsg = (
-                f"Can only combine meshes with cells, input mesh #{i+1} "
-                "has no cells."
-            )
-            raise TypeError(emsg)
-
-        combined_points.append(mesh.points.copy())
-        faces = mesh.faces.copy()
-
-        if n_points:
-            # compute the number of vertices (N) for each face of the mesh
-            faces_n = np.diff(mesh._offset_array)  # noqa: SLF001
-            # determine the N offset for each face within the faces array
-            # a face entry consists of (N, v1, v2, ..., vN), where vN is the Nth
-            # vertex offset (connectivity) for that face into the associated mesh
-            # points array
-            faces_n_offset = mesh._offset_array + np.arange(mesh._offset_array.size)  # noqa: SLF001
-            # offset the current mesh connectivity by the cumulative mesh points count
-            faces += n_points
-            # reinstate N for each face entry
-            faces[faces_n_offset[:-1]] = faces_n
-
-        combined_faces.append(faces)
-        # accumulate running totals of combined mesh points and cells
         n_points += mesh.n_points
+        for getter in getters:
+            cells = getattr(mesh, getter)()
+            n_cells[getter] += cells.GetNumberOfCells()
+            n_connectivity[getter] += cells.GetNumberOfConnectivityIds()
 
         if data:
             # perform intersection to determine common names
@@ -427,35 +704,65 @@ def combine(
             if mesh.active_scalars_name:
                 active_scalars_info &= {mesh.active_scalars_info._namedtuple}  # noqa: SLF001
 
-    points = np.vstack(combined_points)
-    faces = np.hstack(combined_faces)
-    combined = pv.PolyData(points, faces=faces)
-
-    def combine_data(names: set[str], field: bool | None = False) -> None:
-        """Combine point, cell or field data from the meshes onto a single mesh.
+    # second pass, populate the preallocated combined mesh
+    cells = {
+        getter: _combine_cells(meshes, getter, n_cells[getter], n_connectivity[getter])
+        for getter in getters
+    }
+    # the (destination, source, size) slices of each mesh point array
+    sizes = [mesh.n_points for mesh in meshes]
+    starts = np.cumsum([0, *sizes[:-1]])
+    point_slices = [
+        [(start, 0, size)] for start, size in zip(starts, sizes, strict=True)
+    ]
+    points = _combine_arrays([mesh.points for mesh in meshes], n_points, point_slices)
+
+    if merge:
+        start = time.perf_counter()
+        index, inverse, size = _merge_points(points, tolerance)
+        points = points[index]
+        for getter, (offsets, connectivity, counts) in cells.items():
+            cells[getter] = (offsets, inverse[connectivity], counts)
+        stats = [n_points, index.size, size, time.perf_counter() - start]
+
+    combined = pv.PolyData()
+    combined.points = points
+
+    for getter, (offsets, connectivity, _) in cells.items():
+        if n_cells[getter]:
+            setter = getattr(combined, f"S{getter[1:]}")
+            setter(as_cell_array(offsets, connectivity))
 
-        Parameters
-        ----------
-        names : set of str
-            The names of the point, cell or field data to be combined.
-        field : bool, optional
-            Whether the data is field data. Defaults to False.
+    if data:
+        # attach any common combined point data
+        for name in common_point_data:
+            arrays = [mesh.point_data[name] for mesh in meshes]
+            values = _combine_arrays(arrays, n_points, point_slices)
+            combined.point_data[name] = values[index] if merge else values
+
+        # the (destination, source, size) slices of each mesh cell array,
+        # with combined cells ordered by cell kind, as per the vtk cell ids
+        cell_slices = [[] for _ in meshes]
+        sources = np.zeros(len(meshes), dtype=int)
+        base = 0
+        for getter in getters:
+            counts = cells[getter][2]
+            starts = base + np.cumsum([0, *counts[:-1]])
+            for i, (start, size) in enumerate(zip(starts, counts, strict=True)):
+                cell_slices[i].append((start, sources[i], size))
+            sources += counts
+            base += n_cells[getter]
+
+        # attach any common combined cell data
+        for name in common_cell_data:
+            arrays = [mesh.cell_data[name] for mesh in meshes]
+            combined.cell_data[name] = _combine_arrays(
+                arrays, combined.n_cells, cell_slices
+            )
 
-        """
-        for name in names:
-            if field:
-                combined.field_data[name] = first[name]
-            else:
-                data = [mesh[name] for mesh in meshes]
-                combined[name] = (
-                    np.vstack(data) if data[0].ndim > 1 else np.hstack(data)
-                )
+        # attach any common field data from the first mesh
+        _combine_fields(combined, meshes, common_field_data)
 
-    if data:
-        # attach any common combined data
-        combine_data(common_point_data)
-        combine_data(common_cell_data)
-        combine_data(common_field_data, field=True)
         # determine a sensible active scalar array, by opting for the first
         # common active scalar array from the input meshes
         combined.active_scalars_name = None
@@ -468,6 +775,9 @@ def combine(
                 combined.set_active_scalars(info.name, preference=association)
                 break
 
+    if merge:
+        combined.field_data[GV_FIELD_MERGE] = np.array(stats, dtype=float)
+
     # remove degenerate points and faces
     if clean:
         combined.clean(inplace=True)
@@ -508,6 +818,12 @@ def resize(
     -----
     .. versionadded:: 0.1.0
 
+    A mesh that is not a point-cloud is resized by uniformly scaling its
+    points, based on its :func:`~geovista.common.distance` i.e., the
+    :data:`~geovista.common.GV_FIELD_RADIUS` of the mesh, if available. Only
+    point-clouds, which may have per-point z-levels, are resized via a round
+    trip through geographic coordinates.
+
     """
     if projected(mesh):
         emsg = "Cannot resize a mesh that has been projected."
@@ -545,33 +861,482 @@ def resize(
             )
     else:
         new_radius = radius + radius * zlevel * zscale
-        update = new_radius and not np.isclose(distance(mesh), new_radius)
+        old_radius = distance(mesh)
+        update = new_radius and not np.isclose(old_radius, new_radius)
 
     if update:
-        lonlat = from_cartesian(mesh)
-        if cloud:
-            zlevel += lonlat[:, 2]
-        xyz = to_cartesian(
-            lonlat[:, 0], lonlat[:, 1], radius=radius, zlevel=zlevel, zscale=zscale
-        )
         if not inplace:
             mesh = mesh.copy()
-        mesh.points = xyz
         if cloud:
+            # per-point z-levels require the lon/lat round trip
+            lonlat = from_cartesian(mesh)
+            zlevel += lonlat[:, 2]
+            points = to_cartesian(
+                lonlat[:, 0], lonlat[:, 1], radius=radius, zlevel=zlevel, zscale=zscale
+            )
             mesh.field_data[GV_FIELD_ZSCALE] = np.array([zscale])
         else:
+            # a change of radius is a uniform scaling of the spherical mesh
+            points = mesh.points * float(new_radius / old_radius)
             radius = new_radius
+        # replace, rather than write into, any points shared with other meshes
+        mesh.SetPoints(pv.vtk_points(points, deep=False))
         mesh.field_data[GV_FIELD_RADIUS] = np.array([radius])
 
     return mesh
 
 
+def _slice_data(
+    source: pv.PolyData,
+    target: pv.PolyData,
+    edges: tuple[np.ndarray, np.ndarray, np.ndarray],
+    parents: np.ndarray,
+) -> None:
+    """Transfer the data of the `source` mesh onto the sliced `target` mesh.
+
+    Each `target` point lies along an edge between two points of the `source`
+    mesh, or is coincident with a `source` point i.e., a degenerate edge. Floating
+    point data is linearly interpolated along the edge, otherwise the data of the
+    nearest edge end-point is used. Cell data is inherited from the parent cell.
+
+    Parameters
+    ----------
+    source : :class:`~pyvista.PolyData`
+        The mesh prior to slicing.
+    target : :class:`~pyvista.PolyData`
+        The sliced mesh.
+    edges : tuple of ndarray
+        The start and end `source` point indices of the edge of each `target`
+        point, and the parametric distance of the point along the edge.
+    parents : ndarray
+        The `source` cell index of each `target` cell.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    lo, hi, t = edges
+    nearest = np.where(t < 0.5, lo, hi)
+
+    for name in source.point_data:
+        data = np.asanyarray(source.point_data[name])
+        if np.issubdtype(data.dtype, np.floating):
+            weight = t.reshape(-1, *([1] * (data.ndim - 1)))
+            values = data[lo] + weight * (data[hi] - data[lo])
+        else:
+            values = data[nearest]
+        target.point_data[name] = values
+
+    for name in source.cell_data:
+        target.cell_data[name] = np.asanyarray(source.cell_data[name])[parents]
+
+    for name in source.field_data:
+        target.field_data[name] = copy.deepcopy(source.field_data[name])
+
+
+def _clip_cells(
+    cells: np.ndarray,
+    sign: np.ndarray,
+    crossing: np.ndarray,
+    west: tuple[np.ndarray, np.ndarray],
+    east: tuple[np.ndarray, np.ndarray],
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Clip bisected cells into their west and east pieces.
+
+    Each cell vertex is interleaved with the point of intersection of the
+    following edge, in winding order, and only those vertices west or east of the
+    plane, along with the points of intersection, are retained for each piece.
+
+    Parameters
+    ----------
+    cells : ndarray
+        The cell index of each connectivity entry, in ascending order.
+    sign : ndarray
+        The side of the plane of each vertex, positive west and negative east.
+    crossing : ndarray
+        Whether the edge from each vertex to the following vertex is bisected.
+    west : tuple of ndarray
+        The west point index of each vertex and its following edge intersection.
+    east : tuple of ndarray
+        The east point index of each vertex and its following edge intersection.
+
+    Returns
+    -------
+    list of tuple of ndarray
+        The number of vertices and the connectivity of the west and east pieces.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    _, pieces = np.unique(cells, return_inverse=True)
+    pieces = np.repeat(pieces, 2)
+    result = []
+
+    for (vertices, edges), keep in ((west, sign >= 0), (east, sign <= 0)):
+        mask = np.column_stack([keep, crossing]).ravel()
+        slots = np.column_stack([vertices, edges]).ravel()
+        result.append((np.bincount(pieces[mask]), slots[mask]))
+
+    return result
+
+
+def _slice_mapping(
+    source: pv.PolyData, target: pv.PolyData
+) -> tuple[tuple[np.ndarray, np.ndarray, np.ndarray], np.ndarray]:
+    """Determine the mapping of the sliced `target` mesh onto the `source` mesh.
+
+    A `target` point coincident with its original `source` point maps to itself.
+    Otherwise, the point was introduced by the slice, and maps onto the nearest
+    edge (or diagonal) between the points of its parent `source` cell.
+
+    Parameters
+    ----------
+    source : :class:`~pyvista.PolyData`
+        The mesh prior to slicing.
+    target : :class:`~pyvista.PolyData`
+        The sliced mesh.
+
+    Returns
+    -------
+    tuple
+        The start and end `source` point indices of the edge of each `target`
+        point, and the parametric distance of the point along the edge, followed
+        by the `source` cell index of each `target` cell.
+        Also see :func:`_slice_data`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    parents = np.array(target.cell_data[GV_CELL_IDS], dtype=int)
+    lo = np.array(target.point_data[GV_POINT_IDS], dtype=int)
+    valid = (lo >= 0) & (lo < source.n_points)
+    lo[~valid] = 0
+    hi = lo.copy()
+    t = np.zeros(target.n_points)
+    exact = valid & np.all(target.points == source.points[lo], axis=1)
+    todo = np.flatnonzero(~exact)
+
+    if todo.size:
+        owner = np.full(target.n_points, -1)
+        offsets = target._offset_array  # noqa: SLF001
+        owner[target._connectivity_array] = np.repeat(parents, np.diff(offsets))  # noqa: SLF001
+        todo = todo[owner[todo] >= 0]
+        cells = owner[todo]
+        offsets = source._offset_array  # noqa: SLF001
+        connectivity = source._connectivity_array  # noqa: SLF001
+        counts = np.diff(offsets)[cells]
+
+        for count in np.unique(counts):
+            # consider every vertex, edge and diagonal of the parent cells
+            i, j = np.triu_indices(count)
+            order = np.argsort(i != j, kind="stable")
+            i, j = i[order], j[order]
+            ids, where = todo[counts == count], cells[counts == count]
+            vertices = connectivity[offsets[where][:, np.newaxis] + np.arange(count)]
+            start = source.points[vertices[:, i]]
+            vector = source.points[vertices[:, j]] - start
+            delta = target.points[ids][:, np.newaxis] - start
+            length = np.einsum("ijk,ijk->ij", vector, vector)
+            length[length == 0] = 1
+            along = np.clip(np.einsum("ijk,ijk->ij", delta, vector) / length, 0, 1)
+            error = np.linalg.norm(delta - along[..., np.newaxis] * vector, axis=-1)
+            best = np.argmin(error, axis=1)
+            rows = np.arange(ids.size)
+            lo[ids] = vertices[rows, i[best]]
+            hi[ids] = vertices[rows, j[best]]
+            t[ids] = along[rows, best]
+
+    return (lo, hi, t), parents
+
+
+def _slice_cells_analytic(mesh: pv.PolyData, meridian: float) -> pv.PolyData:
+    """Cut a cell-based mesh along a `meridian` with a native NumPy slicer.
+
+    The meridian defines a half-plane through the z-axis, which allows each mesh
+    point to be classified west or east of the meridian by the sign of
+    ``x * sin(meridian) - y * cos(meridian)``. Only cells bisected by the meridian
+    are split, by clipping each cell against the plane, and the points of the seam
+    are marked with :data:`geovista.common.REMESH_SEAM` (west) or
+    :data:`geovista.filters.REMESH_SEAM_EAST` (east), as per
+    :func:`geovista.filters.remesh`.
+
+    Parameters
+    ----------
+    mesh : :class:`~pyvista.PolyData`
+        The mesh of polygon cells to be sliced along the `meridian`.
+    meridian : float
+        The wrapped meridian (degrees longitude) to slice along.
+
+    Returns
+    -------
+    :class:`~pyvista.PolyData`
+        The mesh with a seam along the meridian and split cells, if bisected.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if projected(mesh):
+        emsg = "Cannot slice a mesh that has been projected."
+        raise ValueError(emsg)
+
+    n_points, n_cells = mesh.n_points, mesh.n_cells
+    points = np.asarray(mesh.points, dtype=float)
+    offsets = mesh._offset_array  # noqa: SLF001
+    connectivity = mesh._connectivity_array  # noqa: SLF001
+    tolerance = CUT_OFFSET * distance(mesh)
+
+    # signed distance of each point from the meridian plane, positive west and
+    # negative east, and the signed distance along the meridian half-plane. the
+    # side of the plane is determined within an angular tolerance, other than for
+    # points on the polar axis
+    theta = np.radians(meridian)
+    side = points[:, 0] * np.sin(theta) - points[:, 1] * np.cos(theta)
+    ahead = points[:, 0] * np.cos(theta) + points[:, 1] * np.sin(theta)
+    axial = np.hypot(points[:, 0], points[:, 1])
+    pole = axial <= tolerance
+    sign = np.zeros(n_points, dtype=np.int8)
+    sign[~pole & (side > CUT_OFFSET * axial)] = 1
+    sign[~pole & (side < -CUT_OFFSET * axial)] = -1
+
+    # the vertex, cell and next vertex (edge end-point) for each connectivity entry
+    counts = np.diff(offsets)
+    cell_ids = np.repeat(np.arange(n_cells), counts)
+    following = np.arange(1, connectivity.size + 1)
+    following[offsets[1:][counts > 0] - 1] = offsets[:-1][counts > 0]
+    vertex, vertex_next = connectivity, connectivity[following]
+    vertex_sign = sign[vertex]
+
+    # points coincident with the meridian, rather than its anti-meridian or the poles
+    on = vertex_sign == 0
+    on_meridian = on & ~pole[vertex] & (ahead[vertex] > 0)
+    on_anti = on & ~pole[vertex] & (ahead[vertex] < 0)
+
+    # edges strictly crossing the plane, and whether the crossing is on the meridian
+    crossing = (vertex_sign * sign[vertex_next]) < 0
+    cross_ahead = np.zeros_like(crossing)
+    cross_behind = np.zeros_like(crossing)
+    if np.any(crossing):
+        lo, hi = vertex[crossing], vertex_next[crossing]
+        t = side[lo] / (side[lo] - side[hi])
+        where = ahead[lo] + t * (ahead[hi] - ahead[lo])
+        cross_ahead[crossing] = where > 0
+        cross_behind[crossing] = where < 0
+
+    def per_cell(mask: np.ndarray) -> np.ndarray:
+        """Determine the cells with at least one vertex or edge satisfying `mask`.
+
+        Parameters
+        ----------
+        mask : ndarray
+            The boolean mask for each connectivity entry.
+
+        Returns
+        -------
+        ndarray
+            The boolean mask for each cell.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        return np.bincount(cell_ids[mask], minlength=n_cells).astype(bool)
+
+    west = per_cell(vertex_sign > 0)
+    east = per_cell(vertex_sign < 0)
+    split = (
+        west
+        & east
+        & per_cell(on_meridian | cross_ahead)
+        & ~per_cell(on_anti | cross_behind)
+    )
+    touch = west & ~east & per_cell(on_meridian)
+
+    result: pv.PolyData = mesh.copy(deep=True)
+    result.cell_data[GV_CELL_IDS] = np.arange(n_cells)
+    result.point_data[GV_POINT_IDS] = np.arange(n_points)
+
+    if not np.any(split | touch):
+        # the meridian does not intersect the mesh
+        return result
+
+    # the west cells detach from the seam with their own copy of the seam points,
+    # and the east split cells also detach from any polar points, as the longitude
+    # of a polar point is unfolded per cell (see geovista.common.from_cartesian)
+    split_entry = split[cell_ids]
+    seam_entry = (split_entry | touch[cell_ids]) & on & ~on_anti
+    seam_ids = np.unique(vertex[seam_entry])
+    seam_map = np.arange(n_points)
+    seam_map[seam_ids] = n_points + np.arange(seam_ids.size)
+    pole_entry = split_entry & pole[vertex]
+    pole_ids = np.unique(vertex[pole_entry])
+    pole_map = np.arange(n_points)
+    pole_map[pole_ids] = n_points + seam_ids.size + np.arange(pole_ids.size)
+    copy_ids = np.concatenate([seam_ids, pole_ids])
+
+    # each bisected edge introduces a west and an east seam point, shared by the
+    # split cells either side of the edge
+    edge_entry = crossing & split_entry
+    lo = np.minimum(vertex[edge_entry], vertex_next[edge_entry]).astype(np.int64)
+    hi = np.maximum(vertex[edge_entry], vertex_next[edge_entry]).astype(np.int64)
+    edges, edge_inverse = np.unique(lo * n_points + hi, return_inverse=True)
+    lo, hi = np.divmod(edges, n_points)
+    t = side[lo] / (side[lo] - side[hi])
+    xyz = points[lo] + t[:, np.newaxis] * (points[hi] - points[lo])
+    # project the point of intersection onto the surface of the mesh
+    norm_lo, norm_hi = (np.linalg.norm(points[ids], axis=1) for ids in (lo, hi))
+    scale = (norm_lo + t * (norm_hi - norm_lo)) / np.linalg.norm(xyz, axis=1)
+    xyz *= scale[:, np.newaxis]
+    n_seam, n_edges = n_points + copy_ids.size, edges.size
+    edge_west = np.full(connectivity.size, -1)
+    edge_west[edge_entry] = n_seam + edge_inverse
+    edge_east = edge_west + n_edges
+
+    split_ids = np.flatnonzero(split)
+    split_vertex = vertex[split_entry]
+    (west_counts, west_conn), (east_counts, east_conn) = _clip_cells(
+        cell_ids[split_entry],
+        vertex_sign[split_entry],
+        edge_entry[split_entry],
+        west=(seam_map[split_vertex], edge_west[split_entry]),
+        east=(pole_map[split_vertex], edge_east[split_entry]),
+    )
+
+    # west cells touching the meridian are simply re-wired onto the west seam
+    keep_ids, touch_ids = np.flatnonzero(~(split | touch)), np.flatnonzero(touch)
+    keep_conn = connectivity[~(split_entry | touch[cell_ids])]
+    touch_conn = np.where(seam_entry, seam_map[vertex], vertex)[touch[cell_ids]]
+
+    parents = np.concatenate([keep_ids, touch_ids, split_ids, split_ids])
+    offsets = np.cumsum(
+        np.concatenate(
+            [[0], counts[keep_ids], counts[touch_ids], west_counts, east_counts]
+        )
+    )
+    connectivity = np.concatenate([keep_conn, touch_conn, west_conn, east_conn])
+    points = np.vstack([points, points[copy_ids], xyz, xyz])
+    sliced = pv.PolyData(points, faces=as_cell_array(offsets, connectivity))
+    ids = np.concatenate([np.arange(n_points), copy_ids])
+    edges = (
+        np.concatenate([ids, lo, lo]),
+        np.concatenate([ids, hi, hi]),
+        np.concatenate([np.zeros(ids.size), t, t]),
+    )
+    _slice_data(result, sliced, edges, parents)
+
+    remesh_ids = np.asanyarray(sliced.point_data[GV_POINT_IDS]).copy()
+    remesh_ids[n_points : n_points + seam_ids.size] = REMESH_SEAM
+    remesh_ids[n_points + seam_ids.size : n_seam] = REMESH_SEAM_EAST
+    remesh_ids[n_seam : n_seam + n_edges] = REMESH_SEAM
+    remesh_ids[n_seam + n_edges :] = REMESH_SEAM_EAST
+    sliced.point_data[GV_REMESH_POINT_IDS] = remesh_ids
+
+    return sliced
+
+
+def _slice_cells_cached(
+    mesh: pv.PolyData,
+    meridian: float,
+    rtol: float | None = None,
+    atol: float | None = None,
+    method: SliceMethod | None = None,
+) -> pv.PolyData:
+    """Cut a cell-based mesh along a `meridian`, reusing any cached slice topology.
+
+    The cache is keyed on a fingerprint of the `mesh` geometry and topology, along
+    with the `meridian`, tolerances and slicing engine. The point and cell data
+    of the `mesh` are transferred onto a copy of the cached sliced topology, see
+    :data:`SLICE_TOPOLOGY_CACHE`.
+
+    Parameters
+    ----------
+    mesh : :class:`~pyvista.PolyData`
+        The mesh to be sliced along the `meridian`.
+    meridian : float
+        The wrapped meridian (degrees longitude) to slice along.
+    rtol : float, optional
+        The relative tolerance for longitudes close to the 'wrap meridian' -
+        see :func:`geovista.common.wrap` for more.
+    atol : float, optional
+        The absolute tolerance for longitudes close to the 'wrap meridian' -
+        see :func:`geovista.common.wrap` for more.
+    method : SliceMethod, optional
+        The slicing engine, see :func:`slice_cells`.
+
+    Returns
+    -------
+    :class:`~pyvista.PolyData`
+        The mesh with a seam along the meridian and remeshed cells, if
+        bisected.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    key = fingerprint(mesh.points, mesh.faces, meridian, rtol, atol, str(method))
+    entry = SLICE_TOPOLOGY_CACHE.get(key)
+
+    if entry is None:
+        # the mapping requires positional ids, rather than any ids already
+        # inherited by the mesh e.g., from a previous slice or extraction
+        source = mesh.copy(deep=False)
+        source.cell_data[GV_CELL_IDS] = np.arange(mesh.n_cells)
+        source.point_data[GV_POINT_IDS] = np.arange(mesh.n_points)
+        result = slice_cells(
+            source, meridian=meridian, rtol=rtol, atol=atol, method=method, cache=False
+        )
+        # the cached topology is isolated from the result, which may be mutated
+        topology = pv.PolyData()
+        topology.copy_structure(result)
+        topology = topology.copy(deep=True)
+        if GV_REMESH_POINT_IDS in result.point_data:
+            topology.point_data[GV_REMESH_POINT_IDS] = np.array(
+                result.point_data[GV_REMESH_POINT_IDS]
+            )
+        edges, parents = _slice_mapping(source, result)
+        nbytes = topology.actual_memory_size * 1024
+        nbytes += sum(item.nbytes for item in (*edges, parents))
+        SLICE_TOPOLOGY_CACHE.put(key, (topology, edges, parents), nbytes=nbytes)
+        return result
+
+    topology, edges, parents = entry
+    info = mesh.active_scalars_info
+    result = pv.PolyData()
+    result.copy_structure(topology)
+    result = result.copy(deep=True)
+    _slice_data(mesh, result, edges, parents)
+
+    lo, hi, t = edges
+    result.cell_data[GV_CELL_IDS] = parents
+    result.point_data[GV_POINT_IDS] = np.where(t < 0.5, lo, hi)
+
+    if GV_REMESH_POINT_IDS in topology.point_data:
+        result.point_data[GV_REMESH_POINT_IDS] = np.array(
+            topology.point_data[GV_REMESH_POINT_IDS]
+        )
+
+    result.set_active_scalars(name=None)
+    result.set_active_scalars(info.name, preference=info.association.name.lower())
+
+    return result
+
+
 def slice_cells(
     mesh: pv.PolyData,
     meridian: float | None = None,
     antimeridian: bool | None = False,
     rtol: float | None = None,
     atol: float | None = None,
+    method: str | SliceMethod | None = None,
+    cache: bool | None = None,
 ) -> pv.PolyData:
     """Cut a cell-based mesh along a `meridian`, breaking cell connectivity.
 
@@ -593,10 +1358,27 @@ def slice_cells(
         Whether to flip the given `meridian` to use its anti-meridian instead.
     rtol : float, optional
         The relative tolerance for longitudes close to the 'wrap meridian' -
-        see :func:`geovista.common.wrap` for more.
+        see :func:`geovista.common.wrap` for more. Ignored by the ``analytic``
+        slicing engine.
     atol : float, optional
         The absolute tolerance for longitudes close to the 'wrap meridian' -
-        see :func:`geovista.common.wrap` for more.
+        see :func:`geovista.common.wrap` for more. Ignored by the ``analytic``
+        slicing engine.
+    method : str or SliceMethod, optional
+        The slicing engine, either ``vtk`` to remesh bisected cells with
+        :func:`geovista.filters.remesh`, or ``analytic`` to split bisected
+        cells natively with NumPy. The ``analytic`` engine classifies points
+        either side of the meridian plane within a fixed angular tolerance of
+        :data:`CUT_OFFSET`. Meshes containing vertex or triangle strip
+        cells are always sliced with ``vtk``. Also see :class:`SliceMethod`.
+        Defaults to :data:`SLICE_METHOD`.
+    cache : bool, optional
+        Whether to reuse the sliced topology from the
+        :data:`SLICE_TOPOLOGY_CACHE`, given identical geometry, connectivity,
+        `meridian`, tolerances and `method`. The data of the `mesh` is then
+        transferred onto the cached seam without re-slicing. Meshes containing
+        vertex or triangle strip cells are never cached. Defaults to
+        :data:`SLICE_CACHE`.
 
     Returns
     -------
@@ -613,6 +1395,16 @@ def slice_cells(
         emsg = f"Require a {str(pv.PolyData)!r} mesh, got {str(type(mesh))!r}."
         raise TypeError(emsg)
 
+    if method is None:
+        method = SLICE_METHOD
+
+    if not SliceMethod.valid(method):
+        options = " or ".join(f"{item!r}" for item in SliceMethod.values())
+        emsg = f"Expected a method of {options}, got '{method}'."
+        raise ValueError(emsg)
+
+    method = SliceMethod(method)
+
     if point_cloud(mesh) or mesh.n_lines:
         # no cell remeshing required for a point-cloud or line mesh
         return mesh
@@ -625,6 +1417,21 @@ def slice_cells(
 
     meridian = wrap(meridian)[0]
 
+    if cache is None:
+        cache = SLICE_CACHE
+
+    polygonal = not (mesh.n_verts or mesh.n_strips)
+
+    if cache and polygonal:
+        return _slice_cells_cached(mesh, meridian, rtol=rtol, atol=atol, method=method)
+
+    if method == SliceMethod.ANALYTIC and polygonal:
+        info = mesh.active_scalars_info
+        result = _slice_cells_analytic(mesh, meridian)
+        result.set_active_scalars(name=None)
+        result.set_active_scalars(info.name, preference=info.association.name.lower())
+        return result
+
     info = mesh.active_scalars_info
     slicer = MeridianSlice(mesh, meridian)
     mesh_whole = slicer.extract(split_cells=False)
@@ -661,15 +1468,7 @@ def slice_cells(
         cids = cids.difference(set(remeshed_ids))
         if cids:
             neighbours = cast(result.extract_cells(list(cids)))
-            xy0 = from_cartesian(neighbours)
-            neighbours.points = xy0
-            xdelta = []
-            for cid in range(neighbours.n_cells):
-                # NOTE: pyvista 0.38.0: cell_points(cid) -> get_cell(cid).points
-                cxpts = neighbours.get_cell(cid).points[:, 0]
-                cxmin, cxmax = cxpts.min(), cxpts.max()
-                xdelta.append(cxmax - cxmin)
-            xdelta = np.array(xdelta)
+            xdelta = cell_lon_span(neighbours)
             bad = np.where(xdelta > 270)[0]
             if bad.size:
                 bad_cids = np.unique(neighbours[GV_CELL_IDS][bad])
@@ -878,6 +1677,8 @@ def slice_mesh(
     mesh: pv.PolyData,
     rtol: float | None = None,
     atol: float | None = None,
+    method: str | SliceMethod | None = None,
+    cache: bool | None = None,
 ) -> pv.PolyData:
     """Cut a mesh along the Antimeridian, breaking connectivities.
 
@@ -898,6 +1699,12 @@ def slice_mesh(
     atol : float, optional
         The absolute tolerance for longitudes close to the 'wrap meridian' -
         see :func:`geovista.common.wrap` for more.
+    method : str or SliceMethod, optional
+        The engine used to slice a cell-based mesh, see :func:`slice_cells`.
+        Defaults to :data:`SLICE_METHOD`.
+    cache : bool, optional
+        Whether to reuse the cached topology of a sliced cell-based mesh, see
+        :func:`slice_cells`. Defaults to :data:`SLICE_CACHE`.
 
     Returns
     -------
@@ -916,6 +1723,13 @@ def slice_mesh(
     if mesh.n_lines:
         result = slice_lines(mesh, copy=True)
     else:
-        result = slice_cells(mesh, antimeridian=True, rtol=rtol, atol=atol)
+        result = slice_cells(
+            mesh,
+            antimeridian=True,
+            rtol=rtol,
+            atol=atol,
+            method=method,
+            cache=cache,
+        )
 
     return result
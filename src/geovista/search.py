@@ -16,10 +16,11 @@ from __future__ import annotations
 from collections.abc import Iterable
 from enum import StrEnum
 from typing import TYPE_CHECKING
+import weakref
 
 import lazy_loader as lazy
 
-from .common import MixinStrEnum, to_cartesian
+from .common import LRUCache, MixinStrEnum, to_cartesian
 from .crs import WGS84, from_wkt
 from .transform import transform_points
 
@@ -35,22 +36,31 @@ if TYPE_CHECKING:
     # type aliases
     CellIDs = list[int]
     CellIDLike = int | CellIDs
+    Adjacency = tuple[np.ndarray, np.ndarray]
 
 # lazy import third-party dependencies
 np = lazy.load("numpy")
+pv = lazy.load("pyvista")
 
 __all__ = [
+    "ADJACENCY_CACHE_SIZE",
     "KDTREE_EPSILON",
     "KDTREE_K",
     "KDTREE_LEAF_SIZE",
     "KDTREE_PREFERENCE",
     "KDTree",
+    "NEIGHBOUR_PREFERENCE",
     "NearestNeighbours",
+    "NeighbourPreference",
     "SearchPreference",
     "find_cell_neighbours",
     "find_nearest_cell",
+    "point_cell_adjacency",
 ]
 
+ADJACENCY_CACHE_SIZE: int = 8
+"""The maximum number of meshes with a cached point-to-cell adjacency index."""
+
 KDTREE_EPSILON: float = 0.0
 """The default kd-tree nearest neighbour epsilon."""
 
@@ -63,6 +73,25 @@ KDTREE_LEAF_SIZE: int = 16
 KDTREE_PREFERENCE: str = "point"
 """The default search preference."""
 
+NEIGHBOUR_PREFERENCE: str = "vertex"
+"""The default cell neighbourhood preference."""
+
+# registry of point-to-cell adjacency indices, keyed by mesh identity
+_ADJACENCY_CACHE: LRUCache = LRUCache(ADJACENCY_CACHE_SIZE)
+
+
+class NeighbourPreference(MixinStrEnum, StrEnum):
+    """Enumeration of cell neighbourhood preferences.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+
+    EDGE = "edge"
+    VERTEX = "vertex"
+
 
 class SearchPreference(MixinStrEnum, StrEnum):
     """Enumeration of mesh geometry search preferences.
@@ -315,11 +344,137 @@ class KDTree:  # numpydoc ignore=PR01
         )
 
 
-def find_cell_neighbours(mesh: pv.PolyData, cid: CellIDLike) -> CellIDs:
+def _cell_arrays(mesh: pv.DataSet) -> tuple[np.ndarray, np.ndarray]:
+    """Get the cell offsets and connectivity arrays of the `mesh`.
+
+    Parameters
+    ----------
+    mesh : DataSet
+        The mesh defining the cells.
+
+    Returns
+    -------
+    tuple of ndarray
+        The ``(n_cells + 1,)`` offsets and the connectivity arrays.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(mesh, pv.PolyData) and mesh.n_cells == mesh.n_faces_strict:
+        offsets = mesh._offset_array  # noqa: SLF001
+        connectivity = mesh._connectivity_array  # noqa: SLF001
+    else:
+        if not isinstance(mesh, pv.UnstructuredGrid):
+            mesh = mesh.cast_to_unstructured_grid()
+        offsets, connectivity = mesh.offset, mesh.cell_connectivity
+
+    return offsets, connectivity
+
+
+def _gather(indptr: np.ndarray, indices: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Gather the compressed sparse row `indices` of the `rows`.
+
+    Parameters
+    ----------
+    indptr : ndarray
+        The compressed sparse row index pointer array.
+    indices : ndarray
+        The compressed sparse row indices array.
+    rows : ndarray
+        The rows to gather.
+
+    Returns
+    -------
+    ndarray
+        The concatenated indices of the `rows`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    starts = indptr[rows]
+    counts = indptr[rows + 1] - starts
+    total = np.sum(counts)
+
+    if total == 0:
+        return np.array([], dtype=indices.dtype)
+
+    # offset of each gathered index relative to the start of its row
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+
+    return indices[shift + np.arange(total)]
+
+
+def point_cell_adjacency(mesh: pv.DataSet) -> Adjacency:
+    """Build the point-to-cell adjacency index of the `mesh`.
+
+    The adjacency index is in compressed sparse row (CSR) format, such that
+    the cells sharing point ``pid`` are ``indices[indptr[pid]:indptr[pid + 1]]``.
+
+    The index is cached for the `mesh`, and is rebuilt only when the cells or
+    the number of points of the `mesh` change.
+
+    Parameters
+    ----------
+    mesh : DataSet
+        The mesh defining the points and cells.
+
+    Returns
+    -------
+    tuple of ndarray
+        The ``(n_points + 1,)`` index pointer array, and the indices array
+        of cells sharing each point.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    offsets, connectivity = _cell_arrays(mesh)
+    if isinstance(mesh, pv.PolyData):
+        # the modified time of the cells, which excludes any changes to the data
+        cells = (mesh.GetVerts(), mesh.GetLines(), mesh.GetPolys(), mesh.GetStrips())
+        mtime = max(item.GetMTime() for item in cells)
+    else:
+        mtime = mesh.GetMTime()
+    signature = (mtime, mesh.n_points, mesh.n_cells)
+    key = id(mesh)
+
+    entry = _ADJACENCY_CACHE.get(key)
+    if entry is not None:
+        ref, cached_signature, adjacency = entry
+        if ref() is mesh and cached_signature == signature:
+            return adjacency
+
+    cids = np.repeat(np.arange(offsets.size - 1), np.diff(offsets))
+    order = np.argsort(connectivity, kind="stable")
+    indices = cids[order]
+    indptr = np.zeros(mesh.n_points + 1, dtype=offsets.dtype)
+    np.cumsum(np.bincount(connectivity, minlength=mesh.n_points), out=indptr[1:])
+    adjacency = (indptr, indices)
+
+    try:
+        ref = weakref.ref(mesh)
+    except TypeError:
+        pass
+    else:
+        _ADJACENCY_CACHE.put(key, (ref, signature, adjacency))
+
+    return adjacency
+
+
+def find_cell_neighbours(
+    mesh: pv.PolyData,
+    cid: CellIDLike,
+    preference: str | NeighbourPreference | None = None,
+) -> CellIDs:
     """Find all the cells neighbouring the given `cid` cell/s of the `mesh`.
 
     A cell is deemed to neighbour a `cid` cell if it shares at least one
-    vertex.
+    vertex, or at least one edge, depending on the `preference`.
 
     Parameters
     ----------
@@ -328,6 +483,10 @@ def find_cell_neighbours(mesh: pv.PolyData, cid: CellIDLike) -> CellIDs:
     cid : int or list of int
         The offset of the cell/s in the `mesh` that is/are the focus of the
         neighbourhood.
+    preference : str or NeighbourPreference, optional
+        Find the neighbouring cells that share a ``vertex`` or an ``edge``
+        with the `cid` cell/s. Also see :class:`NeighbourPreference`.
+        Defaults to :data:`NEIGHBOUR_PREFERENCE`.
 
     Returns
     -------
@@ -339,22 +498,68 @@ def find_cell_neighbours(mesh: pv.PolyData, cid: CellIDLike) -> CellIDs:
     .. versionadded:: 0.1.0
 
     """
+    if preference is None:
+        preference = NEIGHBOUR_PREFERENCE
+
+    if not NeighbourPreference.valid(preference):
+        options = " or ".join(f"{item!r}" for item in NeighbourPreference.values())
+        emsg = f"Expected a preference of {options}, got '{preference}'."
+        raise ValueError(emsg)
+
+    preference = NeighbourPreference(preference)
+
     if not isinstance(cid, Iterable):
         cid = [cid]
 
-    pids = []
-    for idx in cid:
-        # NOTE: pyvista 0.38.0: cell_point_ids(idx) -> get_cell(idx).point_ids
-        pids.extend(mesh.get_cell(idx).point_ids)
+    cid = np.unique(np.asanyarray(cid, dtype=int))
 
-    # determine the unique points
-    pids = np.unique(list(pids))
+    if cid.size == 0:
+        return []
+
+    offsets, connectivity = _cell_arrays(mesh)
+    indptr, indices = point_cell_adjacency(mesh)
+    # CSR cell-to-point gather of the cid cell/s
+    pids = _gather(offsets, connectivity, cid)
     # get the cell-ids of cells containing at least one common point
-    result = set(mesh.extract_points(pids)["vtkOriginalCellIds"])
+    result = np.unique(_gather(indptr, indices, np.unique(pids)))
     # remove the original cell/s
-    result -= set(cid)
-
-    return sorted(result)
+    result = np.setdiff1d(result, cid, assume_unique=True)
+
+    if preference == NeighbourPreference.EDGE and result.size:
+
+        def edges(cids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            """Encode the undirected edges of the cells as unique integers.
+
+            Parameters
+            ----------
+            cids : ndarray
+                The cells.
+
+            Returns
+            -------
+            tuple of ndarray
+                The encoded edges of each cell, and the owning cell of each edge.
+
+            Notes
+            -----
+            .. versionadded:: 0.6.0
+
+            """
+            counts = offsets[cids + 1] - offsets[cids]
+            start = _gather(offsets, connectivity, cids)
+            # the next vertex of each cell vertex, wrapping to the first vertex
+            position = np.arange(start.size)
+            first = np.repeat(np.cumsum(counts) - counts, counts)
+            last = np.repeat(np.cumsum(counts) - 1, counts)
+            end = start[np.where(position == last, first, position + 1)]
+            lo, hi = np.minimum(start, end), np.maximum(start, end)
+            return lo.astype(np.int64) * mesh.n_points + hi, np.repeat(cids, counts)
+
+        cid_edges, _ = edges(cid)
+        candidate_edges, owners = edges(result)
+        result = np.unique(owners[np.isin(candidate_edges, cid_edges)])
+
+    return result.tolist()
 
 
 def find_nearest_cell(
@@ -13,12 +13,19 @@ Notes
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from typing import TYPE_CHECKING
 
 import lazy_loader as lazy
 
-from .common import GV_FIELD_ZSCALE, ZLEVEL_SCALE, from_cartesian, point_cloud
+from .common import (
+    GV_FIELD_ZSCALE,
+    ZLEVEL_SCALE,
+    LRUCache,
+    from_cartesian,
+    point_cloud,
+)
 from .crs import (
     WGS84,
     CRSLike,
@@ -29,6 +36,8 @@ from .crs import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from numpy.typing import ArrayLike
     import pyvista as pv
 
@@ -37,11 +46,140 @@ np = lazy.load("numpy")
 pyproj = lazy.load("pyproj")
 
 __all__ = [
+    "CRS_CACHE",
+    "TRANSFORMER_CACHE",
+    "TRANSFORM_CACHE_SIZE",
+    "TRANSFORM_CHUNK_SIZE",
+    "TRANSFORM_WORKERS",
     "transform_mesh",
     "transform_point",
     "transform_points",
 ]
 
+# constants
+TRANSFORM_CACHE_SIZE: int = 64
+"""The maximum number of cached CRSs and cached CRS transformers."""
+
+CRS_CACHE: LRUCache = LRUCache(TRANSFORM_CACHE_SIZE)
+"""The least-recently-used cache of CRSs created from user input."""
+
+TRANSFORMER_CACHE: LRUCache = LRUCache(TRANSFORM_CACHE_SIZE)
+"""The least-recently-used cache of CRS transformers."""
+
+TRANSFORM_CHUNK_SIZE: int = 2**20
+"""The maximum number of spatial points transformed per chunk."""
+
+TRANSFORM_WORKERS: int | None = None
+"""The number of threads transforming chunks of spatial points concurrently."""
+
+
+def _crs_key(crs: CRSLike) -> Hashable:
+    """Generate a cache key for the provided CRS user input.
+
+    Parameters
+    ----------
+    crs : CRSLike
+        The coordinate reference system (CRS), or anything accepted by
+        :meth:`pyproj.crs.CRS.from_user_input`.
+
+    Returns
+    -------
+    Hashable
+        The cache key of the CRS user input.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(crs, pyproj.CRS):
+        result = ("wkt", crs.to_wkt())
+    else:
+        try:
+            hash(crs)
+            result = (type(crs).__name__, crs)
+        except TypeError:
+            result = (type(crs).__name__, repr(crs))
+
+    return result
+
+
+def _from_user_input(crs: CRSLike) -> pyproj.CRS:
+    """Create the CRS from user input, reusing a cached CRS when available.
+
+    Parameters
+    ----------
+    crs : CRSLike
+        The coordinate reference system (CRS), or anything accepted by
+        :meth:`pyproj.crs.CRS.from_user_input`.
+
+    Returns
+    -------
+    CRS
+        The cached or newly created :class:`~pyproj.crs.CRS`.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    if isinstance(crs, pyproj.CRS):
+        return crs
+
+    key = _crs_key(crs)
+
+    if (result := CRS_CACHE.get(key)) is None:
+        result = pyproj.CRS.from_user_input(crs)
+        CRS_CACHE.put(key, result)
+
+    return result
+
+
+def _from_crs(
+    src_crs: CRSLike, tgt_crs: CRSLike, *, always_xy: bool = True
+) -> pyproj.Transformer | None:
+    """Create the CRS transformer, reusing a cached transformer when available.
+
+    Parameters
+    ----------
+    src_crs : CRSLike
+        The source coordinate reference system (CRS) of the transformation.
+        May be anything accepted by :meth:`pyproj.crs.CRS.from_user_input`.
+    tgt_crs : CRSLike
+        The target coordinate reference system (CRS) of the transformation.
+        May be anything accepted by :meth:`pyproj.crs.CRS.from_user_input`.
+    always_xy : bool, default=True
+        Whether the transformer accepts and returns the traditional GIS order
+        of longitude and latitude, or easting and northing.
+
+    Returns
+    -------
+    Transformer
+        The cached or newly created :class:`~pyproj.transformer.Transformer`,
+        or ``None`` if the source and target CRSs are equivalent.
+
+    Notes
+    -----
+    .. versionadded:: 0.6.0
+
+    """
+    src_crs, tgt_crs = _from_user_input(src_crs), _from_user_input(tgt_crs)
+    key = (src_crs.to_wkt(), tgt_crs.to_wkt(), bool(always_xy))
+
+    if (cached := TRANSFORMER_CACHE.get(key)) is None:
+        transformer = None
+
+        if src_crs != tgt_crs:
+            transformer = pyproj.Transformer.from_crs(
+                src_crs, tgt_crs, always_xy=always_xy
+            )
+
+        # wrap the transformer, as a cached value of None denotes a miss
+        cached = (transformer,)
+        TRANSFORMER_CACHE.put(key, cached)
+
+    return cached[0]
+
 
 def transform_mesh(
     mesh: pv.PolyData,
@@ -103,7 +241,7 @@ def transform_mesh(
         raise ValueError(emsg)
 
     # sanity check the target crs
-    tgt_crs = pyproj.CRS.from_user_input(tgt_crs)
+    tgt_crs = _from_user_input(tgt_crs)
 
     original_tgt_crs = deepcopy(tgt_crs)
     transform_required = src_crs != tgt_crs
@@ -243,6 +381,8 @@ def transform_points(
     ys: ArrayLike,
     zs: ArrayLike | None = None,
     trap: bool | None = True,
+    chunk_size: int | None = None,
+    workers: int | None = None,
 ) -> ArrayLike:
     """Transform the spatial points from the source to the target CRS.
 
@@ -272,6 +412,21 @@ def transform_points(
         Raise an exception if an error occurs during CRS transformation
         of the spatial points. Otherwise, ``inf`` will be returned for
         erroneous points.
+    chunk_size : int, optional
+        The maximum number of spatial points transformed per chunk. Spatial
+        points exceeding the `chunk_size` are transformed in chunks, which are
+        written directly into the result. Defaults to
+        :data:`TRANSFORM_CHUNK_SIZE`.
+
+        .. versionadded:: 0.6.0
+    workers : int, optional
+        The number of threads concurrently transforming chunks of spatial
+        points. Each thread uses its own underlying PROJ transformation
+        object. A single worker transforms the chunks serially. Defaults to
+        :data:`TRANSFORM_WORKERS`, otherwise the
+        :class:`~concurrent.futures.ThreadPoolExecutor` default.
+
+        .. versionadded:: 0.6.0
 
     Returns
     -------
@@ -292,9 +447,25 @@ def transform_points(
     if zs is not None:
         zs = np.atleast_1d(zs)
 
-    # sanity check the crs's
-    src_crs = pyproj.CRS.from_user_input(src_crs)
-    tgt_crs = pyproj.CRS.from_user_input(tgt_crs)
+    # sanity check the crs's, and fetch the transformer
+    transformer = _from_crs(src_crs, tgt_crs, always_xy=True)
+
+    if chunk_size is None:
+        chunk_size = TRANSFORM_CHUNK_SIZE
+
+    if workers is None:
+        workers = TRANSFORM_WORKERS
+
+    if chunk_size < 1:
+        emsg = (
+            "Cannot transform points, 'chunk_size' must be positive, "
+            f"got {chunk_size}."
+        )
+        raise ValueError(emsg)
+
+    if workers is not None and workers < 1:
+        emsg = f"Cannot transform points, 'workers' must be positive, got {workers}."
+        raise ValueError(emsg)
 
     # sanity check spatial arrays
     if (xndim := xs.ndim) > 2 or (yndim := ys.ndim) > 2:
@@ -304,10 +475,10 @@ def transform_points(
     shape = list(xs.shape)
 
     if xndim != 1:
-        xs = xs.flatten()
+        xs = xs.ravel()
 
     if yndim != 1:
-        ys = ys.flatten()
+        ys = ys.ravel()
 
     if xs.size != ys.size:
         emsg = (
@@ -322,7 +493,7 @@ def transform_points(
             raise ValueError(emsg)
 
         if zndim != 1:
-            zs = zs.flatten()
+            zs = zs.ravel()
 
         if zs.size != xs.size:
             emsg = (
@@ -362,12 +533,45 @@ def transform_points(
             xs.shape == ys.shape == zs.shape
         ), "Cannot combine points, non-uniform shapes."
 
-        return np.vstack([xs, ys, zs]).T
+        result = np.empty((xs.size, 3), dtype=np.result_type(xs, ys, zs))
+        result[:, 0], result[:, 1], result[:, 2] = xs, ys, zs
+
+        return result
 
-    if src_crs == tgt_crs:
+    def transform_chunk(start: int) -> None:
+        """Transform a chunk of the points directly into the preallocated result.
+
+        Parameters
+        ----------
+        start : int
+            The index of the first point in the chunk.
+
+        Notes
+        -----
+        .. versionadded:: 0.6.0
+
+        """
+        chunk = slice(start, start + chunk_size)
+        transformed = transformer.transform(
+            xs[chunk], ys[chunk], None if zs is None else zs[chunk], errcheck=trap
+        )
+        result[chunk, 0], result[chunk, 1] = transformed[0], transformed[1]
+        result[chunk, 2] = 0 if zs is None else transformed[2]
+
+    if transformer is None:
         result = combine(xs, ys, zs)
+    elif xs.size > chunk_size:
+        result = np.empty((xs.size, 3), dtype=float)
+        starts = range(0, xs.size, chunk_size)
+
+        if workers == 1:
+            for start in starts:
+                transform_chunk(start)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # consume the results to propagate any exceptions
+                _ = list(executor.map(transform_chunk, starts))
     else:
-        transformer = pyproj.Transformer.from_crs(src_crs, tgt_crs, always_xy=True)
         if xs.size == 1:
             # unpack to avoid "conversion of an array with ndim > 0 to a scalar"
             # deprecation (numpy 1.25)
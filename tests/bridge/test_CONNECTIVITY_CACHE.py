@@ -0,0 +1,102 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :data:`geovista.bridge.CONNECTIVITY_CACHE`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+from geovista.bridge import CONNECTIVITY_CACHE, Transform
+
+pytestmark = pytest.mark.parametrize(
+    "_purge", [(CONNECTIVITY_CACHE,)], ids=["CONNECTIVITY_CACHE"], indirect=True
+)
+
+
+def test_m1n1():
+    """Test the anti-clockwise connectivity of quad-mesh faces from node shape."""
+    result = Transform._create_connectivity_m1n1((3, 4))
+    expected = [
+        [4, 5, 1, 0],
+        [5, 6, 2, 1],
+        [6, 7, 3, 2],
+        [8, 9, 5, 4],
+        [9, 10, 6, 5],
+        [10, 11, 7, 6],
+    ]
+    assert_array_equal(result, expected)
+    assert not result.flags.writeable
+
+
+def test_mn4():
+    """Test the connectivity of quad-mesh faces from face shape."""
+    result = Transform._create_connectivity_mn4((2, 3))
+    assert_array_equal(result, np.arange(24).reshape(-1, 4))
+    assert not result.flags.writeable
+
+
+def test_offsets():
+    """Test the face offsets for a fixed number of face vertices."""
+    result = Transform._create_offsets(3, 4)
+    assert_array_equal(result, [0, 4, 8, 12])
+    assert not result.flags.writeable
+    assert Transform._create_offsets(3, 4) is result
+
+
+@pytest.mark.parametrize(
+    "method", ["_create_connectivity_m1n1", "_create_connectivity_mn4"]
+)
+def test_hit(method):
+    """Test the connectivity is reused for the same shape and layout."""
+    func = getattr(Transform, method)
+    result = func((3, 4))
+    assert func((3, 4)) is result
+    assert func((4, 3)) is not result
+    info = CONNECTIVITY_CACHE.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+
+
+def test_layout():
+    """Test the connectivity is cached by layout."""
+    m1n1 = Transform._create_connectivity_m1n1((3, 4))
+    mn4 = Transform._create_connectivity_mn4((3, 4))
+    assert m1n1.shape != mn4.shape
+    assert CONNECTIVITY_CACHE.cache_info().hits == 0
+
+
+def test_from_2d(grid):
+    """Test quad-meshes of the same shape share the cached faces."""
+    mesh1 = Transform.from_2d(*np.meshgrid(*grid))
+    mesh2 = Transform.from_2d(*np.meshgrid(*grid))
+    assert CONNECTIVITY_CACHE.cache_info().hits == 2
+    assert_array_equal(mesh1.faces, mesh2.faces)
+    assert mesh1.n_cells == 36 * 18
+    assert_array_equal(mesh1.faces[:5], [4, 37, 38, 1, 0])
+    assert not np.shares_memory(
+        mesh1.GetPolys().connectivity_array, mesh2.GetPolys().connectivity_array
+    )
+
+
+def test_from_2d__isolated(grid):
+    """Test mutating the faces of a quad-mesh does not corrupt other meshes."""
+    mesh1 = Transform.from_2d(*np.meshgrid(*grid))
+    expected = mesh1.faces.copy()
+    mesh1.GetPolys().ReverseCell(0)
+    mesh2 = Transform.from_2d(*np.meshgrid(*grid))
+    assert CONNECTIVITY_CACHE.cache_info().hits == 2
+    assert_array_equal(mesh2.faces, expected)
+    assert_array_equal(mesh1.faces[:5], [4, 0, 1, 38, 37])
+
+
+def test_isolated(grid):
+    """Test mutating the provided connectivity does not corrupt the mesh."""
+    connectivity = np.arange(20).reshape(-1, 4)
+    mesh = Transform.from_unstructured(*np.meshgrid(*grid), connectivity=connectivity)
+    connectivity[:] = 0
+    assert_array_equal(mesh.regular_faces, np.arange(20).reshape(-1, 4))
@@ -0,0 +1,92 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :data:`geovista.bridge.TOPOLOGY_CACHE`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+from geovista.bridge import NAME_CELLS, TOPOLOGY_CACHE, Transform
+from geovista.common import GV_FIELD_RADIUS
+from geovista.core import resize
+
+N_CELLS: int = 36 * 18
+
+pytestmark = pytest.mark.parametrize(
+    "_purge", [(TOPOLOGY_CACHE,)], ids=["TOPOLOGY_CACHE"], indirect=True
+)
+
+
+def test_default_disabled(grid):
+    """Test topology is not cached by default."""
+    _ = Transform.from_1d(*grid)
+    assert len(TOPOLOGY_CACHE) == 0
+
+
+def test_hit(grid):
+    """Test topology is reused for identical geometry."""
+    data = np.arange(N_CELLS)
+    mesh1 = Transform.from_1d(*grid, data=data, cache=True)
+    mesh2 = Transform.from_1d(*grid, data=data[::-1], cache=True)
+    info = TOPOLOGY_CACHE.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+    assert mesh1 is not mesh2
+    assert np.shares_memory(mesh1.points, mesh2.points)
+    assert_array_equal(mesh1.faces, mesh2.faces)
+    assert_array_equal(mesh1[NAME_CELLS], data)
+    assert_array_equal(mesh2[NAME_CELLS], data[::-1])
+
+
+def test_isolated(grid):
+    """Test mutating the data of a mesh does not corrupt the cached topology."""
+    mesh = Transform.from_1d(*grid, data=np.arange(N_CELLS), cache=True)
+    expected = mesh.points.copy()
+    mesh.point_data["pids"] = np.arange(mesh.n_points)
+    mesh.field_data["extra"] = np.array([1])
+    _ = resize(mesh, radius=2, inplace=True)
+    result = Transform.from_1d(*grid, cache=True)
+    assert TOPOLOGY_CACHE.cache_info().hits == 1
+    assert_array_equal(result.points, expected)
+    assert not result.point_data
+    assert not result.cell_data
+    assert "extra" not in result.field_data
+    assert result[GV_FIELD_RADIUS] == mesh[GV_FIELD_RADIUS] / 2
+
+
+def test_parity(grid):
+    """Test cached mesh is identical to a non-cached mesh."""
+    expected = Transform.from_1d(*grid, radius=2)
+    _ = Transform.from_1d(*grid, radius=2, cache=True)
+    result = Transform.from_1d(*grid, radius=2, cache=True)
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result.faces, expected.faces)
+    assert set(result.field_data.keys()) == set(expected.field_data.keys())
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"radius": 2},
+        {"zlevel": 1},
+        {"zscale": 0.1},
+        {"crs": "EPSG:4087"},
+        {"dtype": "float32"},
+    ],
+)
+def test_miss(grid, kwargs):
+    """Test topology is not reused for different mesh metadata."""
+    xs, ys = grid
+    if "crs" in kwargs:
+        xs, ys = xs * 1e5, ys * 1e5
+    _ = Transform.from_1d(xs, ys, cache=True)
+    _ = Transform.from_1d(xs, ys, cache=True, **kwargs)
+    info = TOPOLOGY_CACHE.cache_info()
+    assert info.hits == 0
+    assert info.currsize == 2
@@ -0,0 +1,76 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.Transform.__call__`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy import ma
+import pytest
+
+from geovista.bridge import NAME_CELLS, Transform
+from geovista.common import GV_FIELD_CRS, GV_FIELD_RADIUS
+
+N_CELLS: int = 72
+
+
+@pytest.fixture
+def factory():
+    """Fixture to provide a mesh factory."""
+    xs = np.linspace(-180, 180, num=13)
+    ys = np.linspace(-90, 90, num=7)
+    return Transform(xs, ys)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_zero_copy(factory, dtype):
+    """Test contiguous data is attached without a copy."""
+    data = np.arange(N_CELLS, dtype=dtype)
+    mesh = factory(data)
+    assert np.shares_memory(mesh[NAME_CELLS], data)
+
+
+def test_masked_no_mask(factory):
+    """Test masked data without masked values is attached without a copy."""
+    data = ma.arange(N_CELLS, dtype=float)
+    mesh = factory(data)
+    assert np.shares_memory(mesh[NAME_CELLS], ma.getdata(data))
+    assert not np.any(np.isnan(mesh[NAME_CELLS]))
+
+
+def test_masked(factory):
+    """Test masked values are filled with NaNs."""
+    data = ma.arange(N_CELLS, dtype=float)
+    data[:2] = ma.masked
+    mesh = factory(data)
+    assert np.sum(np.isnan(mesh[NAME_CELLS])) == 2
+    assert not np.any(np.isnan(ma.getdata(data)))
+
+
+def test_non_native(factory):
+    """Test non-native byte order data is converted."""
+    dtype = np.dtype(float).newbyteorder("S")
+    data = np.arange(N_CELLS).astype(dtype)
+    mesh = factory(data)
+    assert mesh[NAME_CELLS].dtype.isnative
+    np.testing.assert_array_equal(mesh[NAME_CELLS], data)
+
+
+@pytest.mark.parametrize("share_geometry", [False, True])
+def test_share_geometry(factory, share_geometry):
+    """Test meshes optionally share the same geometry."""
+    mesh1 = factory(share_geometry=share_geometry)
+    mesh2 = factory(share_geometry=share_geometry)
+    assert np.shares_memory(mesh1.points, mesh2.points) is share_geometry
+    np.testing.assert_array_equal(mesh1.faces, mesh2.faces)
+
+
+@pytest.mark.parametrize("share_geometry", [False, True])
+def test_field_data(factory, share_geometry):
+    """Test the mesh field data is attached."""
+    mesh = factory(share_geometry=share_geometry)
+    assert GV_FIELD_CRS in mesh.field_data
+    assert GV_FIELD_RADIUS in mesh.field_data
@@ -33,7 +33,7 @@ def test_to_cartesian_kwarg_pass_thru(mocker, lam_uk_sample):
     zlevel = mocker.sentinel.zlevel
     zscale = 4.56
     to_cartesian = mocker.patch("geovista.bridge.to_cartesian", return_value=xyz)
-    kwargs = {"radius": radius, "zlevel": zlevel, "zscale": zscale}
+    kwargs = {"radius": radius, "zlevel": zlevel, "zscale": zscale, "dtype": "float32"}
     lons, lats = lam_uk_sample
     result = Transform.from_points(lons, lats, **kwargs)
     to_cartesian.assert_called_once()
@@ -76,3 +76,13 @@ def test_scalar():
     np.testing.assert_array_equal(Transform.from_points(0, [90]).points, expected)
     np.testing.assert_array_equal(Transform.from_points([0], 90).points, expected)
     np.testing.assert_array_equal(Transform.from_points([0], [90]).points, expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_dtype(dtype):
+    """Test point-cloud points have the requested dtype."""
+    lons, lats = np.linspace(-180, 180, 37), np.linspace(-90, 90, 37)
+    result = Transform.from_points(lons, lats, dtype=dtype)
+    assert result.points.dtype == dtype
+    expected = to_cartesian(wrap(lons), lats)
+    np.testing.assert_allclose(result.points, expected, atol=1e-7)
@@ -0,0 +1,132 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.bridge.Transform.from_points_stream`."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+from geovista.bridge import NAME_POINTS, Transform
+from geovista.common import GV_FIELD_NAME
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+N_POINTS: int = 1000
+
+
+@pytest.fixture
+def cloud():
+    """Fixture to provide point-cloud longitudes, latitudes and data."""
+    lons = np.linspace(-180, 180, num=N_POINTS)
+    lats = np.linspace(-90, 90, num=N_POINTS)
+    data = np.arange(N_POINTS, dtype=float)
+    return lons, lats, data
+
+
+def _chunks(*arrays: np.ndarray, size: int) -> Iterator[tuple[np.ndarray, ...]]:
+    """Generate chunks of the arrays with the given size."""
+    for start in range(0, N_POINTS, size):
+        yield tuple(array[start : start + size] for array in arrays)
+
+
+def _memmap(vtk_array: object) -> np.memmap | None:
+    """Find the memory-map backing the VTK array, if any."""
+    array = getattr(vtk_array, "_numpy_reference", None)
+    while array is not None and not isinstance(array, np.memmap):
+        array = getattr(array, "base", None)
+    return array
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, N_POINTS])
+def test_parity(cloud, tmp_path, size):
+    """Test streamed point-cloud is equivalent to a non-streamed point-cloud."""
+    lons, lats, data = cloud
+    expected = Transform.from_points(lons, lats, data=data)
+    result = Transform.from_points_stream(
+        _chunks(lons, lats, data, size=size), dirname=tmp_path
+    )
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result[NAME_POINTS], expected[NAME_POINTS])
+    assert result[GV_FIELD_NAME] == NAME_POINTS
+    assert list(result.field_data.keys()) == list(expected.field_data.keys())
+    for field in expected.field_data:
+        assert_array_equal(result.field_data[field], expected.field_data[field])
+
+
+def test_memmap(cloud, tmp_path):
+    """Test streamed point-cloud points and data are memory-mapped."""
+    lons, lats, data = cloud
+    result = Transform.from_points_stream(
+        _chunks(lons, lats, data, size=100), name="data", dirname=tmp_path
+    )
+    assert _memmap(result.GetPoints().GetData()) is not None
+    assert _memmap(result.point_data.GetArray("data")) is not None
+    if os.name == "posix":
+        assert not list(tmp_path.iterdir())
+
+
+def test_zlevel(cloud, tmp_path):
+    """Test chunk zlevel overrides the default zlevel."""
+    lons, lats, _ = cloud
+    zlevel = np.arange(N_POINTS) % 3
+    expected = Transform.from_points(lons, lats, zlevel=zlevel, zscale=0.1)
+    chunks = (
+        (xs, ys, None, zs) for xs, ys, zs in _chunks(lons, lats, zlevel, size=300)
+    )
+    result = Transform.from_points_stream(chunks, zscale=0.1, dirname=tmp_path)
+    assert_array_equal(result.points, expected.points)
+    assert NAME_POINTS not in result.point_data
+
+
+def test_crs(cloud, tmp_path):
+    """Test chunks are transformed from the crs."""
+    lons, lats, _ = cloud
+    xs, ys = lons * 1e5, lats * 1e5
+    expected = Transform.from_points(xs, ys, crs="+proj=eqc")
+    result = Transform.from_points_stream(
+        _chunks(xs, ys, size=128), crs="+proj=eqc", dirname=tmp_path
+    )
+    assert_array_equal(result.points, expected.points)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_dtype(cloud, tmp_path, dtype):
+    """Test streamed point-cloud points have the requested dtype."""
+    lons, lats, _ = cloud
+    result = Transform.from_points_stream(
+        _chunks(lons, lats, size=128), dirname=tmp_path, dtype=dtype
+    )
+    assert result.points.dtype == dtype
+    assert result.n_points == N_POINTS
+
+
+@pytest.mark.parametrize(
+    ("chunks", "emsg"),
+    [
+        ([], "Require at least one chunk of points"),
+        ([(np.array([]), np.array([]))], "Require at least one chunk of points"),
+        ([(np.zeros(3),)], r"Require a chunk of \(xs, ys\)"),
+        (
+            [(np.zeros(3), np.zeros(3), np.zeros(3)), (np.zeros(3), np.zeros(3))],
+            "Require either all or none of the chunks to provide data",
+        ),
+        (
+            [(np.zeros(3), np.zeros(3)), (np.zeros(3), np.zeros(3), np.zeros(3))],
+            "Require either all or none of the chunks to provide data",
+        ),
+    ],
+)
+def test_fail(tmp_path, chunks, emsg):
+    """Test trap of invalid chunks, and removal of the memory-mapped files."""
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_points_stream(chunks, dirname=tmp_path)
+    assert not list(tmp_path.iterdir())
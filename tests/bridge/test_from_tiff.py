@@ -14,7 +14,10 @@ from geovista.bridge import Transform
 from geovista.pantry import fetch_raster
 
 # skip tests if rasterio package unavailable
-pytest.importorskip("rasterio")
+rio = pytest.importorskip("rasterio")
+
+# a rotated affine transform, which is not separable
+ROTATED = rio.Affine.rotation(30)
 
 # convert to string to exercise conversion back to Path
 fname: str = str(fetch_raster("bahamas_rgb.tif"))
@@ -57,7 +60,7 @@ def test_rgb_band(mocker, rgb, band, unit):
     crs = mocker.sentinel.crs
     data = mocker.sentinel.data
     mocked_read = mocker.MagicMock(return_value=data)
-    transform = mocker.sentinel.transform
+    transform = ROTATED
     height, width = pixels_shape = 2, 3
     n_pixels = height * width
     kwargs = {
@@ -123,6 +126,7 @@ def test_rgb_band(mocker, rgb, band, unit):
         "zlevel": None,
         "zscale": None,
         "clean": None,
+        "dtype": None,
     }
     mocked_from_2d.assert_called_once()
     args = mocked_from_2d.call_args.args
@@ -143,7 +147,7 @@ def test_extract(mocker, masked, rgb, sieve):
     crs = mocker.sentinel.crs
     dtypes = ["uint8"] * band
     size = mocker.sentinel.size
-    transform = mocker.sentinel.transform
+    transform = ROTATED
 
     shape = (band, height, width)
     data = np.ma.arange(np.prod(shape)).reshape(shape)
@@ -222,6 +226,7 @@ def test_extract(mocker, masked, rgb, sieve):
         "zlevel": None,
         "zscale": None,
         "clean": None,
+        "dtype": None,
     }
     mocked_from_2d.assert_called_once()
     args = mocked_from_2d.call_args.args
@@ -253,3 +258,139 @@ def test_extract(mocker, masked, rgb, sieve):
         assert mocked_sieve.call_count == 0
         assert mocked_extract.call_count == 0
         assert mocked_cast.call_count == 0
+
+
+@pytest.fixture
+def geotiff(tmp_path):
+    """Fixture to provide a north-up multi-band GeoTIFF and its data."""
+    fname = tmp_path / "geotiff.tif"
+    count, height, width = 3, 4, 5
+    data = np.arange(count * height * width, dtype=np.float32)
+    data = data.reshape(count, height, width)
+    data[:, 0, :] = data[1, 1, :] = -1
+    kwargs = {
+        "driver": "GTiff",
+        "count": count,
+        "height": height,
+        "width": width,
+        "dtype": data.dtype,
+        "crs": "EPSG:4326",
+        "transform": rio.Affine(2, 0, -10, 0, -4, 20),
+        "nodata": -1,
+    }
+    with rio.open(fname, mode="w", **kwargs) as dst:
+        dst.write(data)
+    return fname, data
+
+
+def test_affine(geotiff):
+    """Test north-up pixel centres match the rasterio affine transform."""
+    fname, data = geotiff
+    mesh = Transform.from_tiff(fname, band=2)
+    with rio.open(fname) as src:
+        height, width = src.shape
+        cols, rows = np.meshgrid(np.arange(width), np.arange(height))
+        xs, ys = rio.transform.xy(src.transform, rows.flatten(), cols.flatten())
+    expected = Transform.from_2d(
+        np.reshape(xs, src.shape), np.reshape(ys, src.shape), data=data[1]
+    )
+    np.testing.assert_array_equal(mesh.points, expected.points)
+    np.testing.assert_array_equal(mesh.faces, expected.faces)
+    np.testing.assert_array_equal(mesh.active_scalars, data[1].ravel())
+
+
+def test_multiband(geotiff):
+    """Test each band is a separate point data array on the same mesh."""
+    fname, data = geotiff
+    mesh = Transform.from_tiff(fname, band=[3, 1])
+    assert mesh.n_points == data[0].size
+    assert mesh.active_scalars_name == "point_data_3"
+    np.testing.assert_array_equal(mesh["point_data_3"], data[2].ravel())
+    np.testing.assert_array_equal(mesh["point_data_1"], data[0].ravel())
+
+
+def test_multiband_name(geotiff):
+    """Test band index substitution of multi-band data array names."""
+    fname, _ = geotiff
+    mesh = Transform.from_tiff(fname, name="band{band}", band=(1, 2))
+    assert mesh.active_scalars_name == "band1"
+    assert "band2" in mesh.point_data
+
+
+def test_multiband_extract(geotiff):
+    """Test only pixels masked in every band are extracted."""
+    fname, data = geotiff
+    mesh = Transform.from_tiff(fname, band=[1, 2], extract=True)
+    assert mesh.n_points == data[0, 1:].size
+    np.testing.assert_array_equal(mesh["point_data_2"], data[1, 1:].ravel())
+
+
+@pytest.mark.parametrize("band", [[], [1, 4]])
+def test_multiband_fail(geotiff, band):
+    """Test invalid multi-band indices."""
+    fname, _ = geotiff
+    emsg = "Require (at least one band index|a band index in the closed interval)"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_tiff(fname, band=band)
+
+
+def test_window(geotiff):
+    """Test only the pixels intersecting the window are read."""
+    fname, data = geotiff
+    expected = Transform.from_tiff(fname)
+    mesh = Transform.from_tiff(fname, window=(-7, 5, -3, 11))
+    assert mesh.n_points == 6
+    np.testing.assert_array_equal(mesh.active_scalars, data[0, 2:4, 1:4].ravel())
+    points = expected.points.reshape(*data[0].shape, 3)[2:4, 1:4].reshape(-1, 3)
+    np.testing.assert_array_equal(mesh.points, points)
+
+
+def test_window_crs(geotiff):
+    """Test the window bounding-box is transformed to the GeoTIFF crs."""
+    fname, _ = geotiff
+    expected = Transform.from_tiff(fname, window=(-7, 5, -3, 11))
+    mesh = Transform.from_tiff(
+        fname, window=(-779236, 557305, -333958, 1232106), window_crs="EPSG:3857"
+    )
+    np.testing.assert_array_equal(mesh.points, expected.points)
+
+
+def test_window_pixels(geotiff):
+    """Test a pixel window is clipped to the GeoTIFF."""
+    fname, data = geotiff
+    mesh = Transform.from_tiff(fname, window=rio.windows.Window(1, 2, 10, 10))
+    np.testing.assert_array_equal(mesh.active_scalars, data[0, 2:, 1:].ravel())
+
+
+@pytest.mark.parametrize(
+    ("window", "emsg"),
+    [
+        ((0, 0, 1), "Require a 'window' bounding-box"),
+        ((50, 50, 60, 60), "Require a 'window' that intersects"),
+    ],
+)
+def test_window_fail(geotiff, window, emsg):
+    """Test invalid window bounding-box."""
+    fname, _ = geotiff
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_tiff(fname, window=window)
+
+
+@pytest.mark.parametrize(("max_cells", "n_cells"), [(12, 12), (5, 2), (1, 1)])
+def test_max_cells(geotiff, max_cells, n_cells):
+    """Test the GeoTIFF is decimated to the maximum number of cells."""
+    fname, _ = geotiff
+    mesh = Transform.from_tiff(fname, max_cells=max_cells)
+    assert mesh.n_cells == n_cells
+    # the decimated pixel centres remain within the native pixel extent
+    lons = Transform.from_tiff(fname).points[:, 0]
+    assert lons.min() <= mesh.points[:, 0].min()
+    assert mesh.points[:, 0].max() <= lons.max()
+
+
+def test_max_cells_fail(geotiff):
+    """Test invalid maximum number of cells."""
+    fname, _ = geotiff
+    emsg = "Require 'max_cells' to be a positive integer"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_tiff(fname, max_cells=0)
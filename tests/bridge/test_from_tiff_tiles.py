@@ -0,0 +1,89 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.Transform.from_tiff_tiles`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+import pyvista as pv
+
+from geovista.bridge import Transform
+from geovista.common import GV_FIELD_BOUNDS
+
+# skip tests if rasterio package unavailable
+rio = pytest.importorskip("rasterio")
+
+
+@pytest.fixture
+def geotiff(tmp_path):
+    """Fixture to provide a tiled north-up GeoTIFF and its data."""
+    fname = tmp_path / "geotiff.tif"
+    height, width = 40, 50
+    data = np.arange(height * width, dtype=np.float32).reshape(height, width)
+    kwargs = {
+        "driver": "GTiff",
+        "count": 1,
+        "height": height,
+        "width": width,
+        "dtype": data.dtype,
+        "crs": "EPSG:4326",
+        "transform": rio.Affine(1, 0, -20, 0, -1, 30),
+        "tiled": True,
+        "blockxsize": 16,
+        "blockysize": 16,
+    }
+    with rio.open(fname, mode="w", **kwargs) as dst:
+        dst.write(data, 1)
+    return fname, data
+
+
+def test_blocks(geotiff):
+    """Test the tiles follow the internal block shape of the GeoTIFF."""
+    fname, _ = geotiff
+    result = Transform.from_tiff_tiles(fname)
+    assert isinstance(result, pv.MultiBlock)
+    assert result.n_blocks == 12
+    assert result.keys()[:4] == ["0,0", "0,1", "0,2", "0,3"]
+
+
+@pytest.mark.parametrize("tile_shape", [None, (7, 11), (100, 100)])
+def test_seamless(geotiff, tile_shape):
+    """Test the overlapping tiles cover the same cells as a monolithic mesh."""
+    fname, data = geotiff
+    expected = Transform.from_tiff(fname)
+    result = Transform.from_tiff_tiles(fname, tile_shape=tile_shape)
+    assert sum(mesh.n_cells for mesh in result) == expected.n_cells
+    points = np.unique(np.vstack([mesh.points for mesh in result]), axis=0)
+    assert points.shape == expected.points.shape
+    values = np.unique(np.concatenate([mesh.active_scalars for mesh in result]))
+    assert_array_equal(values, data.ravel())
+
+
+def test_bounds(geotiff):
+    """Test the crs bounds of each tile, including the overlapping pixel."""
+    fname, _ = geotiff
+    result = Transform.from_tiff_tiles(fname, tile_shape=(16, 16))
+    assert_array_equal(result["0,0"][GV_FIELD_BOUNDS], [-20, 13, -3, 30])
+    assert_array_equal(result["2,3"][GV_FIELD_BOUNDS], [28, -10, 30, -2])
+
+
+def test_kwargs(geotiff):
+    """Test the common keyword arguments are passed to each tile."""
+    fname, _ = geotiff
+    result = Transform.from_tiff_tiles(fname, name="tile", workers=2, zlevel=1)
+    for mesh in result:
+        assert mesh.active_scalars_name == "tile"
+
+
+@pytest.mark.parametrize("tile_shape", [(0, 16), (16,)])
+def test_tile_shape_fail(geotiff, tile_shape):
+    """Test invalid tile shape."""
+    fname, _ = geotiff
+    emsg = r"Require a 'tile_shape' of \(height, width\)"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_tiff_tiles(fname, tile_shape=tile_shape)
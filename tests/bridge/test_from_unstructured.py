@@ -0,0 +1,127 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.bridge.Transform.from_unstructured`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy import ma
+from numpy.testing import assert_array_equal
+import pytest
+
+from geovista.bridge import NAME_CELLS, Transform
+
+OFFSETS = np.array([0, 3, 7, 12])
+CONNECTIVITY = np.array([0, 1, 2, 1, 3, 4, 2, 3, 5, 6, 7, 4])
+
+
+@pytest.fixture
+def points():
+    """Fixture to provide the x-values and y-values of a mixed mesh."""
+    xs = np.array([0, 10, 5, 15, 20, 25, 30, 35], dtype=float)
+    ys = np.array([0, 0, 10, 10, 0, 5, 10, 15], dtype=float)
+    return xs, ys
+
+
+@pytest.fixture
+def masked():
+    """Fixture to provide masked connectivity of a mixed mesh."""
+    return ma.masked_equal([[0, 1, 2, -1, -1], [1, 3, 4, 2, -1], [3, 5, 6, 7, 4]], -1)
+
+
+def test_masked(points, masked):
+    """Test a mixed mesh from masked connectivity."""
+    mesh = Transform.from_unstructured(*points, connectivity=masked)
+    assert mesh.n_cells == 3
+    assert_array_equal(mesh._offset_array, OFFSETS)
+    assert_array_equal(mesh._connectivity_array, CONNECTIVITY)
+
+
+def test_masked__start_index(points, masked):
+    """Test a mixed mesh from one-based masked connectivity."""
+    mesh = Transform.from_unstructured(*points, connectivity=masked + 1)
+    assert_array_equal(mesh._connectivity_array, CONNECTIVITY)
+
+
+def test_masked__invalid_faces(points, masked):
+    """Test faces with less than three vertices are discarded."""
+    masked = ma.vstack([masked[:1], ma.masked_equal([[1, 2, -1, -1, -1]], -1)])
+    wmsg = "geovista masked connectivity defines 1 face with no vertices"
+    with pytest.warns(UserWarning, match=wmsg):
+        mesh = Transform.from_unstructured(*points, connectivity=masked)
+    assert mesh.n_cells == 1
+    assert_array_equal(mesh._connectivity_array, [0, 1, 2])
+
+
+def test_masked__ndim_fail(points, masked):
+    """Test masked connectivity with more than two dimensions."""
+    emsg = r"Require a 2-D '\(M, N\)' connectivity array"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_unstructured(*points, connectivity=masked[np.newaxis])
+
+
+def test_offsets(points, masked):
+    """Test an offsets and flattened connectivity tuple matches masked connectivity."""
+    expected = Transform.from_unstructured(*points, connectivity=masked)
+    data = np.arange(3)
+    mesh = Transform.from_unstructured(
+        *points, connectivity=(OFFSETS, CONNECTIVITY), data=data
+    )
+    assert_array_equal(mesh.points, expected.points)
+    assert_array_equal(mesh.faces, expected.faces)
+    assert_array_equal(mesh[NAME_CELLS], data)
+
+
+def test_offsets__start_index(points):
+    """Test one-based flattened connectivity."""
+    mesh = Transform.from_unstructured(
+        *points, connectivity=(OFFSETS, CONNECTIVITY + 1)
+    )
+    assert_array_equal(mesh._connectivity_array, CONNECTIVITY)
+
+
+def test_offsets__isolated(points):
+    """Test mutating the provided offsets and connectivity does not corrupt the mesh."""
+    offsets, connectivity = OFFSETS.copy(), CONNECTIVITY.copy()
+    mesh = Transform.from_unstructured(*points, connectivity=(offsets, connectivity))
+    offsets[:], connectivity[:] = 0, 0
+    assert_array_equal(mesh._offset_array, OFFSETS)
+    assert_array_equal(mesh._connectivity_array, CONNECTIVITY)
+
+
+def test_offsets__read_only(points):
+    """Test read-only offsets and connectivity are not mutated by the mesh."""
+    offsets, connectivity = OFFSETS.astype(np.int32), CONNECTIVITY.astype(np.int32)
+    offsets.flags.writeable = connectivity.flags.writeable = False
+    mesh = Transform.from_unstructured(*points, connectivity=(offsets, connectivity))
+    assert not np.shares_memory(mesh._connectivity_array, connectivity)
+    mesh.GetPolys().ReverseCell(0)
+    assert_array_equal(connectivity, CONNECTIVITY)
+
+
+def test_offsets__factory(points):
+    """Test the factory with an offsets and flattened connectivity tuple."""
+    factory = Transform(*points, connectivity=(OFFSETS, CONNECTIVITY))
+    mesh = factory(data=np.arange(8))
+    assert mesh.n_cells == 3
+    assert_array_equal(mesh._offset_array, OFFSETS)
+
+
+@pytest.mark.parametrize(
+    ("offsets", "connectivity", "emsg"),
+    [
+        (OFFSETS, CONNECTIVITY.reshape(3, 4), "Require a flattened 1-D integer"),
+        (OFFSETS, CONNECTIVITY.astype(float), "Require a flattened 1-D integer"),
+        (OFFSETS[:1], CONNECTIVITY, "Require 1-D 'offsets' defining at least one"),
+        (OFFSETS + 1, CONNECTIVITY, r"Require 'offsets' in the closed interval"),
+        (OFFSETS[:-1], CONNECTIVITY, r"Require 'offsets' in the closed interval"),
+        ([0, 2, 12], CONNECTIVITY, "Require 'offsets' defining at least 3"),
+    ],
+)
+def test_offsets__fail(points, offsets, connectivity, emsg):
+    """Test invalid offsets and flattened connectivity."""
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_unstructured(*points, connectivity=(offsets, connectivity))
@@ -0,0 +1,104 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :meth:`geovista.bridge.Transform.from_unstructured_batch`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+from geovista.bridge import NAME_CELLS, Transform
+from geovista.common import GV_FIELD_RADIUS
+
+
+@pytest.fixture
+def batch():
+    """Fixture to provide a batch of quad-mesh x-values and y-values."""
+    result = []
+    for offset in range(5):
+        xs, ys = np.meshgrid(
+            np.linspace(-10, 10, num=4) + 10 * offset, np.linspace(-10, 10, num=3)
+        )
+        result.append({"xs": xs, "ys": ys, "data": np.arange(6) + offset})
+    return result
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_order(batch, processes):
+    """Test the meshes are returned in the same order as the batch."""
+    batch = [item | {"data": item["data"][:3]} for item in batch]
+    result = Transform.from_unstructured_batch(
+        batch, processes=processes, workers=2, connectivity=(3, 4)
+    )
+    assert len(result) == len(batch)
+    for item, mesh in zip(batch, result, strict=True):
+        expected = Transform.from_unstructured(**item, connectivity=(3, 4))
+        assert_array_equal(mesh.points, expected.points)
+        assert_array_equal(mesh.faces, expected.faces)
+        assert_array_equal(mesh[NAME_CELLS], item["data"])
+
+
+def test_kwargs(batch):
+    """Test the common keyword arguments are overridden by a batch item."""
+    batch[1]["radius"] = 2.0
+    result = Transform.from_2d_batch(batch, radius=3.0)
+    radii = [mesh.field_data[GV_FIELD_RADIUS][0] for mesh in result]
+    assert radii == [3.0, 2.0, 3.0, 3.0, 3.0]
+
+
+def test_positional():
+    """Test batch items of positional arguments."""
+    lons = np.linspace(-180, 180, num=10)
+    lats = np.linspace(-60, 60, num=10)
+    batch = [(lons, lats), (lats, lons)]
+    result = Transform.from_points_batch(batch, zlevel=1)
+    assert_array_equal(
+        result[0].points, Transform.from_points(lons, lats, zlevel=1).points
+    )
+    assert_array_equal(
+        result[1].points, Transform.from_points(lats, lons, zlevel=1).points
+    )
+
+
+def test_errors(batch):
+    """Test all the errors of the batch are raised and annotated with the item."""
+    batch[1]["ys"] = batch[1]["ys"][:-1]
+    batch[3]["data"] = np.arange(5)
+    with pytest.raises(ExceptionGroup, match="Failed to build 2 of 5 meshes") as info:
+        _ = Transform.from_2d_batch(batch)
+    errors = info.value.exceptions
+    assert [type(error) for error in errors] == [ValueError, ValueError]
+    assert errors[0].__notes__ == ["geovista failed to build batch item #1."]
+    assert errors[1].__notes__ == ["geovista failed to build batch item #3."]
+
+
+def test_errors__not_strict(batch):
+    """Test the errors of the batch are returned in place of the meshes."""
+    batch[2]["data"] = np.arange(5)
+    result = Transform.from_2d_batch(batch, strict=False)
+    assert [isinstance(item, ValueError) for item in result] == [
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+    assert result[2].__notes__ == ["geovista failed to build batch item #2."]
+    assert result[3].n_cells == 6
+
+
+def test_empty():
+    """Test an empty batch."""
+    assert Transform.from_unstructured_batch([]) == []
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_workers_fail(batch, workers):
+    """Test the number of workers must be positive."""
+    emsg = f"Cannot build batch, 'workers' must be positive, got {workers}"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_unstructured_batch(batch, workers=workers)
@@ -0,0 +1,127 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for lazy dask array support of :class:`geovista.bridge.Transform`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+from geovista.bridge import NAME_CELLS, TOPOLOGY_CACHE, Transform
+from geovista.common import GV_FIELD_RADIUS, GV_FIELD_ZSCALE
+
+da = pytest.importorskip("dask.array")
+
+
+pytestmark = pytest.mark.parametrize(
+    "_purge", [(TOPOLOGY_CACHE,)], ids=["TOPOLOGY_CACHE"], indirect=True
+)
+
+
+@pytest.mark.parametrize("chunks", [(19, 37), (5, 7)])
+def test_from_2d(grid, chunks):
+    """Test lazy 2-D geometry is identical to the materialised geometry."""
+    xs, ys = np.meshgrid(*grid)
+    data = np.arange(36 * 18)
+    expected = Transform.from_2d(xs, ys, data=data)
+    lxs, lys = da.from_array(xs, chunks=chunks), da.from_array(ys, chunks=chunks)
+    result = Transform.from_2d(lxs, lys, data=da.from_array(data, chunks=50))
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result.faces, expected.faces)
+    assert_array_equal(result[NAME_CELLS], data)
+    assert result.field_data[GV_FIELD_RADIUS] == expected.field_data[GV_FIELD_RADIUS]
+
+
+def test_from_unstructured__mixed(grid):
+    """Test lazy x-values with materialised y-values."""
+    xs, ys = np.meshgrid(*grid)
+    expected = Transform.from_unstructured(xs, ys, zlevel=1)
+    result = Transform.from_unstructured(da.from_array(xs, chunks=(4, 9)), ys, zlevel=1)
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result.faces, expected.faces)
+
+
+def test_from_unstructured__crs():
+    """Test lazy geometry is transformed to geographic coordinates per chunk."""
+    xs, ys = np.meshgrid(np.linspace(-1e6, 1e6, num=11), np.linspace(-1e6, 1e6, num=9))
+    crs = "+proj=laea +lat_0=52 +lon_0=10"
+    expected = Transform.from_2d(xs, ys, crs=crs, dtype=np.float32)
+    result = Transform.from_2d(
+        da.from_array(xs, chunks=3),
+        da.from_array(ys, chunks=3),
+        crs=crs,
+        dtype=np.float32,
+    )
+    assert result.points.dtype == np.float32
+    assert_array_equal(result.points, expected.points)
+
+
+def test_from_unstructured__shape(grid):
+    """Test lazy x-values and y-values with different shapes."""
+    xs, ys = np.meshgrid(*grid)
+    emsg = "Require x-values and y-values with the same shape"
+    with pytest.raises(ValueError, match=emsg):
+        _ = Transform.from_unstructured(
+            da.from_array(xs), da.from_array(ys[:-1]), connectivity=(1, 3)
+        )
+
+
+def test_cache(grid):
+    """Test lazy geometry is cached without being computed."""
+    xs, ys = np.meshgrid(*grid)
+    lxs, lys = da.from_array(xs, chunks=5), da.from_array(ys, chunks=5)
+    mesh1 = Transform.from_2d(lxs, lys, cache=True)
+    mesh2 = Transform.from_2d(lxs, lys, cache=True)
+    info = TOPOLOGY_CACHE.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert_array_equal(mesh1.points, mesh2.points)
+    _ = Transform.from_2d(lxs + 1, lys, cache=True)
+    assert TOPOLOGY_CACHE.cache_info().misses == 2
+
+
+def test_call(grid):
+    """Test the factory with lazy geometry and data."""
+    xs, ys = np.meshgrid(*grid)
+    data = np.arange(xs.size)
+    expected = Transform(xs, ys)(data=data)
+    result = Transform(da.from_array(xs, chunks=6), da.from_array(ys, chunks=6))(
+        data=da.from_array(data, chunks=100)
+    )
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result.active_scalars, data)
+
+
+@pytest.mark.parametrize("zlevel", [None, 2])
+def test_from_points(zlevel):
+    """Test lazy point-cloud is identical to the materialised point-cloud."""
+    lons = np.linspace(-180, 180, num=101)
+    lats = np.linspace(-90, 90, num=101)
+    expected = Transform.from_points(lons, lats, data=lats, zlevel=zlevel, zscale=0.1)
+    result = Transform.from_points(
+        da.from_array(lons, chunks=10),
+        da.from_array(lats, chunks=30),
+        data=da.from_array(lats, chunks=10),
+        zlevel=zlevel,
+        zscale=0.1,
+    )
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result.active_scalars, lats)
+    assert result.field_data[GV_FIELD_ZSCALE] == expected.field_data[GV_FIELD_ZSCALE]
+
+
+def test_from_points__zlevels():
+    """Test lazy point-cloud with broadcast z-levels."""
+    lons = np.linspace(-180, 180, num=11)
+    lats = np.linspace(-60, 60, num=11)
+    zlevel = np.arange(3).reshape(-1, 1)
+    expected = Transform.from_points(lons, lats, zlevel=zlevel)
+    result = Transform.from_points(
+        da.from_array(lons, chunks=4), da.from_array(lats, chunks=4), zlevel=zlevel
+    )
+    assert result.n_points == 33
+    assert_array_equal(result.points, expected.points)
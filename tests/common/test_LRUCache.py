@@ -0,0 +1,80 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :class:`geovista.common.LRUCache`."""
+
+from __future__ import annotations
+
+from geovista.common import CacheInfo, LRUCache
+
+
+def test_hits_misses():
+    """Test cache statistics are updated on lookup."""
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("b", default=2) == 2
+    assert cache.cache_info() == CacheInfo(
+        hits=1, misses=2, maxsize=2, currsize=1, maxbytes=None, currbytes=0
+    )
+
+
+def test_evict_maxsize():
+    """Test least recently used entry is evicted when the cache is full."""
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    _ = cache.get("a")
+    cache.put("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_evict_maxbytes():
+    """Test least recently used entries are evicted to honour the byte limit."""
+    cache = LRUCache(10, maxbytes=100)
+    cache.put("a", 1, nbytes=60)
+    cache.put("b", 2, nbytes=30)
+    cache.put("c", 3, nbytes=30)
+    assert "a" not in cache
+    assert cache.cache_info().currbytes == 60
+
+
+def test_too_large():
+    """Test an entry larger than the byte limit is not cached."""
+    cache = LRUCache(10, maxbytes=100)
+    cache.put("a", 1, nbytes=101)
+    assert "a" not in cache
+    assert cache.cache_info().currbytes == 0
+
+
+def test_replace():
+    """Test replacing an entry updates the byte count."""
+    cache = LRUCache(10, maxbytes=100)
+    cache.put("a", 1, nbytes=60)
+    cache.put("a", 2, nbytes=10)
+    assert cache.get("a") == 2
+    assert cache.cache_info().currbytes == 10
+
+
+def test_disabled():
+    """Test a cache with zero size never caches."""
+    cache = LRUCache(0)
+    cache.put("a", 1)
+    assert len(cache) == 0
+
+
+def test_cache_clear():
+    """Test the cache entries and statistics are purged."""
+    cache = LRUCache(2)
+    cache.put("a", 1, nbytes=10)
+    _ = cache.get("a")
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(
+        hits=0, misses=0, maxsize=2, currsize=0, maxbytes=None, currbytes=0
+    )
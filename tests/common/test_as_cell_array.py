@@ -0,0 +1,58 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.common.as_cell_array`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+import pyvista as pv
+
+from geovista.common import as_cell_array
+
+OFFSETS = [0, 3, 7, 12]
+CONNECTIVITY = [0, 1, 2, 1, 3, 4, 2, 3, 5, 6, 7, 4]
+
+
+def test_cells():
+    """Test mixed cells are built from the offsets and connectivity."""
+    cells = as_cell_array(OFFSETS, CONNECTIVITY)
+    assert cells.n_cells == 3
+    assert_array_equal(cells.cells, [3, 0, 1, 2, 4, 1, 3, 4, 2, 5, 3, 5, 6, 7, 4])
+
+
+@pytest.mark.parametrize(("dtype", "storage64"), [(np.int32, False), (np.int64, True)])
+def test_shared(dtype, storage64):
+    """Test contiguous arrays share memory with vtk."""
+    offsets = np.array(OFFSETS, dtype=dtype)
+    connectivity = np.array(CONNECTIVITY, dtype=dtype)
+    cells = as_cell_array(offsets, connectivity)
+    assert cells.IsStorage64Bit() == storage64
+    assert np.shares_memory(cells.offset_array, offsets)
+    assert np.shares_memory(cells.connectivity_array, connectivity)
+
+
+@pytest.mark.parametrize("dtype", [np.uint32, np.int16])
+def test_copy(dtype):
+    """Test other integer dtypes are copied to the vtk id type."""
+    connectivity = np.array(CONNECTIVITY, dtype=dtype)
+    cells = as_cell_array(np.array(OFFSETS, dtype=dtype), connectivity)
+    assert cells.IsStorage64Bit()
+    assert not np.shares_memory(cells.connectivity_array, connectivity)
+    assert_array_equal(cells.connectivity_array, CONNECTIVITY)
+
+
+def test_mesh():
+    """Test the cells define the faces of a mesh."""
+    points = np.random.default_rng().random((8, 3))
+    offsets = np.array(OFFSETS, dtype=np.int32)
+    connectivity = np.array(CONNECTIVITY, dtype=np.int32)
+    mesh = pv.PolyData(points, faces=as_cell_array(offsets, connectivity))
+    del offsets, connectivity
+    assert mesh.n_cells == 3
+    assert_array_equal(mesh._offset_array, OFFSETS)
+    assert_array_equal(mesh._connectivity_array, CONNECTIVITY)
@@ -0,0 +1,48 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.common.cell_lon_span`."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+import pyvista as pv
+
+from geovista.bridge import Transform
+from geovista.common import cell_lon_span, from_cartesian
+
+
+@pytest.mark.parametrize("n_lons", [3, 10, 37])
+def test_rectilinear(n_lons):
+    """Test the span of each face of a rectilinear mesh."""
+    lons = np.linspace(-170, 170, n_lons)
+    mesh = Transform.from_1d(lons, [-10, 0, 10])
+    result = cell_lon_span(mesh)
+    expected = np.tile(np.diff(lons), 2)
+    np.testing.assert_allclose(result, expected)
+
+
+def test_mixed_faces():
+    """Test the span of each face of a mixed triangle and quad mesh."""
+    lons = np.array([0, 10, 20, 30, 40])
+    lats = np.array([0, 10, 0, 10, 0])
+    mesh = Transform.from_unstructured(
+        lons, lats, connectivity=np.ma.masked_less([[0, 2, 1, -1], [1, 2, 4, 3]], 0)
+    )
+    np.testing.assert_allclose(cell_lon_span(mesh), [20, 30])
+
+
+def test_lons():
+    """Test the span is calculated from the provided longitudes."""
+    mesh = Transform.from_1d([0, 10, 20], [0, 10])
+    lons = from_cartesian(mesh)[:, 0] * 2
+    np.testing.assert_allclose(cell_lon_span(mesh, lons=lons), [20, 20])
+
+
+def test_no_faces():
+    """Test a mesh with no faces."""
+    result = cell_lon_span(pv.PolyData())
+    assert result.size == 0
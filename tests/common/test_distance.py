@@ -10,7 +10,8 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from geovista.common import RADIUS, distance
+from geovista.bridge import Transform
+from geovista.common import GV_FIELD_RADIUS, RADIUS, distance
 
 
 @pytest.mark.parametrize("origin", [np.empty((2, 2)), range(4)])
@@ -21,11 +22,12 @@ def test_origin_fail(lfric, origin):
         _ = distance(lfric, origin=origin)
 
 
+@pytest.mark.parametrize("method", ["exact", "sample"])
 @pytest.mark.parametrize("scale", range(1, 11))
-def test_mean_distance(lfric, scale):
+def test_mean_distance(lfric, scale, method):
     """Test mean distance calculation of mesh."""
     mesh = lfric.scale(scale)
-    result = distance(mesh)
+    result = distance(mesh, method=method)
     assert np.isclose(result, scale)
 
 
@@ -67,3 +69,66 @@ def test_point_distance__origin(lfric, origin):
     result = distance(mesh, origin=origin, mean=False)
     assert result.size == lfric.n_points
     assert np.isclose(np.sum(result), lfric.n_points * RADIUS)
+
+
+@pytest.fixture
+def grid():
+    """Fixture to provide a global quad-mesh with a stale radius."""
+    xs, ys = np.meshgrid(np.linspace(-180, 180, num=73), np.linspace(-90, 90, num=37))
+    mesh = Transform.from_2d(xs, ys, radius=2)
+    mesh.field_data[GV_FIELD_RADIUS] = np.array([3.0])
+    return mesh
+
+
+def test_field(mocker, grid):
+    """Test the mesh radius field is trusted without calculation."""
+    spy = mocker.spy(np, "sqrt")
+    assert distance(grid) == 3
+    assert distance(grid, method="FIELD") == 3
+    spy.assert_not_called()
+
+
+def test_field__origin(grid):
+    """Test the mesh radius field is not trusted for another origin."""
+    assert np.isclose(distance(grid, origin=(0, 0, 0.5)), 2, atol=0.1)
+
+
+def test_field__missing(grid):
+    """Test the mean distance is calculated without a mesh radius field."""
+    del grid.field_data[GV_FIELD_RADIUS]
+    assert np.isclose(distance(grid), 2)
+
+
+def test_field__cloud():
+    """Test the base radius field of a point-cloud is not trusted."""
+    lons = np.linspace(-180, 180, num=10)
+    cloud = Transform.from_points(lons, np.zeros_like(lons), zlevel=10, zscale=0.1)
+    assert np.isclose(distance(cloud), 2)
+
+
+def test_exact(grid):
+    """Test the mean distance is calculated from all the mesh points."""
+    assert np.isclose(distance(grid, method="exact"), 2)
+
+
+def test_sample(mocker, grid):
+    """Test the mean distance is estimated from a sample of the mesh points."""
+    mocker.patch("geovista.common.DISTANCE_SAMPLE_SIZE", 100)
+    spy = mocker.spy(np, "mean")
+    assert np.isclose(distance(grid, method="sample"), 2)
+    assert spy.call_args.args[0].size <= 100
+
+
+def test_verify(grid):
+    """Test the mesh radius field is verified against the mean distance."""
+    wmsg = "geovista mesh 'gvRadius' of 3.0 is inconsistent"
+    with pytest.warns(UserWarning, match=wmsg):
+        result = distance(grid, method="verify")
+    assert np.isclose(result, 2)
+
+
+def test_method_fail(grid):
+    """Test trap of invalid method."""
+    emsg = "Expected a method of 'exact' or 'field' or 'sample' or 'verify'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = distance(grid, method="bogus")
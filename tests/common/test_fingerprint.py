@@ -0,0 +1,61 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.common.fingerprint`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy import ma
+import pytest
+
+from geovista.common import fingerprint
+
+
+def test_equal():
+    """Test identical content results in the same digest."""
+    data = np.arange(10)
+    assert fingerprint(data, 1.0, "a") == fingerprint(data.copy(), 1.0, "a")
+
+
+def test_order():
+    """Test the order of the items is significant."""
+    data = np.arange(10)
+    assert fingerprint(data, None) != fingerprint(None, data)
+
+
+def test_dtype():
+    """Test the array dtype contributes to the digest."""
+    data = np.arange(10, dtype=np.int32)
+    assert fingerprint(data) != fingerprint(data.astype(np.int64))
+
+
+def test_shape():
+    """Test the array shape contributes to the digest."""
+    data = np.arange(12)
+    assert fingerprint(data) != fingerprint(data.reshape(3, 4))
+
+
+def test_non_contiguous():
+    """Test a non-contiguous array digests the same as its contiguous copy."""
+    data = np.arange(24).reshape(4, 6)[:, ::2]
+    assert fingerprint(data) == fingerprint(np.ascontiguousarray(data))
+
+
+def test_mask():
+    """Test the array mask contributes to the digest."""
+    data = ma.arange(10)
+    masked = data.copy()
+    masked[0] = ma.masked
+    assert fingerprint(data) != fingerprint(masked)
+
+
+def test_lazy():
+    """Test a lazy dask array contributes its token, without being computed."""
+    da = pytest.importorskip("dask.array")
+    data = da.arange(10, chunks=3)
+    assert fingerprint(data) == fingerprint(da.arange(10, chunks=3))
+    assert fingerprint(data) != fingerprint(data + 1)
+    assert fingerprint(data) != fingerprint(np.arange(10))
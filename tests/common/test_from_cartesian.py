@@ -125,3 +125,59 @@ def test_lines_closed_interval(closed_interval, lonlat, pids):
     mesh.lines = lines
     result = from_cartesian(mesh, closed_interval=closed_interval)
     assert np.all(np.isclose(result[:, :-1], lonlat)) == closed_interval
+
+
+@pytest.mark.parametrize("n_lats", [3, 10, 91])
+@pytest.mark.parametrize("n_lons", [10, 90, 361])
+def test_polar_quad_mesh_unfold__global(n_lons, n_lats):
+    """Test unfolding of north and south polar quad cells of a global mesh."""
+    lons = np.linspace(-180, 180, n_lons)
+    lats = np.linspace(-90, 90, n_lats)
+    mesh = Transform.from_1d(lons, lats)
+    lonlats = from_cartesian(mesh)
+    expected = np.tile(wrap(lons), n_lats)
+    np.testing.assert_allclose(lonlats[:, 0], expected)
+
+
+@pytest.mark.parametrize("n_lons", [10, 90, 361])
+def test_polar_quad_mesh_unfold__unstructured(n_lons):
+    """Test unfolding of polar quad cells of an unstructured grid."""
+    lons = np.linspace(-180, 180, n_lons)
+    lats = np.linspace(-90, 90, 10)
+    mesh = Transform.from_1d(lons, lats).cast_to_unstructured_grid()
+    lonlats = from_cartesian(mesh)
+    expected = np.tile(wrap(lons), lats.size)
+    np.testing.assert_allclose(lonlats[:, 0], expected)
+
+
+def test_polar_quad_mesh_unfold__degenerate():
+    """Test polar quad cell with a repeated polar point is not unfolded."""
+    lonlat = np.array([[0, 90], [10, 80], [20, 80]])
+    points = to_cartesian(lonlat[:, 0], lonlat[:, 1])
+    mesh = pv.PolyData(points, faces=[4, 0, 0, 1, 2])
+    lonlats = from_cartesian(mesh)
+    np.testing.assert_allclose(lonlats[:, 0], [0, 10, 20])
+
+
+def test_polar_quad_mesh_unfold__fail():
+    """Test polar quad cell with invalid polar points connectivity."""
+    lonlat = np.array([[0, 90], [10, 80], [0, 90], [20, 80]])
+    points = to_cartesian(lonlat[:, 0], lonlat[:, 1])
+    mesh = pv.PolyData(points, faces=[4, 0, 1, 2, 3])
+    emsg = "Failed to unfold a mesh polar quad-cell"
+    with pytest.raises(ValueError, match=emsg):
+        _ = from_cartesian(mesh)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+def test_dtype(dtype):
+    """Test polar quad cells unfold and coordinates have the requested dtype."""
+    lons = np.linspace(-180, 180, 37)
+    lats = np.linspace(-90, 90, 19)
+    mesh = Transform.from_1d(lons, lats, dtype=dtype)
+    assert mesh.points.dtype == dtype
+    lonlats = from_cartesian(mesh, dtype=dtype)
+    assert lonlats.dtype == dtype
+    assert lonlats.flags.c_contiguous
+    np.testing.assert_allclose(lonlats[:, 0], np.tile(wrap(lons), lats.size), atol=1e-4)
+    np.testing.assert_allclose(lonlats[:, 1], np.repeat(lats, lons.size), atol=1e-4)
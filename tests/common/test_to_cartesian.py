@@ -108,3 +108,41 @@ def test_zscale(lam_uk_sample, zlevel, zscale):
     actual = _distance(result)
     expected = RADIUS + RADIUS * zlevel * zscale
     assert np.isclose(actual, expected)
+
+
+@pytest.mark.parametrize("stacked", [False, True])
+@pytest.mark.parametrize("dtype", [None, np.float32, np.float64])
+def test_dtype(stacked, dtype):
+    """Test xyz points are of the requested dtype and contiguous."""
+    lons, lats = np.meshgrid(np.linspace(-180, 180, 37), np.linspace(-90, 90, 19))
+    expected = to_cartesian(lons, lats, stacked=stacked)
+    result = to_cartesian(lons, lats, stacked=stacked, dtype=dtype)
+    assert result.dtype == (np.float64 if dtype is None else dtype)
+    assert result.flags.c_contiguous
+    np.testing.assert_allclose(result, expected, atol=1e-7)
+
+
+def test_dtype_fail():
+    """Test trap of non floating point dtype."""
+    emsg = "Require a floating point dtype, got 'int64'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = to_cartesian(0, 0, dtype=np.int64)
+
+
+@pytest.mark.parametrize("kernel_size", [1, 7, 2**14])
+@pytest.mark.parametrize("zlevel", [None, np.arange(3).reshape(3, 1)])
+def test_kernel_blocks(monkeypatch, kernel_size, zlevel):
+    """Test conversion is independent of the fused kernel block size."""
+    monkeypatch.setattr("geovista.common._KERNEL_SIZE", kernel_size)
+    lons = np.linspace(-180, 180, num=50)
+    lats = np.linspace(-90, 90, num=50)
+    result = to_cartesian(lons, lats, zlevel=zlevel, zscale=0.5)
+    radius = RADIUS + RADIUS * (0 if zlevel is None else zlevel) * 0.5
+    colat, lam = np.radians(90.0 - lats), np.radians(lons)
+    x = radius * np.sin(colat) * np.cos(lam)
+    y = radius * np.sin(colat) * np.sin(lam)
+    z = radius * np.cos(colat)
+    expected = np.vstack(
+        [np.ravel(x), np.ravel(y), np.ravel(np.broadcast_to(z, x.shape))]
+    )
+    np.testing.assert_array_equal(result, expected.T)
@@ -10,7 +10,7 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
-from geovista.common import to_lonlats
+from geovista.common import to_cartesian, to_lonlats
 
 
 @pytest.mark.parametrize(
@@ -65,3 +65,28 @@ def test_radius(manydegrees):
     radii = np.ones(xyz.shape[0])
     lonlats = to_lonlats(xyz, radius=radii)
     np.testing.assert_array_almost_equal(lonlats, manydegrees.expected)
+
+
+@pytest.mark.parametrize("stacked", [False, True])
+@pytest.mark.parametrize("dtype", [None, np.float32, np.float64])
+def test_dtype(manydegrees, stacked, dtype):
+    """Test longitudes and latitudes are of the requested dtype and contiguous."""
+    xyz = np.asanyarray(manydegrees.xyz, dtype=np.float32)
+    lonlats = to_lonlats(xyz, stacked=stacked, dtype=dtype)
+    assert lonlats.dtype == (np.float64 if dtype is None else dtype)
+    assert lonlats.flags.c_contiguous
+    expected = manydegrees.expected if stacked else np.array(manydegrees.expected).T
+    np.testing.assert_allclose(lonlats, expected, atol=1e-4)
+
+
+@pytest.mark.parametrize("kernel_size", [1, 7, 2**14])
+@pytest.mark.parametrize("radians", [False, True])
+def test_kernel_blocks(monkeypatch, kernel_size, radians):
+    """Test conversion is independent of the fused kernel block size."""
+    lons = np.linspace(-180, 180, num=50)
+    lats = np.linspace(-90, 90, num=50)
+    xyz = to_cartesian(lons, lats)
+    expected = to_lonlats(xyz, radians=radians)
+    monkeypatch.setattr("geovista.common._KERNEL_SIZE", kernel_size)
+    result = to_lonlats(xyz, radians=radians)
+    np.testing.assert_array_equal(result, expected)
@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 from contextlib import suppress
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
@@ -23,6 +24,9 @@ from geovista.pantry.meshes import lam_uk as sample_lam_uk
 from geovista.pantry.meshes import lfric as sample_lfric
 from geovista.pantry.meshes import lfric_sst as sample_lfric_sst
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 @pytest.fixture
 def plot_nodeid(request):
@@ -61,6 +65,14 @@ def coastlines(request):
     return geometry_coastlines(resolution=resolution)
 
 
+@pytest.fixture
+def grid():
+    """Fixture to provide 1-D contiguous x-values and y-values bounds."""
+    xs = np.linspace(-180, 180, num=37) + 5
+    ys = np.linspace(-90, 90, num=19)
+    return xs, ys
+
+
 @pytest.fixture
 def lam_polar():
     """Fixture generates a Polar Local Area Model mesh with indexed faces and points."""
@@ -117,6 +129,22 @@ def lfric_sst():
     return mesh
 
 
+@pytest.fixture(autouse=True)
+def _purge(request) -> Iterator[None]:
+    """Fixture to purge the parametrized caches before and after each test."""
+    # support indirect parameters for fixtures and also
+    # calling the fixture with no parameter
+    caches = request.param if hasattr(request, "param") else ()
+
+    for cache in caches:
+        cache.cache_clear()
+
+    yield
+
+    for cache in caches:
+        cache.cache_clear()
+
+
 @pytest.fixture
 def sphere():
     """Fixture to provide a pyvista sphere mesh."""
@@ -0,0 +1,116 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :data:`geovista.core.SLICE_TOPOLOGY_CACHE`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+import pytest
+
+from geovista.bridge import Transform
+from geovista.common import GV_CELL_IDS, GV_REMESH_POINT_IDS
+from geovista.common import cast_UnstructuredGrid_to_PolyData as cast
+from geovista.core import SLICE_TOPOLOGY_CACHE, slice_cells, slice_mesh
+
+N_CELLS: int = 36 * 18
+
+
+pytestmark = pytest.mark.parametrize(
+    "_purge", [(SLICE_TOPOLOGY_CACHE,)], ids=["SLICE_TOPOLOGY_CACHE"], indirect=True
+)
+
+
+def test_default_disabled(grid):
+    """Test sliced topology is not cached by default."""
+    _ = slice_mesh(Transform.from_1d(*grid))
+    assert len(SLICE_TOPOLOGY_CACHE) == 0
+
+
+@pytest.mark.parametrize("method", ["analytic", "vtk"])
+def test_hit(grid, method):
+    """Test sliced topology is reused for identical geometry."""
+    data = np.arange(N_CELLS)
+    mesh1 = Transform.from_1d(*grid, data=data, name="data")
+    mesh2 = Transform.from_1d(*grid, data=data[::-1], name="data")
+    result1 = slice_mesh(mesh1, method=method, cache=True)
+    result2 = slice_mesh(mesh2, method=method, cache=True)
+    info = SLICE_TOPOLOGY_CACHE.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+    assert_array_equal(result1.points, result2.points)
+    assert_array_equal(result1.faces, result2.faces)
+    assert_array_equal(result1[GV_REMESH_POINT_IDS], result2[GV_REMESH_POINT_IDS])
+    assert_array_equal(result2["data"], data[::-1][result1["data"]])
+    assert result2.active_scalars_name == "data"
+
+
+def test_parity(grid):
+    """Test cached sliced mesh is identical to a non-cached sliced mesh."""
+    lons = np.tile(grid[0], grid[1].size)
+    mesh = Transform.from_1d(*grid, data=lons, name="lons")
+    expected = slice_mesh(mesh, method="analytic")
+    _ = slice_mesh(mesh, method="analytic", cache=True)
+    result = slice_mesh(mesh, method="analytic", cache=True)
+    assert SLICE_TOPOLOGY_CACHE.cache_info().hits == 1
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result.faces, expected.faces)
+    assert set(result.point_data.keys()) == set(expected.point_data.keys())
+    assert set(result.cell_data.keys()) == set(expected.cell_data.keys())
+    assert set(result.field_data.keys()) == set(expected.field_data.keys())
+    for name in expected.point_data:
+        assert_allclose(result[name], expected[name])
+    for name in expected.cell_data:
+        assert_array_equal(result[name], expected[name])
+
+
+@pytest.mark.parametrize("method", ["analytic", "vtk"])
+def test_subset(grid, method):
+    """Test a subset mesh with inherited cell ids is sliced with positional ids."""
+    mesh = Transform.from_1d(*grid, data=np.arange(N_CELLS), name="data")
+    _ = slice_cells(mesh)
+    subset = cast(mesh.extract_cells(np.arange(N_CELLS // 2, N_CELLS)))
+    expected = slice_cells(subset.copy(), method=method)
+    _ = slice_cells(subset, method=method, cache=True)
+    result = slice_cells(subset, method=method, cache=True)
+    assert SLICE_TOPOLOGY_CACHE.cache_info().hits == 1
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result.faces, expected.faces)
+    assert_array_equal(result["data"], expected["data"])
+    assert result[GV_CELL_IDS].max() < subset.n_cells
+
+
+def test_isolated(grid):
+    """Test mutating a sliced mesh does not corrupt the cached topology."""
+    mesh = Transform.from_1d(*grid)
+    result = slice_mesh(mesh, method="analytic", cache=True)
+    expected = result.points.copy()
+    result.points[:] = 0
+    result = slice_mesh(mesh, method="analytic", cache=True)
+    assert SLICE_TOPOLOGY_CACHE.cache_info().hits == 1
+    assert_array_equal(result.points, expected)
+
+
+@pytest.mark.parametrize("kwargs", [{"rtol": 1e-3}, {"atol": 1e-3}, {"method": "vtk"}])
+def test_miss(grid, kwargs):
+    """Test sliced topology is not reused for different slice options."""
+    mesh = Transform.from_1d(*grid)
+    _ = slice_mesh(mesh, method="analytic", cache=True)
+    _ = slice_mesh(mesh, cache=True, **{"method": "analytic"} | kwargs)
+    info = SLICE_TOPOLOGY_CACHE.cache_info()
+    assert info.hits == 0
+    assert info.currsize == 2
+
+
+def test_miss__geometry(grid):
+    """Test sliced topology is not reused for different geometry."""
+    xs, ys = grid
+    _ = slice_mesh(Transform.from_1d(xs, ys), method="analytic", cache=True)
+    _ = slice_mesh(Transform.from_1d(xs + 1, ys), method="analytic", cache=True)
+    info = SLICE_TOPOLOGY_CACHE.cache_info()
+    assert info.hits == 0
+    assert info.currsize == 2
@@ -0,0 +1,96 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :data:`geovista.core.TEXTURE_COORDS_CACHE`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+
+from geovista.bridge import Transform
+from geovista.core import SLICE_TOPOLOGY_CACHE, TEXTURE_COORDS_CACHE, add_texture_coords
+
+N_CELLS: int = 36 * 18
+
+
+pytestmark = pytest.mark.parametrize(
+    "_purge",
+    [(TEXTURE_COORDS_CACHE, SLICE_TOPOLOGY_CACHE)],
+    ids=["TEXTURE_COORDS_CACHE-SLICE_TOPOLOGY_CACHE"],
+    indirect=True,
+)
+
+
+def test_default_disabled(grid):
+    """Test texture coordinates are not cached by default."""
+    _ = add_texture_coords(Transform.from_1d(*grid))
+    assert len(TEXTURE_COORDS_CACHE) == 0
+    assert len(SLICE_TOPOLOGY_CACHE) == 0
+
+
+def test_hit(grid):
+    """Test texture coordinates and sliced topology are reused for the same geometry."""
+    data = np.arange(N_CELLS)
+    mesh1 = Transform.from_1d(*grid, data=data, name="data")
+    mesh2 = Transform.from_1d(*grid, data=data[::-1], name="data")
+    result1 = add_texture_coords(mesh1, cache=True)
+    result2 = add_texture_coords(mesh2, cache=True)
+    for cache in (TEXTURE_COORDS_CACHE, SLICE_TOPOLOGY_CACHE):
+        info = cache.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+    assert np.shares_memory(
+        result1.active_texture_coordinates, result2.active_texture_coordinates
+    )
+    assert_array_equal(result1.faces, result2.faces)
+    assert_array_equal(result2["data"], data[::-1][result1["data"]])
+
+
+def test_parity(grid):
+    """Test cached texture coordinates are identical to non-cached coordinates."""
+    mesh = Transform.from_1d(*grid)
+    expected = add_texture_coords(mesh, antimeridian=True)
+    _ = add_texture_coords(mesh, antimeridian=True, cache=True)
+    result = add_texture_coords(mesh, antimeridian=True, cache=True)
+    assert TEXTURE_COORDS_CACHE.cache_info().hits == 1
+    assert_array_equal(result.points, expected.points)
+    assert_array_equal(result.faces, expected.faces)
+    assert_array_equal(
+        result.active_texture_coordinates, expected.active_texture_coordinates
+    )
+
+
+def test_isolated(grid):
+    """Test mutating a textured mesh does not corrupt the cached points."""
+    mesh = Transform.from_1d(*grid)
+    result = add_texture_coords(mesh, cache=True)
+    expected = result.points.copy()
+    result.points[:] = 0
+    result = add_texture_coords(mesh, cache=True)
+    assert TEXTURE_COORDS_CACHE.cache_info().hits == 1
+    assert_array_equal(result.points, expected)
+
+
+@pytest.mark.parametrize("kwargs", [{"meridian": 10}, {"antimeridian": True}])
+def test_miss(grid, kwargs):
+    """Test texture coordinates are not reused for a different meridian."""
+    mesh = Transform.from_1d(*grid)
+    _ = add_texture_coords(mesh, cache=True)
+    _ = add_texture_coords(mesh, cache=True, **kwargs)
+    info = TEXTURE_COORDS_CACHE.cache_info()
+    assert info.hits == 0
+    assert info.currsize == 2
+
+
+def test_miss__geometry(grid):
+    """Test texture coordinates are not reused for different geometry."""
+    xs, ys = grid
+    _ = add_texture_coords(Transform.from_1d(xs, ys), cache=True)
+    _ = add_texture_coords(Transform.from_1d(xs, ys + 1), cache=True)
+    info = TEXTURE_COORDS_CACHE.cache_info()
+    assert info.hits == 0
+    assert info.currsize == 2
@@ -0,0 +1,163 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :func:`geovista.core.combine`."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+import pyvista as pv
+
+from geovista.common import GV_FIELD_MERGE, GV_FIELD_RADIUS
+from geovista.core import MERGE_TOLERANCE, combine
+
+
+@pytest.fixture
+def meshes():
+    """Fixture to provide a triangle mesh and a mixed triangle/quad mesh."""
+    rng = np.random.default_rng()
+    mesh1 = pv.PolyData(rng.random((3, 3)), faces=[3, 0, 1, 2])
+    mesh1["data"] = np.array([1.0])
+    mesh2 = pv.PolyData(rng.random((5, 3)), faces=[3, 0, 1, 2, 4, 1, 2, 3, 4])
+    mesh2["data"] = np.array([2.0, 3.0])
+    return mesh1, mesh2
+
+
+def test_faces(meshes):
+    """Test the face connectivity is offset by the cumulative points count."""
+    result = combine(*meshes)
+    assert result.n_points == 8
+    assert result.n_cells == 3
+    assert_array_equal(result.faces, [3, 0, 1, 2, 3, 3, 4, 5, 4, 4, 5, 6, 7])
+    assert_array_equal(result.points, np.vstack([mesh.points for mesh in meshes]))
+
+
+def test_data(meshes):
+    """Test common cell data is combined."""
+    result = combine(*meshes)
+    assert_array_equal(result["data"], [1, 2, 3])
+
+
+def test_single(meshes):
+    """Test a single mesh is returned unchanged."""
+    assert combine(meshes[0]) is meshes[0]
+
+
+def test_lines(meshes):
+    """Test line meshes are combined with face meshes."""
+    lines = pv.Line(resolution=2)
+    lines["data"] = np.array([4.0])
+    result = combine(meshes[0], lines)
+    assert result.n_points == 6
+    assert result.n_lines == 1
+    assert result.n_faces_strict == 1
+    assert_array_equal(result.lines, [3, 3, 4, 5])
+    # the vtk cell ids order lines before faces
+    assert_array_equal(result["data"], [4, 1])
+
+
+def test_verts():
+    """Test vertex meshes are combined."""
+    rng = np.random.default_rng()
+    cloud1, cloud2 = pv.PolyData(rng.random((2, 3))), pv.PolyData(rng.random((3, 3)))
+    cloud1.point_data["data"] = cloud1.cell_data["data"] = np.arange(2)
+    cloud2.point_data["data"] = cloud2.cell_data["data"] = np.arange(2, 5)
+    result = combine(cloud1, cloud2)
+    assert result.n_verts == 5
+    assert_array_equal(result.verts, [1, 0, 1, 1, 1, 2, 1, 3, 1, 4])
+    assert_array_equal(result.point_data["data"], np.arange(5))
+    assert_array_equal(result.cell_data["data"], np.arange(5))
+
+
+def test_dtype(meshes):
+    """Test common data is combined with a common dtype."""
+    mesh1, mesh2 = meshes
+    mesh1["ids"], mesh2["ids"] = np.array([1], dtype=np.int32), np.array([2.5, 3.5])
+    result = combine(mesh1, mesh2)
+    assert result["ids"].dtype == np.float64
+    assert_array_equal(result["ids"], [1, 2.5, 3.5])
+
+
+def test_strips_fail(meshes):
+    """Test meshes with triangle strips cannot be combined."""
+    strips = pv.PolyData(np.zeros((4, 3)), strips=[4, 0, 1, 2, 3])
+    emsg = "Can only combine meshes with vertices, lines or faces, input mesh #2"
+    with pytest.raises(TypeError, match=emsg):
+        _ = combine(meshes[0], strips)
+
+
+@pytest.fixture
+def tiles():
+    """Fixture to provide two quad meshes sharing a boundary edge."""
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]], dtype=float)
+    tile1 = pv.PolyData(points, faces=[4, 0, 1, 2, 3])
+    tile2 = pv.PolyData(points + np.array([1, 0, 0]), faces=[4, 0, 1, 2, 3])
+    tile1["data"], tile2["data"] = np.arange(4), np.arange(4, 8)
+    return tile1, tile2
+
+
+def test_merge(tiles):
+    """Test coincident boundary points are merged."""
+    result = combine(*tiles, merge=True)
+    assert result.n_points == 6
+    assert_array_equal(result.faces, [4, 0, 1, 2, 3, 4, 1, 4, 5, 2])
+    assert_array_equal(result.points[[1, 2]], tiles[1].points[[0, 3]])
+    # coincident point data from the first mesh is preserved
+    assert_array_equal(result["data"], [0, 1, 2, 3, 5, 6])
+
+
+def test_merge_stats(tiles):
+    """Test the merge statistics are recorded on the combined mesh."""
+    result = combine(*tiles, merge=True)
+    n_points, n_merged, size, seconds = result.field_data[GV_FIELD_MERGE]
+    assert (n_points, n_merged) == (8, 6)
+    assert size == pytest.approx(MERGE_TOLERANCE * np.sqrt(5))
+    assert seconds >= 0
+    assert GV_FIELD_MERGE not in combine(*tiles).field_data
+
+
+def test_merge_tolerance(tiles):
+    """Test points within the hash-grid cell size are merged."""
+    tile1, tile2 = tiles
+    tile2.points += 1e-6
+    assert combine(tile1, tile2, merge=True).n_points == 8
+    assert combine(tile1, tile2, merge=True, tolerance=1e-3).n_points == 6
+
+
+@pytest.mark.parametrize(("cells", "expected"), [(4, 8), (4.5, 6)])
+def test_merge_tolerance__straddle(tiles, cells, expected):
+    """Test the merge tolerance is aligned to the hash-grid cells."""
+    tile1, tile2 = tiles
+    tile2.points[:, 0] -= 1e-3
+    # the shared edge either straddles a hash-grid cell boundary, or not
+    size = 0.9995 / cells
+    tolerance = size / np.linalg.norm([1.999, 1, 0])
+    assert combine(tile1, tile2, merge=True, tolerance=tolerance).n_points == expected
+
+
+def test_merge_tolerance_fail(tiles):
+    """Test a non-positive merge tolerance."""
+    emsg = "Require a positive merge 'tolerance'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = combine(*tiles, merge=True, tolerance=0)
+
+
+def test_radius(meshes):
+    """Test a common mesh radius field is preserved."""
+    mesh1, mesh2 = meshes
+    mesh1.field_data[GV_FIELD_RADIUS] = mesh2.field_data[GV_FIELD_RADIUS] = [2.0]
+    result = combine(mesh1, mesh2)
+    assert_array_equal(result.field_data[GV_FIELD_RADIUS], [2])
+
+
+def test_radius_mismatch(meshes):
+    """Test an inconsistent mesh radius field is discarded."""
+    mesh1, mesh2 = meshes
+    mesh1.field_data[GV_FIELD_RADIUS] = [1.0]
+    mesh2.field_data[GV_FIELD_RADIUS] = [2.0]
+    result = combine(mesh1, mesh2)
+    assert GV_FIELD_RADIUS not in result.field_data
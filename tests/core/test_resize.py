@@ -14,6 +14,7 @@ from numpy.testing import assert_array_equal
 import pytest
 import pyvista as pv
 
+from geovista import core
 from geovista.bridge import Transform
 from geovista.common import (
     GV_FIELD_RADIUS,
@@ -124,3 +125,47 @@ def test_resize_cloud__radius(lam_uk_cloud, radius):
     assert np.isclose(distance(result), radius)
     assert np.isclose(result[GV_FIELD_RADIUS], radius)
     assert np.isclose(result[GV_FIELD_ZSCALE], ZLEVEL_SCALE)
+
+
+@pytest.fixture
+def grid():
+    """Fixture to provide a global quad-mesh."""
+    xs, ys = np.meshgrid(np.linspace(-180, 180, num=37), np.linspace(-90, 90, num=19))
+    return Transform.from_2d(xs, ys, dtype=np.float32)
+
+
+@pytest.mark.parametrize("inplace", [False, True])
+def test_resize__scale(mocker, grid, inplace):
+    """Test resize mesh by uniformly scaling with the stored radius."""
+    spy = mocker.spy(core, "from_cartesian")
+    radius = mocker.spy(core, "distance")
+    expected = grid.points * 2
+    result = resize(grid, radius=2 * RADIUS, inplace=inplace)
+    assert (result is grid) == inplace
+    assert result.points.dtype == np.float32
+    np.testing.assert_allclose(result.points, expected)
+    assert np.isclose(result[GV_FIELD_RADIUS], 2 * RADIUS)
+    spy.assert_not_called()
+    radius.assert_called_once()
+    assert radius.spy_return == RADIUS
+
+
+def test_resize__scale_no_radius(grid):
+    """Test resize mesh with no stored radius."""
+    del grid.field_data[GV_FIELD_RADIUS]
+    result = resize(grid, radius=3)
+    assert np.isclose(distance(result), 3)
+    assert np.isclose(result[GV_FIELD_RADIUS], 3)
+
+
+def test_resize__shared_geometry():
+    """Test resizing a mesh in-place does not resize meshes sharing its geometry."""
+    xs, ys = np.meshgrid(np.linspace(-180, 180, num=9), np.linspace(-90, 90, num=5))
+    factory = Transform(xs, ys)
+    mesh1, mesh2 = factory(np.arange(32.0)), factory(np.arange(32.0))
+    assert np.shares_memory(mesh1.points, mesh2.points)
+    expected = mesh2.points.copy()
+    result = resize(mesh1, radius=2, inplace=True)
+    assert np.isclose(distance(result), 2)
+    assert_array_equal(mesh2.points, expected)
+    assert np.isclose(mesh2[GV_FIELD_RADIUS], RADIUS)
@@ -7,11 +7,21 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 import pyvista as pv
 
-from geovista.common import point_cloud
+from geovista.bridge import Transform
+from geovista.common import (
+    GV_CELL_IDS,
+    GV_REMESH_POINT_IDS,
+    REMESH_SEAM,
+    cell_lon_span,
+    from_cartesian,
+    point_cloud,
+)
 from geovista.core import slice_cells
+from geovista.filters import REMESH_SEAM_EAST
 
 try:
     from pyvista import ImageData
@@ -34,3 +44,106 @@ def test_point_cloud_pass_thru(lam_uk):
     result = slice_cells(cloud)
     assert result is cloud
     assert result == cloud
+
+
+def test_method_fail():
+    """Test trap of invalid slice method."""
+    mesh = Transform.from_1d(np.arange(5), np.arange(4))
+    emsg = "Expected a method of 'analytic' or 'vtk', got 'wibble'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = slice_cells(mesh, method="wibble")
+
+
+@pytest.mark.parametrize("method", ["analytic", "vtk"])
+def test_bisected(method):
+    """Test cells bisected by the antimeridian are split along a seam."""
+    lons = np.linspace(-175, 185, 37)
+    lats = np.linspace(-60, 60, 5)
+    mesh = Transform.from_1d(lons, lats)
+    result = slice_cells(mesh, antimeridian=True, method=method)
+    assert result.n_cells > mesh.n_cells
+    assert np.sum(result[GV_REMESH_POINT_IDS] == REMESH_SEAM) >= lats.size
+    lonlat = from_cartesian(result, closed_interval=True)
+    assert np.all(cell_lon_span(result, lonlat[:, 0]) < 180)
+
+
+def test_bisected__analytic():
+    """Test the analytic slice of bisected cells."""
+    lons = np.linspace(-175, 185, 37)
+    lats = np.linspace(-60, 60, 5)
+    mesh = Transform.from_1d(lons, lats, data=np.arange(36 * 4), name="data")
+    result = slice_cells(mesh, antimeridian=True, method="analytic")
+    n_split = lats.size - 1
+    assert result.n_cells == mesh.n_cells + n_split
+    assert result.n_points == mesh.n_points + 2 * lats.size
+    remesh = result[GV_REMESH_POINT_IDS]
+    assert np.sum(remesh == REMESH_SEAM) == lats.size
+    assert np.sum(remesh == REMESH_SEAM_EAST) == lats.size
+    lonlat = from_cartesian(result, closed_interval=True)
+    np.testing.assert_allclose(lonlat[remesh == REMESH_SEAM, 0], 180)
+    np.testing.assert_allclose(lonlat[remesh == REMESH_SEAM_EAST, 0], -180)
+    # the seam points lie along the great-circle cell edges
+    np.testing.assert_allclose(lonlat[remesh < 0, 1], np.tile(lats, 2), atol=0.1)
+    # the split cells inherit the data of their parent cell
+    cids = result[GV_CELL_IDS]
+    np.testing.assert_array_equal(result.cell_data["data"], cids)
+    split = np.flatnonzero(np.bincount(cids) == 2)
+    assert split.size == n_split
+    assert np.isclose(result.area, mesh.area, rtol=1e-3)
+
+
+def test_touch__analytic():
+    """Test the analytic slice of cells touching the antimeridian."""
+    lons = np.linspace(-180, 180, 37)
+    lats = np.linspace(-60, 60, 5)
+    mesh = Transform.from_1d(lons, lats)
+    result = slice_cells(mesh, antimeridian=True, method="analytic")
+    assert result.n_cells == mesh.n_cells
+    remesh = result[GV_REMESH_POINT_IDS]
+    assert np.sum(remesh == REMESH_SEAM) == lats.size
+    assert np.sum(remesh == REMESH_SEAM_EAST) == 0
+    lonlat = from_cartesian(result, closed_interval=True)
+    assert np.all(cell_lon_span(result, lonlat[:, 0]) < 180)
+
+
+def test_no_intersection__analytic():
+    """Test the analytic slice of a mesh not intersecting the antimeridian."""
+    mesh = Transform.from_1d(np.linspace(-90, 90, 10), np.linspace(-60, 60, 5))
+    result = slice_cells(mesh, antimeridian=True, method="analytic")
+    assert result is not mesh
+    assert result.n_cells == mesh.n_cells
+    assert result.n_points == mesh.n_points
+    assert GV_REMESH_POINT_IDS not in result.point_data
+    np.testing.assert_array_equal(result.points, mesh.points)
+
+
+@pytest.mark.parametrize("n_lons", [10, 37, 90])
+def test_global__analytic(n_lons):
+    """Test the analytic slice of a global mesh with polar cells."""
+    lons = np.linspace(-180, 180, n_lons) + 5
+    lats = np.linspace(-90, 90, 19)
+    mesh = Transform.from_1d(lons, lats)
+    result = slice_cells(mesh, antimeridian=True, method="analytic")
+    lonlat = from_cartesian(result, closed_interval=True)
+    assert np.all(cell_lon_span(result, lonlat[:, 0]) < 180)
+
+
+@pytest.mark.parametrize("lons", [np.linspace(-180, 180, 37), np.linspace(-90, 90, 10)])
+@pytest.mark.parametrize("association", ["cell", "point"])
+def test_active_scalars__analytic(lons, association):
+    """Test the analytic slice preserves the active scalars of the mesh."""
+    lats = np.linspace(-60, 60, 5)
+    mesh = Transform.from_1d(lons + 5, lats)
+    size = mesh.n_cells if association == "cell" else mesh.n_points
+    mesh[GV_CELL_IDS] = np.zeros(mesh.n_cells)
+    mesh.set_active_scalars(name=None)
+    getattr(mesh, f"{association}_data")["data"] = np.arange(size)
+    mesh.set_active_scalars("data", preference=association)
+    result = slice_cells(mesh, antimeridian=True, method="analytic")
+    assert result.active_scalars_name == mesh.active_scalars_name
+    assert (
+        result.active_scalars_info.association == mesh.active_scalars_info.association
+    )
+    np.testing.assert_array_equal(
+        np.unique(result[GV_CELL_IDS]), np.arange(mesh.n_cells)
+    )
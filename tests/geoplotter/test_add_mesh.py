@@ -7,8 +7,10 @@
 
 from __future__ import annotations
 
+from numpy.testing import assert_array_equal
 import pytest
 
+from geovista.bridge import TOPOLOGY_CACHE, Transform
 from geovista.geoplotter import OPACITY_BLACKLIST, GeoPlotter
 
 
@@ -62,3 +64,17 @@ def test_gpu_opacity_unavailable(lfric, mocker, key, value):
         }
         spy.assert_called_once_with(*args, **kwargs)
         assert p._missing_opacity is True
+
+
+@pytest.mark.parametrize(
+    "_purge", [(TOPOLOGY_CACHE,)], ids=["TOPOLOGY_CACHE"], indirect=True
+)
+def test_cached_topology(grid):
+    """Test plotting a mesh does not corrupt the cached bridge topology."""
+    mesh = Transform.from_1d(*grid, cache=True)
+    expected = mesh.points.copy()
+    p = GeoPlotter(crs="+proj=eqc +lon_0=90")
+    p.add_mesh(mesh)
+    result = Transform.from_1d(*grid, cache=True)
+    assert TOPOLOGY_CACHE.cache_info().hits == 1
+    assert_array_equal(result.points, expected)
@@ -7,7 +7,15 @@
 
 from __future__ import annotations
 
-from geovista.search import find_cell_neighbours
+import numpy as np
+import pytest
+
+from geovista.bridge import Transform
+from geovista.search import (
+    NeighbourPreference,
+    find_cell_neighbours,
+    point_cell_adjacency,
+)
 
 
 def test(lam_uk, neighbours):
@@ -15,3 +23,52 @@ def test(lam_uk, neighbours):
     cids = find_cell_neighbours(lam_uk, neighbours.cid)
     assert cids == neighbours.expected
     assert neighbours.cid not in cids
+
+
+@pytest.fixture
+def grid():
+    """Fixture to provide a (3, 4) quad-mesh."""
+    return Transform.from_1d(np.arange(5), np.arange(4))
+
+
+@pytest.mark.parametrize(
+    ("preference", "cid", "expected"),
+    [
+        ("vertex", 0, [1, 4, 5]),
+        ("vertex", 5, [0, 1, 2, 4, 6, 8, 9, 10]),
+        ("vertex", [0, 1], [2, 4, 5, 6]),
+        ("edge", 0, [1, 4]),
+        ("edge", 5, [1, 4, 6, 9]),
+        ("edge", [0, 1], [2, 4, 5]),
+        (NeighbourPreference.EDGE, 11, [7, 10]),
+    ],
+)
+def test_preference(grid, preference, cid, expected):
+    """Test the vertex and edge neighbourhood of cells within a quad-mesh."""
+    assert find_cell_neighbours(grid, cid, preference=preference) == expected
+
+
+def test_preference_fail(grid):
+    """Test trap of invalid neighbourhood preference."""
+    emsg = "Expected a preference of 'edge' or 'vertex', got 'face'"
+    with pytest.raises(ValueError, match=emsg):
+        _ = find_cell_neighbours(grid, 0, preference="face")
+
+
+def test_adjacency(grid):
+    """Test the point-to-cell adjacency index."""
+    indptr, indices = point_cell_adjacency(grid)
+    assert indptr.shape == (grid.n_points + 1,)
+    # the central points of the quad-mesh are shared by four cells
+    assert sorted(indices[indptr[6] : indptr[7]]) == [0, 1, 4, 5]
+    # the corner points of the quad-mesh belong to one cell
+    assert indices[indptr[0] : indptr[1]].tolist() == [0]
+
+
+def test_adjacency_cached(grid):
+    """Test the point-to-cell adjacency index is cached and invalidated."""
+    adjacency = point_cell_adjacency(grid)
+    grid.cell_data["cids"] = np.arange(grid.n_cells)
+    assert point_cell_adjacency(grid) is adjacency
+    grid.faces = np.array([4, 0, 1, 6, 5])
+    assert point_cell_adjacency(grid) is not adjacency
@@ -0,0 +1,96 @@
+# Copyright (c) 2021, GeoVista Contributors.
+#
+# This file is part of GeoVista and is distributed under the 3-Clause BSD license.
+# See the LICENSE file in the package root directory for licensing details.
+
+"""Unit-tests for :data:`geovista.transform.TRANSFORMER_CACHE`."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pyproj import CRS, Transformer
+import pytest
+
+from geovista.crs import WGS84
+from geovista.transform import (
+    CRS_CACHE,
+    TRANSFORMER_CACHE,
+    transform_point,
+    transform_points,
+)
+
+pytestmark = pytest.mark.parametrize(
+    "_purge",
+    [(CRS_CACHE, TRANSFORMER_CACHE)],
+    ids=["CRS_CACHE-TRANSFORMER_CACHE"],
+    indirect=True,
+)
+
+
+def test_hit(mocker):
+    """Test the transformer is reused for the same source and target CRSs."""
+    spy = mocker.spy(Transformer, "from_crs")
+    data = np.arange(10, dtype=float)
+    expected = transform_points(WGS84, "+proj=eqc", xs=data, ys=data)
+    result = transform_points(WGS84, "+proj=eqc", xs=data, ys=data)
+    np.testing.assert_array_equal(result, expected)
+    assert spy.call_count == 1
+    info = TRANSFORMER_CACHE.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+    info = CRS_CACHE.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_hit__equivalent_crs(mocker):
+    """Test the transformer is reused for equivalent CRS instances."""
+    spy = mocker.spy(Transformer, "from_crs")
+    _ = transform_point(WGS84, CRS.from_user_input("+proj=eqc"), x=1, y=2)
+    _ = transform_point(WGS84, CRS.from_user_input("+proj=eqc"), x=1, y=2)
+    assert spy.call_count == 1
+    assert TRANSFORMER_CACHE.cache_info().hits == 1
+
+
+def test_hit__same_crs(mocker):
+    """Test no transformer is created for the same source and target CRSs."""
+    spy = mocker.spy(Transformer, "from_crs")
+    _ = transform_point(WGS84, WGS84, x=1, y=2)
+    _ = transform_point(WGS84, "epsg:4326", x=1, y=2)
+    assert spy.call_count == 0
+    info = TRANSFORMER_CACHE.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_miss():
+    """Test different transformers are cached for different target CRSs."""
+    _ = transform_point(WGS84, "+proj=eqc", x=1, y=2)
+    _ = transform_point(WGS84, "+proj=moll", x=1, y=2)
+    _ = transform_point("+proj=moll", WGS84, x=1, y=2)
+    info = TRANSFORMER_CACHE.cache_info()
+    assert info.hits == 0
+    assert info.misses == 3
+    assert info.currsize == 3
+
+
+def test_threads(mocker):
+    """Test the transformer cache is thread-safe."""
+    xs = np.linspace(-180, 180, num=100)
+    ys = np.linspace(-90, 90, num=100)
+    expected = transform_points(WGS84, "+proj=eqc", xs=xs, ys=ys)
+    spy = mocker.spy(Transformer, "from_crs")
+
+    def worker(_: int) -> np.ndarray:
+        return transform_points(WGS84, "+proj=eqc", xs=xs, ys=ys)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(worker, range(32)))
+
+    for result in results:
+        np.testing.assert_array_equal(result, expected)
+    assert spy.call_count == 0
+    assert TRANSFORMER_CACHE.cache_info().hits == 32
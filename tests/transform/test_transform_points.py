@@ -9,11 +9,18 @@ from __future__ import annotations
 
 import numpy as np
 from pyproj import Transformer
-from pyproj.exceptions import CRSError
+from pyproj.exceptions import CRSError, ProjError
 import pytest
 
 from geovista.crs import WGS84
-from geovista.transform import transform_points
+from geovista.transform import CRS_CACHE, TRANSFORMER_CACHE, transform_points
+
+pytestmark = pytest.mark.parametrize(
+    "_purge",
+    [(CRS_CACHE, TRANSFORMER_CACHE)],
+    ids=["CRS_CACHE-TRANSFORMER_CACHE"],
+    indirect=True,
+)
 
 
 @pytest.mark.parametrize(
@@ -120,3 +127,49 @@ def test_transform(mocker, zoffset, reshape, roundtrip):
     assert spy_from_crs.call_count == call_count
     assert spy_transform.call_count == call_count
     assert result.shape == shape
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize("chunk_size", [1, 7, 10, 100])
+@pytest.mark.parametrize("zoffset", [None, 100])
+@pytest.mark.parametrize("reshape", [False, True])
+def test_transform__chunked(workers, chunk_size, zoffset, reshape):
+    """Test chunked transformation is equivalent to non-chunked transformation."""
+    xs = np.linspace(-180, 180, num=(size := 10))
+    ys = np.linspace(-90, 90, num=size)
+    zs = np.arange(size, dtype=float) + zoffset if zoffset is not None else zoffset
+    if reshape:
+        xs, ys = xs.reshape(2, 5), ys.reshape(2, 5)
+        if zs is not None:
+            zs = zs.reshape(2, 5)
+    kwargs = {"src_crs": WGS84, "tgt_crs": "+proj=eqc", "xs": xs, "ys": ys, "zs": zs}
+    expected = transform_points(**kwargs)
+    result = transform_points(**kwargs, chunk_size=chunk_size, workers=workers)
+    np.testing.assert_array_equal(result, expected)
+    assert result.flags.c_contiguous
+
+
+def test_transform__chunked_trap():
+    """Test trap of erroneous points during chunked transformation."""
+    xs = np.zeros(10)
+    ys = np.zeros(10)
+    ys[-1] = 100
+    emsg = "Invalid coordinate"
+    with pytest.raises(ProjError, match=emsg):
+        _ = transform_points(
+            src_crs=WGS84, tgt_crs="+proj=eqc", xs=xs, ys=ys, chunk_size=3, workers=2
+        )
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "emsg"),
+    [
+        ({"chunk_size": 0}, "'chunk_size' must be positive"),
+        ({"workers": 0}, "'workers' must be positive"),
+    ],
+)
+def test_transform__chunked_fail(kwargs, emsg):
+    """Test trap of invalid chunk size and number of workers."""
+    data = np.empty(1)
+    with pytest.raises(ValueError, match=emsg):
+        _ = transform_points(src_crs=WGS84, tgt_crs=WGS84, xs=data, ys=data, **kwargs)